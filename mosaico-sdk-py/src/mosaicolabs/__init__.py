@@ -13,88 +13,148 @@ Example:
     ...     handler = client.sequence_handler("my_sequence")
 """
 
-# --- Client ---
-from .comm import MosaicoClient as MosaicoClient
-
-# --- Handlers ---
-from .handlers import (
-    SequenceHandler as SequenceHandler,
-    SequenceWriter as SequenceWriter,
-    SequenceDataStreamer as SequenceDataStreamer,
-    TopicHandler as TopicHandler,
-    TopicWriter as TopicWriter,
-    TopicDataStreamer as TopicDataStreamer,
-)
-
-# --- Core Models ---
-from .models import (
-    Serializable as Serializable,
-    Header as Header,
-    Time as Time,
-    Message as Message,
-)
-
-# --- Sensors ---
-from .models.sensors import (
-    CameraInfo as CameraInfo,
-    GPS as GPS,
-    GPSStatus as GPSStatus,
-    NMEASentence as NMEASentence,
-    Image as Image,
-    ImageFormat as ImageFormat,
-    CompressedImage as CompressedImage,
-    IMU as IMU,
-    Magnetometer as Magnetometer,
-    RobotJoint as RobotJoint,
-)
-
-# --- Base Types ---
-from .models.data import (
-    Boolean as Boolean,
-    Integer8 as Integer8,
-    Integer16 as Integer16,
-    Integer32 as Integer32,
-    Integer64 as Integer64,
-    Unsigned8 as Unsigned8,
-    Unsigned16 as Unsigned16,
-    Unsigned32 as Unsigned32,
-    Unsigned64 as Unsigned64,
-    Floating16 as Floating16,
-    Floating32 as Floating32,
-    Floating64 as Floating64,
-    String as String,
-    LargeString as LargeString,
-)
-
-# --- Geometry ---
-from .models.data import (
-    Point2d as Point2d,
-    Point3d as Point3d,
-    Vector2d as Vector2d,
-    Vector3d as Vector3d,
-    Vector4d as Vector4d,
-    Quaternion as Quaternion,
-    Pose as Pose,
-    Transform as Transform,
-)
-
-# --- Dynamics & Kinematics ---
-from .models.data import (
-    ForceTorque as ForceTorque,
-    Acceleration as Acceleration,
-    Velocity as Velocity,
-    MotionState as MotionState,
-)
-
-# --- Other Data Types ---
-from .models.data import ROI as ROI
-
-# --- Enums ---
-from .enum import (
-    SerializationFormat as SerializationFormat,
-    SequenceStatus as SequenceStatus,
-    OnErrorPolicy as OnErrorPolicy,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    # --- Client ---
+    from .comm import MosaicoClient as MosaicoClient
+
+    # --- Handlers ---
+    from .handlers import (
+        SequenceHandler as SequenceHandler,
+        SequenceWriter as SequenceWriter,
+        SequenceDataStreamer as SequenceDataStreamer,
+        TopicHandler as TopicHandler,
+        TopicWriter as TopicWriter,
+        TopicDataStreamer as TopicDataStreamer,
+    )
+
+    # --- Core Models ---
+    from .models import (
+        Serializable as Serializable,
+        Header as Header,
+        Time as Time,
+        Message as Message,
+    )
+
+    # --- Sensors ---
+    from .models.sensors import (
+        CameraInfo as CameraInfo,
+        GPS as GPS,
+        GPSStatus as GPSStatus,
+        NMEASentence as NMEASentence,
+        Image as Image,
+        ImageFormat as ImageFormat,
+        CompressedImage as CompressedImage,
+        IMU as IMU,
+        Magnetometer as Magnetometer,
+        RobotJoint as RobotJoint,
+    )
+
+    # --- Base Types ---
+    from .models.data import (
+        Boolean as Boolean,
+        Integer8 as Integer8,
+        Integer16 as Integer16,
+        Integer32 as Integer32,
+        Integer64 as Integer64,
+        Unsigned8 as Unsigned8,
+        Unsigned16 as Unsigned16,
+        Unsigned32 as Unsigned32,
+        Unsigned64 as Unsigned64,
+        Floating16 as Floating16,
+        Floating32 as Floating32,
+        Floating64 as Floating64,
+        String as String,
+        LargeString as LargeString,
+    )
+
+    # --- Geometry ---
+    from .models.data import (
+        Point2d as Point2d,
+        Point3d as Point3d,
+        Vector2d as Vector2d,
+        Vector3d as Vector3d,
+        Vector4d as Vector4d,
+        Quaternion as Quaternion,
+        Pose as Pose,
+        Transform as Transform,
+    )
+
+    # --- Dynamics & Kinematics ---
+    from .models.data import (
+        ForceTorque as ForceTorque,
+        Acceleration as Acceleration,
+        Velocity as Velocity,
+        MotionState as MotionState,
+    )
+
+    # --- Other Data Types ---
+    from .models.data import ROI as ROI
+
+    # --- Enums ---
+    from .enum import (
+        SerializationFormat as SerializationFormat,
+        SequenceStatus as SequenceStatus,
+        OnErrorPolicy as OnErrorPolicy,
+    )
+
+# Public name -> (submodule, attribute): resolved on first access (PEP 562),
+# so that `import mosaicolabs` does not pull in the client, handlers and models
+_LAZY_ATTRS = {
+    "MosaicoClient": (".comm", "MosaicoClient"),
+    "SequenceHandler": (".handlers", "SequenceHandler"),
+    "SequenceWriter": (".handlers", "SequenceWriter"),
+    "SequenceDataStreamer": (".handlers", "SequenceDataStreamer"),
+    "TopicHandler": (".handlers", "TopicHandler"),
+    "TopicWriter": (".handlers", "TopicWriter"),
+    "TopicDataStreamer": (".handlers", "TopicDataStreamer"),
+    "Serializable": (".models", "Serializable"),
+    "Header": (".models", "Header"),
+    "Time": (".models", "Time"),
+    "Message": (".models", "Message"),
+    "CameraInfo": (".models.sensors", "CameraInfo"),
+    "GPS": (".models.sensors", "GPS"),
+    "GPSStatus": (".models.sensors", "GPSStatus"),
+    "NMEASentence": (".models.sensors", "NMEASentence"),
+    "Image": (".models.sensors", "Image"),
+    "ImageFormat": (".models.sensors", "ImageFormat"),
+    "CompressedImage": (".models.sensors", "CompressedImage"),
+    "IMU": (".models.sensors", "IMU"),
+    "Magnetometer": (".models.sensors", "Magnetometer"),
+    "RobotJoint": (".models.sensors", "RobotJoint"),
+    "Boolean": (".models.data", "Boolean"),
+    "Integer8": (".models.data", "Integer8"),
+    "Integer16": (".models.data", "Integer16"),
+    "Integer32": (".models.data", "Integer32"),
+    "Integer64": (".models.data", "Integer64"),
+    "Unsigned8": (".models.data", "Unsigned8"),
+    "Unsigned16": (".models.data", "Unsigned16"),
+    "Unsigned32": (".models.data", "Unsigned32"),
+    "Unsigned64": (".models.data", "Unsigned64"),
+    "Floating16": (".models.data", "Floating16"),
+    "Floating32": (".models.data", "Floating32"),
+    "Floating64": (".models.data", "Floating64"),
+    "String": (".models.data", "String"),
+    "LargeString": (".models.data", "LargeString"),
+    "Point2d": (".models.data", "Point2d"),
+    "Point3d": (".models.data", "Point3d"),
+    "Vector2d": (".models.data", "Vector2d"),
+    "Vector3d": (".models.data", "Vector3d"),
+    "Vector4d": (".models.data", "Vector4d"),
+    "Quaternion": (".models.data", "Quaternion"),
+    "Pose": (".models.data", "Pose"),
+    "Transform": (".models.data", "Transform"),
+    "ForceTorque": (".models.data", "ForceTorque"),
+    "Acceleration": (".models.data", "Acceleration"),
+    "Velocity": (".models.data", "Velocity"),
+    "MotionState": (".models.data", "MotionState"),
+    "ROI": (".models.data", "ROI"),
+    "SerializationFormat": (".enum", "SerializationFormat"),
+    "SequenceStatus": (".enum", "SequenceStatus"),
+    "OnErrorPolicy": (".enum", "OnErrorPolicy"),
+}
 
 __all__ = [
     # Client
@@ -158,3 +218,19 @@ __all__ = [
     "SequenceStatus",
     "OnErrorPolicy",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Imports the public symbol `name` on first access (PEP 562)."""
+    try:
+        module_name, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), attr)
+    # Cache in the module namespace: next lookups skip `__getattr__`
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,5 +1,25 @@
-from .mosaico_client import MosaicoClient as MosaicoClient
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .metadata import (
     SequenceMetadata as SequenceMetadata,
     TopicMetadata as TopicMetadata,
 )
+
+if TYPE_CHECKING:
+    from .mosaico_client import MosaicoClient as MosaicoClient
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Imports `MosaicoClient` on first access (PEP 562).
+
+    `mosaico_client` depends on the `handlers` package, which in turn imports
+    the `comm` submodules: resolving it lazily lets either package be imported
+    first, now that the top-level package does not import `comm` eagerly.
+    """
+    if name != "MosaicoClient":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = import_module(".mosaico_client", __name__).MosaicoClient
+    globals()[name] = value
+    return value
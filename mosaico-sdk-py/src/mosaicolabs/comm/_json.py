@@ -0,0 +1,85 @@
+"""
+JSON Codec Shim.
+
+This module exposes a minimal `dumps`/`loads` pair used on the Flight critical
+path (action payloads and metadata decoding). It prefers `orjson` when it is
+installed (the `orjson` extra of the package), and falls back to the standard
+library `json` module otherwise.
+
+Both implementations share the same contract:
+- `dumps(obj)` returns UTF-8 encoded `bytes` (no `.encode()` step needed).
+  Objects orjson rejects are encoded by the standard library.
+- `loads(buf)` accepts `bytes`, `str` or any bytes-like buffer (e.g. a
+  `memoryview` over a `pyarrow.Buffer`) and raises a `ValueError` subclass
+  on malformed input.
+"""
+
+from typing import Any, Union
+
+JsonInput = Union[bytes, bytearray, memoryview, str]
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    _orjson = None
+
+import json as _stdjson
+
+# C-accelerated JSON string literal encoder of the stdlib (no ASCII escaping,
+# like orjson)
+_encode_str = _stdjson.encoder.encode_basestring
+
+
+if _orjson is not None:
+    # Accept the non-`str` keys the stdlib encodes too. Numpy scalars are also
+    # encoded, but only by this backend: the stdlib fallback rejects them
+    _ORJSON_OPTIONS = _orjson.OPT_NON_STR_KEYS | _orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(obj: Any) -> bytes:
+        """Serializes `obj` to UTF-8 JSON bytes (orjson backend)."""
+        try:
+            return _orjson.dumps(obj, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # e.g. subclasses of builtins: same result as with no orjson
+            return dumps_stdlib(obj)
+
+    def loads(buf: JsonInput) -> Any:
+        """Deserializes JSON from a buffer or `str`, in place (orjson backend)."""
+        return _orjson.loads(buf)
+
+else:
+
+    def dumps(obj: Any) -> bytes:
+        """Serializes `obj` to UTF-8 JSON bytes (stdlib backend)."""
+        return dumps_stdlib(obj)
+
+    def loads(buf: JsonInput) -> Any:
+        """Deserializes JSON from a buffer or `str` (stdlib backend)."""
+        # `json.loads` does not accept generic buffers
+        if isinstance(buf, memoryview):
+            buf = buf.tobytes()
+        return _stdjson.loads(buf)
+
+
+def dumps_stdlib(obj: Any) -> bytes:
+    """
+    Serializes `obj` to UTF-8 JSON bytes with the standard library, whatever the
+    backend.
+
+    Used for the user-supplied structures (e.g. metadata dictionaries), whose
+    encoding must not depend on the installed packages: orjson writes NaN and
+    infinities as `null`, for instance, and rejects some values the standard
+    library encodes.
+    """
+    return _stdjson.dumps(obj).encode("utf-8")
+
+
+def dumps_str_item(key: str, value: str) -> bytes:
+    """
+    Serializes the single-item object `{key: value}` to UTF-8 JSON bytes.
+
+    Equivalent to `dumps({key: value})` for string keys and values, but skips
+    the serializer dispatch: the two string literals are encoded by the stdlib
+    C encoder and joined with a template.
+    """
+    return f"{{{_encode_str(key)}:{_encode_str(value)}}}".encode("utf-8")
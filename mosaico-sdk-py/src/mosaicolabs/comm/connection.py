@@ -6,28 +6,80 @@ It implements a pooling mechanism (`_ConnectionPool`) to allow parallel data wri
 preventing bottlenecking on a single TCP/gRPC socket during high-throughput operations.
 """
 
+import pyarrow as pa
 import pyarrow.flight as fl
-from enum import Enum
+import pyarrow.ipc as pa_ipc
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from enum import IntEnum
 import logging as log
-from typing import List, Optional
-from itertools import cycle
+import math
+import os
+import time
+from threading import Lock
+from typing import List, Optional, Sequence, Tuple, Union
+from itertools import count
 
 # Constants defining batch size limits for Flight transmission
-PYARROW_OUT_OF_RANGE_BYTES = 16 * 1024 * 1024  # 4 MB
-DEFAULT_MAX_BATCH_BYTES = 10 * 1024 * 1024  # 3 MB
-DEFAULT_MAX_BATCH_SIZE_RECORDS = 5_000
+PYARROW_OUT_OF_RANGE_BYTES = 16 * 1024 * 1024  # 16 MiB
+# Flight throughput degrades with very large batches: 4 MiB matches the default
+# gRPC max message size, so that a batch travels as a single message.
+DEFAULT_MAX_BATCH_BYTES = 4 * 1024 * 1024  # 4 MiB
+# 8192 rows keep fixed-width (telemetry) batches around the L2 cache size,
+# while amortizing the per-batch overhead.
+DEFAULT_MAX_BATCH_SIZE_RECORDS = 8_192
+# Batches a sequence writer may have queued or in flight, across all its topics:
+# bounds the memory held by the write pipeline (up to 64 MiB of 4 MiB batches)
+DEFAULT_MAX_PENDING_BATCHES = 16
 
-_DEFAULT_CONNECTION_POOL_SIZE = 2
+# Upper bound of the IPC stream framing not accounted for by
+# `pa.ipc.get_record_batch_size` (schema message, markers, end-of-stream)
+_IPC_STREAM_OVERHEAD_BYTES = 4 * 1024
 
+# Upper bound for the auto-sized pools, to avoid server-side connection storms
+_MAX_DEFAULT_POOL_SIZE = 16
 
-class _ConnectionStatus(Enum):
+# cgroup files holding the CPU quota of the process (v2, then v1 fallback)
+_CGROUP_V2_CPU_MAX = "/sys/fs/cgroup/cpu.max"
+_CGROUP_V1_CPU_QUOTA = "/sys/fs/cgroup/cpu/cpu.cfs_quota_us"
+_CGROUP_V1_CPU_PERIOD = "/sys/fs/cgroup/cpu/cpu.cfs_period_us"
+
+# Seconds to wait after a transport failure before re-opening a pooled connection
+_UNHEALTHY_CONNECTION_BACKOFF_S = 1.0
+
+# Flight errors signaling a broken channel (as opposed to application-level errors)
+_TRANSPORT_ERRORS = (fl.FlightUnavailableError, fl.FlightTimedOutError)
+
+
+class _ConnectionStatus(IntEnum):
     """Enumeration representing the lifecycle state of a connection object."""
 
-    Open = "open"
-    Closed = "closed"
+    # Integer members: status checks are plain int comparisons
+    Open = 1
+    Closed = 0
+
+
+# gRPC channel arguments applied to every Flight client
+_DEFAULT_GRPC_OPTIONS: Tuple[Tuple[str, Union[int, str]], ...] = (
+    # Let gRPC estimate the bandwidth-delay product and grow the HTTP/2
+    # flow-control windows accordingly (instead of the 64 KiB default)
+    ("grpc.http2.bdp_probe", 1),
+    # Largest HTTP/2 frame allowed by the spec: fewer frames per Arrow batch
+    ("grpc.http2.max_frame_size", 16_777_215),
+    # Do not cap the size of the received messages (e.g. large query results)
+    ("grpc.max_receive_message_length", -1),
+    # Give each client its own subchannel (TCP connection), instead of sharing
+    # the process-global one: the pooled clients are then really independent
+    ("grpc.use_local_subchannel_pool", 1),
+)
 
 
-def _get_connection(host: str, port: int, timeout: int) -> fl.FlightClient:
+def _get_connection(
+    host: str,
+    port: int,
+    timeout: int,
+    options: Optional[Sequence[Tuple[str, Union[int, str]]]] = None,
+) -> fl.FlightClient:
     """
     Factory function to establish a single PyArrow Flight client connection.
 
@@ -35,15 +87,168 @@ def _get_connection(host: str, port: int, timeout: int) -> fl.FlightClient:
         host (str): The hostname or IP address of the server.
         port (int): The port number to connect to.
         timeout (int): The waiting-for-connection timeout in seconds (default = 2s)
+        options (Optional[Sequence[Tuple[str, Union[int, str]]]]): The gRPC channel
+            arguments of the client. If None, `_DEFAULT_GRPC_OPTIONS` is used.
 
     Returns:
         fl.FlightClient: An active Flight client instance connected to the specified address.
     """
-    client = fl.FlightClient(f"grpc://{host}:{port}")
+    if options is None:
+        options = _DEFAULT_GRPC_OPTIONS
+    client = fl.FlightClient(f"grpc://{host}:{port}", generic_options=list(options))
     client.wait_for_available(timeout=timeout)
     return client
 
 
+def _estimated_ipc_size(
+    batch: pa.RecordBatch, include_stream_overhead: bool = False
+) -> int:
+    """
+    Computes the Arrow IPC size of a RecordBatch, without serializing it.
+
+    This is the reference size used to decide the chunking boundaries of the
+    Flight transmission (see `DEFAULT_MAX_BATCH_BYTES`).
+
+    Args:
+        batch (pa.RecordBatch): The batch to measure.
+        include_stream_overhead (bool): If True, adds a safety margin for the
+            stream framing (schema message, end-of-stream), to upper-bound
+            the size of a whole single-batch stream (default = False).
+
+    Returns:
+        int: The size in bytes of the batch IPC message.
+    """
+    try:
+        size = pa_ipc.get_record_batch_size(batch)
+    except pa.ArrowException:
+        # Not computable from the buffers (e.g. unsupported type): measure it
+        return _serialized_ipc_size(batch)
+    if include_stream_overhead:
+        size += _IPC_STREAM_OVERHEAD_BYTES
+    return size
+
+
+def _serialized_ipc_size(batch: pa.RecordBatch) -> int:
+    """
+    Measures the Arrow IPC stream of a RecordBatch by actually serializing it.
+
+    The stream is written to a `pa.MockOutputStream`, which only counts the
+    bytes: nothing is allocated or copied for the output.
+
+    Args:
+        batch (pa.RecordBatch): The batch to measure.
+
+    Returns:
+        int: The size in bytes of the whole single-batch stream (schema message,
+             batch message and end-of-stream marker).
+    """
+    sink = pa.MockOutputStream()
+    with pa_ipc.new_stream(sink, batch.schema) as writer:
+        writer.write_batch(batch)
+    return sink.size()
+
+
+def _cgroup_cpu_limit() -> Optional[int]:
+    """
+    Reads the CPU quota enforced on this process by its cgroup (e.g. the
+    `--cpus` of a container, or the CPU limit of a Kubernetes pod).
+
+    Both the cgroup v2 (`cpu.max`) and v1 (`cpu.cfs_quota_us`) interfaces are
+    supported.
+
+    Returns:
+        Optional[int]: The number of CPUs granted by the quota (rounded up),
+                       or None if there is no quota or it cannot be read.
+    """
+    try:
+        with open(_CGROUP_V2_CPU_MAX) as f:
+            quota, period = f.read().split()[:2]
+        if quota == "max":
+            return None
+        return max(1, math.ceil(int(quota) / int(period)))
+    except (OSError, ValueError):
+        pass
+    try:
+        with open(_CGROUP_V1_CPU_QUOTA) as f:
+            quota_us = int(f.read())
+        with open(_CGROUP_V1_CPU_PERIOD) as f:
+            period_us = int(f.read())
+        if quota_us <= 0 or period_us <= 0:  # -1: no quota
+            return None
+        return max(1, math.ceil(quota_us / period_us))
+    except (OSError, ValueError):
+        return None
+
+
+def _usable_cpus() -> int:
+    """
+    Computes the number of CPUs this process is entitled to, i.e. the CPUs it
+    can be scheduled on (`os.sched_getaffinity`, where available, else
+    `os.cpu_count()`), further bound by the cgroup CPU quota, if any.
+
+    Returns:
+        int: The number of usable CPUs (at least 1).
+    """
+    try:
+        ncpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on this platform (e.g. macOS, Windows)
+        ncpus = os.cpu_count() or 1
+    quota = _cgroup_cpu_limit()
+    if quota is not None:
+        ncpus = min(ncpus, quota)
+    return max(1, ncpus)
+
+
+def _default_pool_size() -> int:
+    """
+    Computes the default size of the executor pool.
+
+    The size follows the CPUs the process is entitled to (see `_usable_cpus`),
+    capped to `_MAX_DEFAULT_POOL_SIZE`. Pass an explicit `pool_size` to the
+    pools to override it.
+
+    Returns:
+        int: The default pool size (at least 1).
+    """
+    return min(_usable_cpus(), _MAX_DEFAULT_POOL_SIZE)
+
+
+def _default_connection_pool_size() -> int:
+    """
+    Computes the default size of the connection pool.
+
+    Connections mostly wait on the network, so (following the usual
+    `cores * (1 + wait / compute)` sizing) two connections per usable CPU are
+    opened, capped to `_MAX_DEFAULT_POOL_SIZE`.
+
+    Returns:
+        int: The default pool size (at least 1).
+    """
+    return min(2 * _usable_cpus(), _MAX_DEFAULT_POOL_SIZE)
+
+
+def _is_transport_error(err: BaseException) -> bool:
+    """
+    Checks whether an exception (or any exception it chains) is a Flight
+    transport failure, i.e. the underlying channel is likely dead.
+    """
+    curr: Optional[BaseException] = err
+    while curr is not None:
+        if isinstance(curr, _TRANSPORT_ERRORS):
+            return True
+        curr = curr.__cause__ or curr.__context__
+    return False
+
+
+@dataclass
+class _PooledClient:
+    """A pool slot: a Flight client along with its health state."""
+
+    client: fl.FlightClient
+    healthy: bool = True
+    last_error_ts: float = 0.0
+
+
 class _ConnectionPool:
     """
     Manages a pool of PyArrow Flight connections.
@@ -52,6 +257,10 @@ class _ConnectionPool:
     Round-Robin strategy to cycle through them. This allows the client to
     distribute write operations across multiple sockets, improving throughput
     by reducing contention.
+
+    Clients whose channel failed (see `report_failure`) are skipped by the
+    rotation and lazily re-opened after a short backoff, so that a stalled
+    socket does not keep absorbing new streams.
     """
 
     def __init__(
@@ -68,19 +277,25 @@ class _ConnectionPool:
             host (str): The server hostname.
             port (int): The server port.
             pool_size (Optional[int]): The number of connections to maintain.
-                                       If None, defaults to `_DEFAULT_CONNECTION_POOL_SIZE`.
+                                       If None, defaults to `_default_connection_pool_size()`.
         """
         self._host = host
         self._port = port
-        self._size = pool_size or _DEFAULT_CONNECTION_POOL_SIZE
-        self._clients: List[fl.FlightClient] = []
-        self._iterator = None
+        self._size = pool_size or _default_connection_pool_size()
+        self._timeout = timeout
+        self._clients: List[_PooledClient] = []
+        self._rr_counter = None
+        # Serializes the (rare) re-opening of unhealthy slots
+        self._reopen_lock = Lock()
+        # Clients replaced by `_reopen`: writers may still hold streams on them,
+        # so they are closed with the pool
+        self._retired: List[fl.FlightClient] = []
 
         self._initialize_pool(timeout)
 
     def _initialize_pool(self, timeout: int):
         """
-        Creates the connections and sets up the cyclic iterator.
+        Creates the connections and sets up the round-robin counter.
 
         This method attempts to fill the pool. If an error occurs during creation,
         it cleans up any successfully created connections before raising the error.
@@ -92,43 +307,135 @@ class _ConnectionPool:
         if self._size < 1:
             raise ValueError("Connection pool size must be at least 1")
 
-        log.debug(f"Initializing connection pool with {self._size} connections...")
+        log.debug("Initializing connection pool with %d connections...", self._size)
 
-        for i in range(self._size):
-            try:
-                # distinct connection instance
-                self._clients.append(
-                    _get_connection(host=self._host, port=self._port, timeout=timeout)
+        # Connections are opened concurrently: the startup latency is bound by the
+        # slowest `wait_for_available`, not by the sum of all of them.
+        with ThreadPoolExecutor(max_workers=self._size) as connector:
+            futures = [
+                connector.submit(
+                    _get_connection, host=self._host, port=self._port, timeout=timeout
                 )
-            except Exception as e:
+                for _ in range(self._size)
+            ]
+            _, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+            # Do not start pending connections if one already failed
+            for fut in not_done:
+                fut.cancel()
+
+        # All the futures are settled here (the executor waits on exit).
+        # Keep the submit order to preserve a deterministic pool layout.
+        first_error: Optional[BaseException] = None
+        for i, fut in enumerate(futures):
+            if fut.cancelled():
+                continue
+            err = fut.exception()
+            if err is not None:
                 log.error(
-                    f"Failed to create connection {i + 1}/{self._size} for pool: {e}"
+                    "Failed to create connection %d/%d for pool: %s",
+                    i + 1,
+                    self._size,
+                    err,
                 )
-                # Clean up any connections successfully created before the failure
-                # to prevent resource leaks (dangling sockets).
-                self.close()
-                raise e
+                if first_error is None:
+                    first_error = err
+            else:
+                # distinct connection instance
+                self._clients.append(_PooledClient(client=fut.result()))
+
+        if first_error is not None:
+            # Clean up any connections successfully created before the failure
+            # to prevent resource leaks (dangling sockets).
+            self.close()
+            raise first_error
 
-        # Create an infinite cyclic iterator for round-robin assignment
+        # Monotonic counter for round-robin assignment (index modulo pool size)
         # e.g., returns client[0], then client[1], then client[0]...
-        self._iterator = cycle(self._clients)
+        self._rr_counter = count()
 
     def get_next(self) -> fl.FlightClient:
         """
         Retrieves the next available connection from the pool.
 
-        Note: In CPython, `next()` on a built-in iterator is atomic due to the
-        GIL, making this method thread-safe without additional locking.
+        Unhealthy slots are skipped; if the backoff of an unhealthy slot has
+        elapsed, its connection is re-opened before being returned.
+        At most `pool_size` slots are scanned per call.
+
+        Note: `next()` on an `itertools.count` is implemented atomically in C,
+        making this method thread-safe without additional locking.
 
         Returns:
             fl.FlightClient: The next Flight client in the rotation.
 
         Raises:
             RuntimeError: If the pool has not been initialized or has been closed.
+            ConnectionError: If all the pooled connections are unhealthy.
         """
-        if not self._clients or self._iterator is None:
+        if not self._clients or self._rr_counter is None:
             raise RuntimeError("Connection pool is not initialized or has been closed.")
-        return next(self._iterator)
+
+        nslots = len(self._clients)
+        for _ in range(nslots):
+            idx = next(self._rr_counter) % nslots
+            slot = self._clients[idx]
+            if slot.healthy:
+                return slot.client
+            if time.monotonic() - slot.last_error_ts > _UNHEALTHY_CONNECTION_BACKOFF_S:
+                client = self._reopen(idx)
+                if client is not None:
+                    return client
+
+        raise ConnectionError(
+            f"All the {nslots} pooled connections to {self._host}:{self._port} are unhealthy."
+        )
+
+    def report_failure(self, client: fl.FlightClient):
+        """
+        Marks the slot holding `client` as unhealthy.
+
+        Callers should report clients whose last call raised a transport error:
+        the slot is then skipped by `get_next` and re-opened after a backoff.
+        Clients not belonging to the pool are ignored.
+
+        Args:
+            client (fl.FlightClient): The client which experienced the failure.
+        """
+        for i, slot in enumerate(self._clients):
+            if slot.client is client:
+                slot.healthy = False
+                slot.last_error_ts = time.monotonic()
+                log.warning("Pooled connection #%d marked as unhealthy.", i)
+                return
+
+    def _reopen(self, idx: int) -> Optional[fl.FlightClient]:
+        """
+        Replaces the connection of an unhealthy slot with a fresh one.
+
+        The replaced client is left to the callers still holding it, and is
+        closed by `close()`.
+
+        Returns:
+            Optional[fl.FlightClient]: The new client, or None if re-connection failed.
+        """
+        with self._reopen_lock:
+            slot = self._clients[idx]
+            if slot.healthy:
+                # Already re-opened by a concurrent caller
+                return slot.client
+            try:
+                client = _get_connection(
+                    host=self._host, port=self._port, timeout=self._timeout
+                )
+            except Exception as e:
+                log.warning("Unable to re-open pooled connection #%d: %s", idx, e)
+                slot.last_error_ts = time.monotonic()
+                return None
+
+            # Not closed here: other topics may still have live streams on it
+            self._retired.append(slot.client)
+            self._clients[idx] = _PooledClient(client=client)
+            log.debug("Pooled connection #%d re-opened.", idx)
+            return client
 
     def close(self):
         """
@@ -137,10 +444,16 @@ class _ConnectionPool:
         This method attempts to close every client in the list, logging warnings
         if individual closures fail, rather than aborting the process.
         """
-        for i, client in enumerate(self._clients):
+        for i, slot in enumerate(self._clients):
+            try:
+                slot.client.close()
+            except Exception as e:
+                log.warning("Error closing pooled client #%d: %s", i, e)
+        for client in self._retired:
             try:
                 client.close()
             except Exception as e:
-                log.warning(f"Error closing pooled client #{i}: {e}")
+                log.warning("Error closing retired pooled client: %s", e)
         self._clients.clear()
-        self._iterator = None
+        self._retired.clear()
+        self._rr_counter = None
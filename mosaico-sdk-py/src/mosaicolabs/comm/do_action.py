@@ -10,19 +10,26 @@ server responses are automatically deserialized into the correct Python objects,
 providing stronger typing and validation than raw dictionaries.
 """
 
-import json
-from typing import Any, ClassVar, Dict, Optional, Type, TypeVar
+from typing import Any, Callable, ClassVar, Dict, Mapping, Optional, Type, TypeVar
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import MISSING, dataclass, fields
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
 import datetime
 import logging as log
 import pyarrow.flight as fl
+from . import _json
 from ..enum import FlightAction
 from ..models.query import QueryResponseItem, QueryResponse
 
 # Generic TypeVar allowing _do_action to return the specific subclass requested
 T_DoActionResponse = TypeVar("T_DoActionResponse", bound="_DoActionResponse")
 
+# Backing storage of `_DoActionResponse._registry`: only written at class
+# definition time, by `_DoActionResponse.__init_subclass__`
+_RESPONSE_REGISTRY: Dict[FlightAction, Type["_DoActionResponse"]] = {}
+
 
 class _DoActionResponse(ABC):
     """
@@ -32,19 +39,25 @@ class _DoActionResponse(ABC):
     is defined with a list of `actions`, it is automatically added to the `_registry`.
     """
 
-    # Registry mapping FlightAction -> Subclass Type
-    _registry: ClassVar[Dict[FlightAction, Type["_DoActionResponse"]]] = {}
+    # Registry mapping FlightAction -> Subclass Type (read-only view)
+    _registry: ClassVar[Mapping[FlightAction, Type["_DoActionResponse"]]] = (
+        MappingProxyType(_RESPONSE_REGISTRY)
+    )
 
     # Subclasses must define which actions they handle
     actions: ClassVar[list[FlightAction]] = []
 
+    # Per-class extractor of the positional constructor arguments from a
+    # response dictionary (built on first use by `_from_fields`)
+    _fields_getter: ClassVar[Optional[Callable[[Dict[str, Any]], tuple]]] = None
+
     def __init_subclass__(cls, **kwargs):
         """
         Metaclass hook to register subclasses automatically.
         """
         super().__init_subclass__(**kwargs)
         for action in getattr(cls, "actions", []):
-            _DoActionResponse._registry[action] = cls
+            _RESPONSE_REGISTRY[action] = cls
 
     @classmethod
     def get_class_for_action(cls, action: FlightAction) -> Type["_DoActionResponse"]:
@@ -60,9 +73,37 @@ class _DoActionResponse(ABC):
         Raises:
             KeyError: If no class is registered for the action.
         """
-        if action not in cls._registry:
+        response_cls = cls._registry.get(action)
+        if response_cls is None:
             raise KeyError(f"No subclass registered for action '{action}'")
-        return cls._registry[action]
+        return response_cls
+
+    @classmethod
+    def _from_fields(
+        cls: Type[T_DoActionResponse], data: Dict[str, Any]
+    ) -> T_DoActionResponse:
+        """
+        Builds a dataclass instance positionally from the response dictionary.
+
+        The field extractor is computed once per class and cached: required
+        fields are read with a pre-bound `itemgetter`, while fields having a
+        default are read with `dict.get`. This avoids the keyword matching
+        of `cls(**data)` on every call.
+
+        Args:
+            data (Dict[str, Any]): The raw dictionary from the server response.
+
+        Returns:
+            T_DoActionResponse: An instance of the class.
+
+        Raises:
+            KeyError: If a required field is missing from `data`.
+        """
+        getter = cls.__dict__.get("_fields_getter")
+        if getter is None:
+            getter = _make_fields_getter(cls)
+            cls._fields_getter = getter
+        return cls(*getter(data))
 
     @classmethod
     @abstractmethod
@@ -81,6 +122,111 @@ class _DoActionResponse(ABC):
         pass
 
 
+def _make_fields_getter(cls: type) -> Callable[[Dict[str, Any]], tuple]:
+    """
+    Creates a function extracting the `__init__` arguments of the dataclass
+    `cls` from a dictionary, in declaration order.
+    """
+    required = []
+    optional = []
+    for fld in fields(cls):
+        if not fld.init:
+            continue
+        if fld.default is MISSING and fld.default_factory is MISSING:
+            required.append(fld.name)
+        else:
+            default = fld.default if fld.default is not MISSING else None
+            optional.append((fld.name, default))
+
+    # `itemgetter` returns a bare value (not a tuple) for a single key
+    if len(required) == 1:
+        key = required[0]
+        get_required = lambda data: (data[key],)  # noqa: E731
+    elif required:
+        get_required = itemgetter(*required)
+    else:
+        get_required = lambda data: ()  # noqa: E731
+
+    if not optional:
+        return get_required
+
+    def getter(data: Dict[str, Any]) -> tuple:
+        return (*get_required(data), *(data.get(k, d) for k, d in optional))
+
+    return getter
+
+
+def _parse_server_datetime(value: Any) -> Any:
+    """
+    Converts a datetime string sent by the server into a `datetime.datetime`.
+
+    The server formats UTC datetimes as `YYYY-MM-DD HH:MM:SS[.fff] UTC`; the
+    ISO-8601 `Z` suffix is accepted as well. Parsing is done once, here, with
+    the C-accelerated `datetime.fromisoformat`.
+
+    Args:
+        value (Any): The raw value from the response dictionary.
+
+    Returns:
+        Any: The parsed datetime, or `value` unchanged if it is not a string
+             or cannot be parsed.
+    """
+    if not isinstance(value, str):
+        return value
+    if value.endswith(" UTC"):
+        iso_value = value[:-4] + "+00:00"
+    elif value.endswith("Z"):
+        iso_value = value[:-1] + "+00:00"
+    else:
+        iso_value = value
+    try:
+        return datetime.datetime.fromisoformat(iso_value)
+    except ValueError:
+        log.warning("Unable to parse server datetime '%s'", value)
+        return value
+
+
+@lru_cache(maxsize=256)
+def _encode_payload(action_name: str, payload_items: tuple) -> bytes:
+    """
+    Serializes a canonical (sorted, hashable) payload into the JSON request body.
+
+    Results are memoized per `(action_name, payload_items)`, so that repeated
+    idempotent actions (e.g. system-info polls) skip the JSON encoding entirely.
+
+    Args:
+        action_name (str): The action the payload belongs to.
+        payload_items (tuple): The payload items, as `tuple(sorted(payload.items()))`.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON body.
+    """
+    return _json.dumps(dict(payload_items))
+
+
+def _serialize_payload(action_name: str, payload: dict[str, Any]) -> bytes:
+    """
+    Converts an action payload into the request body.
+
+    Single string item payloads (e.g. `{"name": ...}` of the sequence/topic
+    actions) are encoded directly from a template: they are cheaper to build
+    than to look up, and mostly unique (no cache hit to expect).
+
+    Only payloads made of plain string values go through the `_encode_payload`
+    cache: this keeps the cache keys unambiguous (e.g. `1`, `1.0` and `True`
+    hash the same) and skips payloads carrying nested (unhashable) structures.
+    The latter (user metadata, queries) are encoded by the standard library,
+    so that their encoding does not depend on the JSON backend.
+    """
+    if len(payload) == 1:
+        ((key, val),) = payload.items()
+        if type(key) is str and type(val) is str:
+            return _json.dumps_str_item(key, val)
+    if all(type(val) is str for val in payload.values()):
+        return _encode_payload(action_name, tuple(sorted(payload.items())))
+    return _json.dumps_stdlib(payload)
+
+
 def _do_action(
     client: fl.FlightClient,
     action: FlightAction,
@@ -106,69 +252,81 @@ def _do_action(
         Exception: For Flight errors or JSON decoding failures.
     """
     action_name = action.value
-    log.debug(f"Sending Flight action: '{action_name}'")
+    log.debug("Sending Flight action: '%s'", action_name)
 
     try:
         # Serialize payload
-        body = json.dumps(payload).encode("utf-8")
-        log.debug(f"Action request body: {body}")
+        body = _serialize_payload(action_name, payload)
+        log.debug("Action request body: %s", body)
 
         # Execute Flight call
-        action_results = client.do_action(fl.Action(action_name, body))
-
-        # Process the result stream (usually contains 0 or 1 item)
-        for result in action_results:
-            if not result.body:
-                continue
-
-            try:
-                result_str = result.body.to_pybytes().decode("utf-8")
-                log.debug(f"Action result body f{result_str}")
-                result_dict: dict[str, Any] = json.loads(result_str)
-            except Exception as decode_err:
-                log.warning(
-                    f"Failed to decode Flight action response for '{action_name}': {decode_err}"
-                )
-                return None
-
-            # --- Validation ---
-            # Verify the server is responding to the correct action
-            returned_action = result_dict.get("action")
-            if returned_action is None or returned_action == "empty":
-                log.debug(f"Action '{action_name}' response had no 'action' field.")
-                return None
-
-            if returned_action != action_name:
-                log.warning(
-                    f"Unexpected action in response: got '{result_dict.get('action')}', expected '{action_name}'"
+        action_results = client.do_action(fl.Action(action.as_bytes, body))
+
+        # The server answers an action with (at most) a single result: take
+        # the first one and close the stream right away, releasing the call
+        try:
+            result = next(iter(action_results), None)
+        finally:
+            close_stream = getattr(action_results, "close", None)
+            if close_stream is not None:
+                close_stream()
+
+        if result is None or not result.body:
+            log.debug("No response body found for Flight action '%s'.", action_name)
+            return None
+
+        try:
+            # Decode in place from the Arrow buffer: no `bytes` copy and no
+            # intermediate `str` (the JSON decoder validates UTF-8 itself)
+            body_view = memoryview(result.body)
+            if log.root.isEnabledFor(log.DEBUG):
+                log.debug("Action result body %s", body_view.tobytes())
+            result_dict: dict[str, Any] = _json.loads(body_view)
+        except Exception as decode_err:
+            log.warning(
+                "Failed to decode Flight action response for '%s': %s",
+                action_name,
+                decode_err,
+            )
+            return None
+
+        # --- Validation ---
+        # Verify the server is responding to the correct action
+        returned_action = result_dict.get("action")
+        if returned_action is None or returned_action == "empty":
+            log.debug("Action '%s' response had no 'action' field.", action_name)
+            return None
+
+        if returned_action != action_name:
+            log.warning(
+                "Unexpected action in response: got '%s', expected '%s'",
+                returned_action,
+                action_name,
+            )
+            return None
+
+        response_data = result_dict.get("response")
+        if response_data is None:
+            log.debug("Action '%s' response had no 'response' field.", action_name)
+            return None
+
+        # --- Deserialization ---
+        if expected_type is not None:
+            # Ensure the registered class matches what the caller expects
+            response_cls = _DoActionResponse.get_class_for_action(action)
+            if response_cls is not expected_type:
+                raise TypeError(
+                    f"Action '{action_name}' returned an unexpected type. "
+                    f"Got {response_cls.__name__}, but expected {expected_type.__name__}"
                 )
-                return None
-
-            response_data = result_dict.get("response")
-            if response_data is None:
-                log.debug(f"Action '{action_name}' response had no 'response' field.")
-                return None
-
-            # --- Deserialization ---
-            if expected_type is not None:
-                # Ensure the registered class matches what the caller expects
-                response_cls = _DoActionResponse.get_class_for_action(action)
-                if response_cls is not expected_type:
-                    raise TypeError(
-                        f"Action '{action_name}' returned an unexpected type. "
-                        f"Got {response_cls.__name__}, but expected {expected_type.__name__}"
-                    )
-                # Parse data
-                return expected_type.from_dict(response_data)
-            else:
-                # Caller didn't ask for a specific type (or return value might be raw)
-                return response_data
-
-        log.debug(f"No response body found for Flight action '{action_name}'.")
-        return None
+            # Parse data
+            return expected_type.from_dict(response_data)
+        else:
+            # Caller didn't ask for a specific type (or return value might be raw)
+            return response_data
 
     except Exception as e:
-        log.exception(f"Flight action '{action_name}' failed: {e}")
+        log.exception("Flight action '%s' failed: %s", action_name, e)
         raise e
 
 
@@ -187,7 +345,7 @@ class _DoActionResponseKey(_DoActionResponse):
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "_DoActionResponseKey":
-        return cls(**data)
+        return cls._from_fields(data)
 
 
 @dataclass
@@ -205,7 +363,9 @@ class _DoActionResponseSysInfo(_DoActionResponse):
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "_DoActionResponseSysInfo":
-        return cls(**data)
+        resp = cls._from_fields(data)
+        resp.created_datetime = _parse_server_datetime(resp.created_datetime)
+        return resp
 
 
 @dataclass
@@ -222,7 +382,5 @@ class _DoActionQueryResponse(_DoActionResponse):
     def from_dict(cls, data: Dict[str, Any]) -> "_DoActionQueryResponse":
         if data.get("items") is None:
             raise KeyError("Unable to find 'items' key in data dict.")
-        qresp = QueryResponse(
-            items=[QueryResponseItem(**item) for item in data["items"]]
-        )
+        qresp = QueryResponse(items=QueryResponseItem.from_rows(data["items"]))
         return _DoActionQueryResponse(qresp=qresp)
@@ -7,11 +7,11 @@ blocking I/O waits from the main application thread during asynchronous operatio
 """
 
 from concurrent.futures import ThreadPoolExecutor
-from itertools import cycle
+from itertools import count
 from typing import List, Optional
 import logging as log
 
-_DEFAULT_EXECUTOR_POOL_SIZE = 2
+from .connection import _default_pool_size
 
 
 class _ExecutorPool:
@@ -21,6 +21,16 @@ class _ExecutorPool:
     This design creates distinct "lanes" for execution. By using a Round-Robin
     strategy to distribute tasks among these executors, the client ensures that
     serialization overhead is parallelized alongside network operations.
+    Since a lane has a single worker, the tasks submitted to it run in order:
+    this is what keeps the batches of a topic ordered on its Flight stream.
+
+    The pool lives at client level and is shared by all its sequence writers.
+    Arrow's own thread pools cannot run these tasks (pyarrow does not expose
+    them as executors); they run alongside the lanes instead: Arrow's CPU pool
+    (`pa.cpu_count()` threads) encodes the IPC buffers of the batches written
+    by the lanes, and gRPC has its own I/O threads. The default size follows
+    the CPUs available, as Arrow's CPU pool does, and a lane thread is only
+    started by the first task submitted to it: unused lanes cost no thread.
     """
 
     def __init__(self, pool_size: Optional[int]):
@@ -29,17 +39,17 @@ class _ExecutorPool:
 
         Args:
             pool_size (Optional[int]): The number of executors (threads) to create.
-                                       If None, defaults to `_DEFAULT_EXECUTOR_POOL_SIZE`.
+                                       If None, defaults to `_default_pool_size()`.
         """
-        self._size = pool_size or _DEFAULT_EXECUTOR_POOL_SIZE
+        self._size = pool_size or _default_pool_size()
         self._executors: List[ThreadPoolExecutor] = []
-        self._iterator = None
+        self._rr_counter = None
 
         self._initialize_pool()
 
     def _initialize_pool(self):
         """
-        Instantiates the executors and the cycle iterator.
+        Instantiates the executors and the round-robin counter.
 
         Raises:
             ValueError: If `pool_size` is less than 1.
@@ -48,7 +58,7 @@ class _ExecutorPool:
         if self._size < 1:
             raise ValueError("Executor pool size must be at least 1")
 
-        log.debug(f"Initializing executor pool with {self._size} executors...")
+        log.debug("Initializing executor pool with %d executors...", self._size)
 
         for i in range(self._size):
             try:
@@ -57,28 +67,31 @@ class _ExecutorPool:
                 self._executors.append(ThreadPoolExecutor(max_workers=1))
             except Exception as e:
                 log.error(
-                    f"Failed to create executor {i + 1}/{self._size} for pool: {e}"
+                    "Failed to create executor %d/%d for pool: %s", i + 1, self._size, e
                 )
                 # Clean up any executors successfully created before the failure
                 self.close()
                 raise e
 
-        # Create an infinite cyclic iterator for round-robin assignment
-        self._iterator = cycle(self._executors)
+        # Monotonic counter for round-robin assignment (index modulo pool size)
+        self._rr_counter = count()
 
     def get_next(self) -> ThreadPoolExecutor:
         """
         Retrieves the next executor in the pool.
 
+        Note: `next()` on an `itertools.count` is implemented atomically in C,
+        making this method thread-safe without additional locking.
+
         Returns:
             ThreadPoolExecutor: The next available executor instance.
 
         Raises:
             RuntimeError: If the pool is not initialized or has been closed.
         """
-        if not self._executors or self._iterator is None:
+        if not self._executors or self._rr_counter is None:
             raise RuntimeError("executor pool is not initialized or has been closed.")
-        return next(self._iterator)
+        return self._executors[next(self._rr_counter) % len(self._executors)]
 
     def close(self):
         """
@@ -88,6 +101,6 @@ class _ExecutorPool:
             try:
                 exec.shutdown()
             except Exception as e:
-                log.warning(f"Error closing pooled executor #{i}: {e}")
+                log.warning("Error closing pooled executor #%d: %s", i, e)
         self._executors.clear()
-        self._iterator = None
+        self._rr_counter = None
@@ -6,17 +6,30 @@ utility functions for encoding/decoding metadata to be compatible with the
 PyArrow Flight protocol. It also handles Mosaico-specific namespacing.
 """
 
-import json
 from dataclasses import dataclass
 from typing import Any, Dict
 
 from mosaicolabs.enum import SerializationFormat
+from . import _json
 
 UserMetadata = Dict[str, Any]
 
 # Prefix for internal ROS keys that for now are filtered out of user metadata
 _ROS_KEY_PREFIX = "ros:"
 
+# First characters a JSON document can start with (objects, arrays, strings,
+# numbers, true/false/null): other metadata values are plain strings
+_JSON_LEAD_CHARS = frozenset('{["0123456789tfn-')
+
+# This prefix is an internal contract with the mosaico server.
+_SERVER_MOSAICO_PREFIX: str = "mosaico:"
+
+# Pre-built namespaced keys for the logical keys used by this module
+_NAMESPACED: Dict[str, str] = {
+    key: _SERVER_MOSAICO_PREFIX + key
+    for key in ("context", "user_metadata", "properties")
+}
+
 
 @dataclass
 class SequenceMetadata:
@@ -53,11 +66,7 @@ class SequenceMetadata:
         # Filter out internal ROS keys before presenting to the user
         return SequenceMetadata(
             context=context,
-            user_metadata={
-                key: val
-                for key, val in user_metadata.items()
-                if _ROS_KEY_PREFIX not in key
-            },
+            user_metadata=_filter_ros_keys(user_metadata),
         )
 
 
@@ -105,14 +114,26 @@ class TopicMetadata:
         return TopicMetadata(
             context=context,
             properties=TopicMetadata.Properties(**properties),
-            user_metadata={
-                key: val
-                for key, val in user_metadata.items()
-                if _ROS_KEY_PREFIX not in key
-            },
+            user_metadata=_filter_ros_keys(user_metadata),
         )
 
 
+def _filter_ros_keys(user_metadata: UserMetadata) -> UserMetadata:
+    """
+    Removes the internal ROS keys (prefixed by `_ROS_KEY_PREFIX`) from user metadata.
+
+    The input dictionary is returned as-is when it contains no ROS key,
+    avoiding a dictionary rebuild in the common case.
+    """
+    if not any(key.startswith(_ROS_KEY_PREFIX) for key in user_metadata):
+        return user_metadata
+    return {
+        key: val
+        for key, val in user_metadata.items()
+        if not key.startswith(_ROS_KEY_PREFIX)
+    }
+
+
 def _decode_metadata(bmdata: dict[bytes, bytes], enc: str = "utf-8") -> dict[str, Any]:
     """
     Decodes a bytes-only dictionary back into a Python dictionary.
@@ -132,11 +153,17 @@ def _decode_metadata(bmdata: dict[bytes, bytes], enc: str = "utf-8") -> dict[str
         key = k.decode(encoding=enc) if isinstance(k, bytes) else k
         value = v.decode(encoding=enc) if isinstance(v, bytes) else v
 
+        # Cheap pre-check: only values that may start a JSON document go
+        # through the parser (and its exception machinery)
+        if not (isinstance(value, str) and value and value[0] in _JSON_LEAD_CHARS):
+            result[key] = value
+            continue
+
         # Try to parse JSON values automatically
         try:
-            parsed = json.loads(value)
+            parsed = _json.loads(value)
             result[key] = parsed
-        except (json.JSONDecodeError, TypeError):
+        except (ValueError, TypeError):
             # Fallback: keep the value as a string
             result[key] = value
     return result
@@ -159,9 +186,7 @@ def _get_value(metadata: Dict[str, Any], key: str) -> Any:
     Raises:
         KeyError: If the prefixed key is missing from the dictionary.
     """
-    # This prefix is an internal contract with the mosaico server.
-    SERVER_MOSAICO_PREFIX: str = "mosaico:"
-
-    full_key = SERVER_MOSAICO_PREFIX + key
-    value = metadata[full_key]
-    return value
+    full_key = _NAMESPACED.get(key)
+    if full_key is None:
+        full_key = _SERVER_MOSAICO_PREFIX + key
+    return metadata[full_key]
@@ -7,15 +7,16 @@ resource pooling (connections and executors), and serves as a factory for
 creating resource handlers (sequences, topics) and executing queries.
 """
 
-import os
-from typing import Any, Dict, Optional, Type
+from collections import OrderedDict
+from threading import Event, Lock, local
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Type, Union
 import logging as log
+import sys
 import pyarrow.flight as fl
 
 from mosaicolabs.models.query import Query, QueryResponse
 from mosaicolabs.models.query.protocols import QueryableProtocol
 
-from ..helpers import pack_topic_resource_name
 from ..handlers import TopicHandler, SequenceHandler, SequenceWriter
 from .connection import _get_connection, _ConnectionStatus, _ConnectionPool
 from .executor_pool import _ExecutorPool
@@ -27,6 +28,40 @@ from .connection import (
     DEFAULT_MAX_BATCH_SIZE_RECORDS,
 )
 
+# Default bound of each handlers cache (sequences and topics)
+DEFAULT_MAX_CACHED_HANDLERS = 256
+
+# Maximum time to wait for each cached handler to close, on client close
+_HANDLER_CLOSE_TIMEOUT_S = 5.0
+
+# Per-thread scratch dict reused as the `query()` action payload
+_query_scratch = local()
+
+
+def _query_payload() -> Dict[str, Any]:
+    """
+    Returns the (empty) query payload dictionary of the calling thread.
+
+    The dictionary is reused across `query()` calls instead of being rebuilt
+    for each request; `query()` clears it once the request body is serialized.
+    """
+    payload = getattr(_query_scratch, "payload", None)
+    if payload is None:
+        payload = _query_scratch.payload = {}
+    else:
+        payload.clear()
+    return payload
+
+
+class _PendingHandler:
+    """A handler being created: its creator publishes the result, then sets `done`."""
+
+    __slots__ = ("done", "handler")
+
+    def __init__(self):
+        self.done = Event()
+        self.handler: Optional[Union[SequenceHandler, TopicHandler]] = None
+
 
 class MosaicoClient:
     """
@@ -49,14 +84,39 @@ class MosaicoClient:
     # Used to ensure the constructor is only called via the `connect()` factory.
     _CONNECT_SENTINEL = object()
 
+    __slots__ = (
+        "_sequence_handlers_cache",
+        "_topic_handlers_cache",
+        "_handlers_lock",
+        "_pending_handlers",
+        "_max_cached_handlers",
+        "_status",
+        "_control_client",
+        "_connection_pool",
+        "_executor_pool",
+        "_pools_args",
+        "_pools_lock",
+        "_queries",
+        "__weakref__",
+    )
+
     # --- Class-level attributes ---
-    _sequence_handlers_cache: Dict[str, SequenceHandler]
-    """Cache for SequenceHandler instances, keyed by sequence_name. Used to avoid re-connecting for known sequences."""
+    _sequence_handlers_cache: "OrderedDict[str, SequenceHandler]"
+    """LRU cache for SequenceHandler instances, keyed by sequence_name. Used to avoid re-connecting for known sequences."""
+
+    _topic_handlers_cache: "OrderedDict[Tuple[str, str], TopicHandler]"
+    """LRU cache for TopicHandler instances, keyed by the (interned) `(sequence_name, topic_name)` pair."""
+
+    _handlers_lock: Lock
+    """Guards the insertions in the handlers caches and `_pending_handlers`."""
 
-    _topic_handlers_cache: Dict[str, TopicHandler]
-    """Cache for TopicHandler instances, keyed by their resource ('sequence_name/topic_name') name."""
+    _pending_handlers: Dict[Hashable, _PendingHandler]
+    """Handlers being created (one `connect()` per key at a time): other callers wait for their result."""
 
-    _status: _ConnectionStatus = _ConnectionStatus.Closed
+    _max_cached_handlers: int
+    """The maximum number of entries of each handlers cache. The least recently used handler is closed and evicted beyond it."""
+
+    _status: _ConnectionStatus
     """Tracks the current connection status (Open/Closed)."""
 
     _control_client: fl.FlightClient
@@ -68,32 +128,93 @@ class MosaicoClient:
     _executor_pool: Optional[_ExecutorPool]
     """The pool of thread executors used for offloading serialization and I/O."""
 
+    _pools_args: Optional[Dict[str, Any]]
+    """The arguments of the pools to create on first use (see `_get_pools`), or None if the pools are not lazy."""
+
+    _pools_lock: Lock
+    """Guards the lazy creation of the pools."""
+
+    _queries: List[QueryableProtocol]
+    """The queries of the last `query()` call."""
+
     def __init__(
         self,
         control_client: fl.FlightClient,
         connection_pool: Optional[_ConnectionPool],
         executor_pool: Optional[_ExecutorPool],
         sentinel: object,
+        max_cached_handlers: int = DEFAULT_MAX_CACHED_HANDLERS,
+        pools_args: Optional[Dict[str, Any]] = None,
     ):
         """
         Internal initialization method.
 
         **Do not call this directly.** Use `MosaicoClient.connect()` instead.
         This constructor enforces the factory pattern by checking for a private sentinel.
+
+        If `pools_args` is provided (with the `host`, `port`, `timeout` and
+        `pool_size` keys), the pools are not passed in but created on first use.
         """
         if sentinel is not MosaicoClient._CONNECT_SENTINEL:
             raise RuntimeError(
                 "MosaicoClient must be instantiated using the classmethod MosaicoClient.connect()."
             )
+        self._setup(
+            control_client,
+            connection_pool,
+            executor_pool,
+            max_cached_handlers,
+            pools_args,
+        )
+
+    @classmethod
+    def _build(
+        cls,
+        control_client: fl.FlightClient,
+        connection_pool: Optional[_ConnectionPool],
+        executor_pool: Optional[_ExecutorPool],
+        max_cached_handlers: int = DEFAULT_MAX_CACHED_HANDLERS,
+        pools_args: Optional[Dict[str, Any]] = None,
+    ) -> "MosaicoClient":
+        """
+        Private constructor used by `connect()`: allocates the instance and
+        populates its slots directly, without the sentinel check of `__init__`.
+        """
+        self = cls.__new__(cls)
+        self._setup(
+            control_client,
+            connection_pool,
+            executor_pool,
+            max_cached_handlers,
+            pools_args,
+        )
+        return self
+
+    def _setup(
+        self,
+        control_client: fl.FlightClient,
+        connection_pool: Optional[_ConnectionPool],
+        executor_pool: Optional[_ExecutorPool],
+        max_cached_handlers: int,
+        pools_args: Optional[Dict[str, Any]],
+    ):
+        """Populates the instance attributes (see `__init__`)."""
+        if max_cached_handlers < 1:
+            raise ValueError("max_cached_handlers must be at least 1")
 
         self._control_client = control_client
         self._status = _ConnectionStatus.Open
         self._connection_pool = connection_pool
         self._executor_pool = executor_pool
+        self._pools_args = pools_args
+        self._pools_lock = Lock()
 
         # Initialize caches
-        self._sequence_handlers_cache = {}
-        self._topic_handlers_cache = {}
+        self._max_cached_handlers = max_cached_handlers
+        self._sequence_handlers_cache = OrderedDict()
+        self._topic_handlers_cache = OrderedDict()
+        self._handlers_lock = Lock()
+        self._pending_handlers = {}
 
     @classmethod
     def connect(
@@ -101,6 +222,8 @@ class MosaicoClient:
         host: str,
         port: int,
         timeout: int = 5,
+        pool_size: Optional[int] = None,
+        max_cached_handlers: int = DEFAULT_MAX_CACHED_HANDLERS,
     ) -> "MosaicoClient":
         """
         Factory method to establish a connection to the Mosaico server.
@@ -109,13 +232,24 @@ class MosaicoClient:
             host (str): The server host address.
             port (int): The server port.
             timeout (int): The waiting-for-connection timeout in seconds (default = 5s)
+            pool_size (Optional[int]): The size of the connection and executor pools.
+                If None (default), the pools are sized on the CPUs the process
+                is entitled to (affinity and cgroup quota): one executor and two
+                connections per CPU, up to 16.
+            max_cached_handlers (int): The maximum number of sequence (and topic)
+                handlers kept in cache. The least recently used handler is closed
+                when the bound is exceeded (default = 256).
 
         Returns:
             MosaicoClient: An initialized client instance.
 
+        Note:
+            The connection and executor pools are only created when first needed
+            (i.e. by `sequence_create`): clients issuing control-plane operations
+            only (queries, handlers) do not pay for them.
+
         Raises:
             fl.FlightUnavailableError: If the control connection cannot be established.
-            Exception: If pool initialization fails.
         """
 
         # Establish the Control Connection
@@ -128,36 +262,73 @@ class MosaicoClient:
                 f"Connection to Flight server at {host}:{port} failed on startup.\nInner err: '{e}"
             )
 
-        # Initialize Pools
-        connection_pool = None
-        executor_pool = None
+        # Call the private constructor: pools are created on first use
+        return cls._build(
+            control_client,
+            None,
+            None,
+            max_cached_handlers=max_cached_handlers,
+            pools_args={
+                "host": host,
+                "port": port,
+                "timeout": timeout,
+                "pool_size": pool_size,
+            },
+        )
 
-        try:
-            # We attempt to create the connection pool. We use os.cpu_count()
-            # as a heuristic for the optimal pool size.
-            connection_pool = _ConnectionPool(
-                host=host,
-                port=port,
-                pool_size=os.cpu_count(),
-                timeout=timeout,
-            )
-        except Exception as e:
-            # A failed pool is a fatal error.
-            raise Exception(
-                f"Exception while initializing Connection pool.\nInner err. {str(e)}"
-            )
+    def _get_pools(
+        self, with_connections: bool = True
+    ) -> Tuple[Optional[_ConnectionPool], Optional[_ExecutorPool]]:
+        """
+        Returns the connection and executor pools, creating them on first call.
 
-        try:
-            executor_pool = _ExecutorPool(pool_size=os.cpu_count())
-        except Exception as e:
-            raise Exception(
-                f"Exception while initializing Executor pool.\nInner err. {str(e)}"
-            )
+        Args:
+            with_connections (bool): Whether the connection pool is needed. If not,
+                only the executor pool is created (the connection pool is then
+                created by the first call requiring it).
 
-        # Call the private constructor
-        return cls(
-            control_client, connection_pool, executor_pool, cls._CONNECT_SENTINEL
-        )
+        Returns:
+            Tuple[Optional[_ConnectionPool], Optional[_ExecutorPool]]: The pools.
+
+        Raises:
+            Exception: If pool initialization fails.
+        """
+        if self._pools_args is None or (
+            not with_connections and self._executor_pool is not None
+        ):
+            return self._connection_pool, self._executor_pool
+
+        with self._pools_lock:
+            args = self._pools_args
+            if args is None:  # created by a concurrent caller
+                return self._connection_pool, self._executor_pool
+
+            if self._executor_pool is None:
+                try:
+                    # If not provided, the pool size is derived from the CPUs
+                    # available to this process.
+                    self._executor_pool = _ExecutorPool(pool_size=args["pool_size"])
+                except Exception as e:
+                    raise Exception(
+                        f"Exception while initializing Executor pool.\nInner err. {str(e)}"
+                    )
+
+            if with_connections:
+                try:
+                    self._connection_pool = _ConnectionPool(
+                        host=args["host"],
+                        port=args["port"],
+                        pool_size=args["pool_size"],
+                        timeout=args["timeout"],
+                    )
+                except Exception as e:
+                    # A failed pool is a fatal error.
+                    raise Exception(
+                        f"Exception while initializing Connection pool.\nInner err. {str(e)}"
+                    )
+                self._pools_args = None
+
+            return self._connection_pool, self._executor_pool
 
     # --- Context Manager Protocol ---
 
@@ -180,12 +351,14 @@ class MosaicoClient:
             self.close()
         except Exception as e:
             log.exception(
-                f"Error releasing resources allocated from MosaicoClient.\nInner err: {e}"
+                "Error releasing resources allocated from MosaicoClient.\nInner err: %s",
+                e,
             )
 
     def __del__(self):
         """Destructor. Failsafe if close() is not explicitly called."""
-        if self._status == _ConnectionStatus.Open:
+        # The slot is unset if the construction failed
+        if getattr(self, "_status", None) == _ConnectionStatus.Open:
             log.warning(
                 "MosaicoClient destroyed without calling close(). "
                 "Resources may not have been released properly."
@@ -205,17 +378,14 @@ class MosaicoClient:
         Returns:
             SequenceHandler: A handler for managing sequence operations.
         """
-        sh = self._sequence_handlers_cache.get(sequence_name)
-        if sh is None:
-            sh = SequenceHandler.connect(
+        return self._get_or_create_handler(
+            self._sequence_handlers_cache,
+            sequence_name,
+            lambda: SequenceHandler.connect(
                 sequence_name=sequence_name,
                 client=self._control_client,
-            )
-            if not sh:
-                return None
-
-            self._sequence_handlers_cache[sequence_name] = sh
-        return sh
+            ),
+        )
 
     def topic_handler(
         self,
@@ -235,21 +405,94 @@ class MosaicoClient:
             TopicHandler: A handler for managing topic operations.
 
         """
-        # normalize inputs to a unique resource string
-        topic_resource_name = pack_topic_resource_name(sequence_name, topic_name)
-
-        th = self._topic_handlers_cache.get(topic_resource_name)
-        if th is None:
-            th = TopicHandler.connect(
+        # The pair is used as-is for the lookup (no resource name packing);
+        # interned strings make the key hashing and comparison cheaper
+        cache_key = (sys.intern(sequence_name), sys.intern(topic_name))
+
+        return self._get_or_create_handler(
+            self._topic_handlers_cache,
+            cache_key,
+            lambda: TopicHandler.connect(
                 sequence_name=sequence_name,
                 topic_name=topic_name,
                 client=self._control_client,
-            )
-            if not th:
+            ),
+        )
+
+    def _get_or_create_handler(
+        self,
+        cache: "OrderedDict[Any, Any]",
+        key: Hashable,
+        factory: Callable[[], Any],
+    ) -> Any:
+        """
+        Returns the handler cached under `key`, creating it with `factory` on a miss.
+
+        Cache hits do not take any lock. On a miss, the lookup is repeated under
+        `_handlers_lock` and a single caller runs `factory` (i.e. the Flight
+        round-trips of `connect()`) for a given key: concurrent callers wait for
+        it and share its result (which may already be evicted from the cache).
+
+        Returns:
+            The cached or created handler, or None if `factory` failed.
+        """
+        # Note: sequence names (str) and topic keys (tuples) cannot collide
+        # in `_pending_handlers`
+        handler = cache.get(key)
+        if handler is not None:
+            try:
+                cache.move_to_end(key)
+            except KeyError:  # evicted in the meanwhile: still usable
+                pass
+            return handler
+
+        with self._handlers_lock:
+            handler = cache.get(key)
+            if handler is not None:
+                return handler
+            pending = self._pending_handlers.get(key)
+            is_creator = pending is None
+            if is_creator:
+                pending = _PendingHandler()
+                self._pending_handlers[key] = pending
+
+        if not is_creator:
+            # None if the creation failed: not retried on behalf of the creator
+            pending.done.wait()
+            return pending.handler
+
+        try:
+            handler = factory()
+            if not handler:
                 return None
+            with self._handlers_lock:
+                self._cache_handler(cache, key, handler)
+            pending.handler = handler
+            return handler
+        finally:
+            with self._handlers_lock:
+                del self._pending_handlers[key]
+            pending.done.set()
+
+    def _cache_handler(
+        self,
+        cache: "OrderedDict[Any, Any]",
+        key: Hashable,
+        handler: Union[SequenceHandler, TopicHandler],
+    ):
+        """
+        Inserts a handler as the most recently used entry of an LRU cache.
 
-            self._topic_handlers_cache[topic_resource_name] = th
-        return th
+        If the cache exceeds `_max_cached_handlers`, the least recently used
+        handlers are evicted and closed, so that their streams are not leaked.
+        """
+        cache[key] = handler
+        while len(cache) > self._max_cached_handlers:
+            evicted_key, evicted = cache.popitem(last=False)
+            try:
+                evicted.close()
+            except Exception as e:
+                log.warning("Error closing evicted handler '%s': %s", evicted_key, e)
 
     # --- Main API Methods ---
 
@@ -260,6 +503,8 @@ class MosaicoClient:
         on_error: OnErrorPolicy = OnErrorPolicy.Delete,
         max_batch_size_bytes: Optional[int] = None,
         max_batch_size_records: Optional[int] = None,
+        enable_compression: bool = False,
+        enable_connection_fanout: bool = False,
     ) -> SequenceWriter:
         """
         Creates a `SequenceWriter` to upload a new sequence.
@@ -272,6 +517,11 @@ class MosaicoClient:
             on_error (OnErrorPolicy): Behavior on write failure (e.g., Delete partial data).
             max_batch_size_bytes (Optional[int]): Max bytes per Arrow batch.
             max_batch_size_records (Optional[int]): Max records per Arrow batch.
+            enable_compression (bool): Compresses the uploaded batches with LZ4
+                (see `WriterConfig.enable_compression`).
+            enable_connection_fanout (bool): Spreads the topics over the connection
+                pool, instead of multiplexing them on the control connection
+                (see `WriterConfig.enable_connection_fanout`).
 
         Returns:
             SequenceWriter: An initialized writer instance.
@@ -288,16 +538,24 @@ class MosaicoClient:
             else DEFAULT_MAX_BATCH_SIZE_RECORDS
         )
 
+        # Without fan-out, the connection pool is not even opened
+        connection_pool, executor_pool = self._get_pools(
+            with_connections=enable_connection_fanout
+        )
+
         return SequenceWriter(
             sequence_name=sequence_name,
             client=self._control_client,
-            connection_pool=self._connection_pool,
-            executor_pool=self._executor_pool,
+            # Without fan-out, the topics stream over the control client
+            connection_pool=connection_pool if enable_connection_fanout else None,
+            executor_pool=executor_pool,
             metadata=metadata,
             config=WriterConfig(
                 on_error=on_error,
                 max_batch_size_bytes=max_batch_size_bytes,
                 max_batch_size_records=max_batch_size_records,
+                enable_compression=enable_compression,
+                enable_connection_fanout=enable_connection_fanout,
             ),
         )
 
@@ -305,15 +563,15 @@ class MosaicoClient:
         # remove from cache
         del self._sequence_handlers_cache[sequence_name]
 
-    def _remove_from_topic_handlers_cache(self, topic_resource_name: str):
+    def _remove_from_topic_handlers_cache(self, sequence_name: str, topic_name: str):
         # remove from cache
-        del self._topic_handlers_cache[topic_resource_name]
+        del self._topic_handlers_cache[(sequence_name, topic_name)]
 
     def clear_sequence_handlers_cache(self):
-        self._sequence_handlers_cache = {}
+        self._sequence_handlers_cache = OrderedDict()
 
     def clear_topic_handlers_cache(self):
-        self._topic_handlers_cache = {}
+        self._topic_handlers_cache = OrderedDict()
 
     def sequence_delete(self, sequence_name: str):
         """
@@ -333,7 +591,7 @@ class MosaicoClient:
             self._remove_from_sequence_handlers_cache(sequence_name=sequence_name)
 
         except Exception as e:
-            log.error(f"Server error while asking for Sequence deletion, {e}")
+            log.error("Server error while asking for Sequence deletion, %s", e)
 
     def query(
         self,
@@ -355,9 +613,11 @@ class MosaicoClient:
             ValueError: If conflicting query types are passed or no queries are provided.
         """
         if queries:
-            self._queries = list(queries)
-            # Validate for duplicate query types to prevent overwrite logic errors
-            types_seen = {}
+            # Validate for duplicate query types to prevent overwrite logic errors,
+            # encoding the queries in the same pass
+            types_seen = set()
+            self._queries = []
+            query_dict = _query_payload()
             for q in queries:
                 t = type(q)
                 if t in types_seen:
@@ -365,15 +625,17 @@ class MosaicoClient:
                         f"Duplicate query type detected: {t.__name__}. "
                         "Multiple instances of the same type will override each other when encoded.",
                     )
-                else:
-                    types_seen[t] = True
+                types_seen.add(t)
+                self._queries.append(q)
+                query_dict[q.name()] = q.to_dict()
         elif query is not None:
             self._queries = query._queries
+            query_dict = _query_payload()
+            for q in self._queries:
+                query_dict[q.name()] = q.to_dict()
         else:
             raise ValueError("Expected input queries or a 'Query' object")
 
-        query_dict = {q.name(): q.to_dict() for q in self._queries}
-
         try:
             act_resp = _do_action(
                 client=self._control_client,
@@ -383,15 +645,40 @@ class MosaicoClient:
             )
 
         except Exception as e:
-            log.error(f"Query returned an internal error: '{e}'")
+            log.error("Query returned an internal error: '%s'", e)
             return None
+        finally:
+            # The request body is already serialized: drop the encoded queries
+            query_dict.clear()
 
         if act_resp is None:
-            log.error(f"Action '{FlightAction.QUERY}' returned no response.")
+            log.error("Action '%s' returned no response.", FlightAction.QUERY)
             return None
 
         return act_resp.query_response
 
+    def _close_handlers(self, handlers: List[Union[SequenceHandler, TopicHandler]]):
+        """
+        Closes the given handlers.
+
+        If the executor pool exists, the closes are fanned out across its lanes,
+        so that their (network bound) stream cancellations overlap; otherwise
+        they are run serially, since no thread is worth spawning just for this.
+        """
+        if self._executor_pool is None:
+            for handler in handlers:
+                handler.close()
+            return
+
+        futures = [
+            self._executor_pool.get_next().submit(handler.close) for handler in handlers
+        ]
+        for future in futures:
+            try:
+                future.result(timeout=_HANDLER_CLOSE_TIMEOUT_S)
+            except Exception as e:
+                log.warning("Error closing cached handler: %s", e)
+
     def close(self):
         """
         Gracefully shuts down the client.
@@ -401,19 +688,21 @@ class MosaicoClient:
         """
         if self._status == _ConnectionStatus.Open:
             # Close cached handlers
-            for seq_inst in self._sequence_handlers_cache.values():
-                seq_inst.close()
-            for top_inst in self._topic_handlers_cache.values():
-                top_inst.close()
+            self._close_handlers(
+                list(self._sequence_handlers_cache.values())
+                + list(self._topic_handlers_cache.values())
+            )
 
             self.clear_sequence_handlers_cache()
             self.clear_topic_handlers_cache()
 
-            # Close pools
-            if self._connection_pool:
-                self._connection_pool.close()
-            if self._executor_pool:
-                self._executor_pool.close()
+            # Close pools (if ever created), and prevent their lazy creation
+            with self._pools_lock:
+                self._pools_args = None
+                if self._connection_pool:
+                    self._connection_pool.close()
+                if self._executor_pool:
+                    self._executor_pool.close()
 
             # Close main connection
             self._control_client.close()
@@ -23,3 +23,12 @@ class FlightAction(StrEnum):
     LAYER_DELETE = "layer_delete"
     # Queries related
     QUERY = "query"
+
+    def __init__(self, *args):
+        # Encoded once, at class creation: `fl.Action` takes the type as bytes
+        self._bytes = self.value.encode("utf-8")
+
+    @property
+    def as_bytes(self) -> bytes:
+        """The UTF-8 encoded action name, as sent to the server."""
+        return self._bytes
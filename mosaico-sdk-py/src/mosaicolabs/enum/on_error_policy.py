@@ -1,7 +1,7 @@
-from enum import Enum
+from enum import StrEnum
 
 
-class OnErrorPolicy(Enum):
+class OnErrorPolicy(StrEnum):
     """
     Defines the behavior when an exception occurs during a sequence write.
     """
@@ -1,7 +1,7 @@
-from enum import Enum
+from enum import StrEnum
 
 
-class SequenceStatus(Enum):
+class SequenceStatus(StrEnum):
     """
     Represents the lifecycle state of a Sequence during the writing process.
     """
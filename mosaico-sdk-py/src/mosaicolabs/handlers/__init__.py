@@ -1,3 +1,7 @@
+# The built-in ontologies register their tags (`_SENSOR_REGISTRY`) on import:
+# the streamers resolve the classes of the topics read from those tags
+from ..models import data as _data, sensors as _sensors  # noqa: F401
+
 from .topic_reader import TopicDataStreamer as TopicDataStreamer
 from .topic_writer import TopicWriter as TopicWriter
 from .topic_handler import TopicHandler as TopicHandler
@@ -7,6 +7,11 @@ of the writing process, including error handling policies and batching limits.
 
 from dataclasses import dataclass
 from ..enum import OnErrorPolicy
+from ..comm.connection import (
+    DEFAULT_MAX_BATCH_BYTES,
+    DEFAULT_MAX_BATCH_SIZE_RECORDS,
+    DEFAULT_MAX_PENDING_BATCHES,
+)
 
 
 @dataclass
@@ -16,10 +21,24 @@ class WriterConfig:
 
     Attributes:
         on_error (OnErrorPolicy): Determines action if a write fails (Report or Delete).
-        max_batch_size_bytes (int): The threshold in bytes before a batch is flushed to the server.
-        max_batch_size_records (int): The threshold in row count before a batch is flushed.
+        max_batch_size_bytes (int): The threshold in bytes before a batch is flushed to the server
+            (default = `DEFAULT_MAX_BATCH_BYTES`, 4 MiB).
+        max_batch_size_records (int): The threshold in row count before a batch is flushed
+            (default = `DEFAULT_MAX_BATCH_SIZE_RECORDS`, 8192).
+        max_pending_batches (int): The maximum number of batches waiting to be sent, across
+            all the topics of a sequence (default = `DEFAULT_MAX_PENDING_BATCHES`, 16).
+        enable_compression (bool): Compresses the batch buffers with LZ4 (frame format) on
+            the wire (default = False). Worth it for raw (e.g. uncompressed image) payloads;
+            a no-op in size, at a CPU cost, for already encoded ones (e.g. JPEG images).
+            Requires a server able to decode LZ4-compressed Arrow IPC.
+        enable_connection_fanout (bool): Spreads the topic streams over the client
+            connection pool (default = False). Otherwise all the topics stream over the
+            control connection, as HTTP/2 streams multiplexed on a single channel.
     """
 
     on_error: OnErrorPolicy
-    max_batch_size_bytes: int
-    max_batch_size_records: int
+    max_batch_size_bytes: int = DEFAULT_MAX_BATCH_BYTES
+    max_batch_size_records: int = DEFAULT_MAX_BATCH_SIZE_RECORDS
+    max_pending_batches: int = DEFAULT_MAX_PENDING_BATCHES
+    enable_compression: bool = False
+    enable_connection_fanout: bool = False
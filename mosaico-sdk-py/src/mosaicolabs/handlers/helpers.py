@@ -5,11 +5,15 @@ Provides utility functions for path manipulation, exception chaining,
 and Flight ticket parsing.
 """
 
-from pathlib import Path
+import re
 from typing import Optional
 import pyarrow.flight as fl
 from ..helpers import unpack_topic_full_path
 
+# A sequence name is a single path component. As in a normalized POSIX path,
+# leading/trailing separators and '.' components around it are tolerated
+_SEQUENCE_NAME_RE = re.compile(r"(?:\.?/)*[^/]*(?:/\.?)*")
+
 
 def _make_exception(msg: str, exc_msg: Optional[Exception] = None) -> Exception:
     """
@@ -47,8 +51,15 @@ def _parse_ep_ticket(ticket: fl.Ticket) -> Optional[tuple[str, str]]:
 
 
 def _validate_sequence_name(name: str):
-    nbase = Path(name)
-    if nbase.is_absolute():
-        nbase = nbase.relative_to("/")
-    if "/" in str(nbase):
+    """
+    Checks that a sequence name does not contain inner '/' separators.
+
+    Args:
+        name (str): The sequence name.
+
+    Raises:
+        ValueError: If the name contains a '/' between two components (other
+            than empty or '.' ones).
+    """
+    if _SEQUENCE_NAME_RE.fullmatch(name) is None:
         raise ValueError(f"Invalid characters '/' in sequence name {name}")
@@ -0,0 +1,150 @@
+"""
+Internal Prefetch Module.
+
+This module defines `_PrefetchReader`, a wrapper of a `FlightStreamReader` which
+reads the chunks of the stream ahead, on a background thread, so that the
+network receive of the next batches overlaps the processing of the current one.
+
+The thread holds no reference to its `_PrefetchReader`: a reader dropped without
+`cancel()` (e.g. when breaking out of a loop over the stream) is collected as
+usual, and its finalizer stops the thread and cancels the stream.
+"""
+
+import queue
+import threading
+import weakref
+from typing import Any
+import logging as log
+
+import pyarrow.flight as fl
+
+# Marks the end of the stream in the prefetch queue
+_END_OF_STREAM = object()
+
+# Period (s) at which a producer blocked on a full queue checks for cancellation
+_PUT_POLL_INTERVAL_S = 0.1
+
+# Max time (s) `cancel` waits for the prefetch thread to exit
+_JOIN_TIMEOUT_S = 1.0
+
+
+def _put(chunks: "queue.Queue[Any]", stop: threading.Event, item: Any) -> bool:
+    """[Prefetch thread] Queues an item; returns False if stopped meanwhile."""
+    while not stop.is_set():
+        try:
+            chunks.put(item, timeout=_PUT_POLL_INTERVAL_S)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _prefetch(
+    reader: fl.FlightStreamReader, chunks: "queue.Queue[Any]", stop: threading.Event
+):
+    """[Prefetch thread] Reads the chunks until the end of the stream."""
+    while not stop.is_set():
+        try:
+            item = reader.read_chunk()
+        except StopIteration:
+            item = _END_OF_STREAM
+        except Exception as e:
+            # Raised to the consumer by `read_chunk`
+            item = e
+
+        # Stop on cancellation, at the end of the stream or on error
+        if (
+            not _put(chunks, stop, item)
+            or item is _END_OF_STREAM
+            or isinstance(item, Exception)
+        ):
+            return
+
+
+def _stop_prefetch(reader: fl.FlightStreamReader, stop: threading.Event):
+    """Stops the prefetch thread and cancels the stream (at most once)."""
+    stop.set()
+    try:
+        # Also unblocks a `read_chunk` pending in the prefetch thread
+        reader.cancel()
+    except Exception as e:
+        log.warning("Error canceling FlightStreamReader: %s", e)
+
+
+class _PrefetchReader:
+    """
+    Reads a Flight stream ahead, into a bounded queue.
+
+    A daemon thread calls `read_chunk()` on the wrapped reader and queues the
+    chunks (at most `depth` of them, which bounds the memory held ahead).
+    The wrapper exposes the subset of the `FlightStreamReader` interface used by
+    `_TopicReadState` (`schema`, `read_chunk`, `cancel`): the end of the stream
+    and the read errors are reported by `read_chunk`, in order, as they would
+    be by the wrapped reader.
+    """
+
+    def __init__(self, reader: fl.FlightStreamReader, depth: int):
+        """
+        Initializes the wrapper and starts the prefetch thread.
+
+        Args:
+            reader (fl.FlightStreamReader): The stream reader to read ahead.
+            depth (int): The max number of chunks read ahead.
+
+        Raises:
+            ValueError: If `depth` is less than 1.
+        """
+        if depth < 1:
+            raise ValueError("Prefetch depth must be at least 1")
+
+        self.schema = reader.schema
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=depth)
+        self._done = False
+
+        stop = threading.Event()
+        # Runs on `cancel`, or when the wrapper is collected
+        self._finalizer = weakref.finalize(self, _stop_prefetch, reader, stop)
+
+        self._thread = threading.Thread(
+            target=_prefetch,
+            args=(reader, self._queue, stop),
+            name="mosaico-prefetch",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def read_chunk(self) -> Any:
+        """
+        Returns the next chunk of the stream (blocking until it is read).
+
+        Raises:
+            StopIteration: At the end of the stream.
+            Exception: The error raised by the wrapped reader, if any.
+        """
+        if self._done:
+            raise StopIteration
+
+        item = self._queue.get()
+        if item is _END_OF_STREAM:
+            self._done = True
+            raise StopIteration
+        if isinstance(item, Exception):
+            self._done = True
+            raise item
+        return item
+
+    def cancel(self):
+        """
+        Stops the prefetch thread and cancels the wrapped reader.
+        """
+        self._done = True
+        self._finalizer()
+        self._thread.join(timeout=_JOIN_TIMEOUT_S)
+        if self._thread.is_alive():
+            log.warning("Prefetch thread did not exit in time.")
+        # Drop the chunks read ahead
+        while not self._queue.empty():
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
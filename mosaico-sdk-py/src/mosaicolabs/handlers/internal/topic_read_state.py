@@ -7,11 +7,39 @@ of an active PyArrow Flight stream reading session. It manages the underlying
 capabilities essential for the k-way merge logic used in `SequenceDataStreamer`.
 """
 
+from functools import lru_cache
+import numpy as np
+import pyarrow as pa
 import pyarrow.flight as fl
-from typing import Iterator, List, Optional, Type
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 import logging as log
 
-from mosaicolabs.models import Serializable
+from mosaicolabs.models import Message, Serializable
+from .prefetch_reader import _PrefetchReader
+
+
+@lru_cache(maxsize=128)
+def _schema_layout(schema: pa.Schema) -> Optional[Tuple[List[str], int]]:
+    """
+    Resolves the column names of a stream schema and the index of its timestamp.
+
+    Results are memoized per schema (pyarrow schemas are hashable and compare
+    by value), so that the streams of a same topic, or of topics sharing an
+    ontology, do not rebuild the names list and scan it on every open.
+    The returned list is shared across the read states: it must not be mutated.
+
+    Args:
+        schema (pa.Schema): The schema of the Flight stream.
+
+    Returns:
+        Optional[Tuple[List[str], int]]: The column names and the index of the
+            'timestamp_ns' column, or None if the schema has no such column.
+    """
+    names = schema.names
+    try:
+        return names, names.index("timestamp_ns")
+    except ValueError:
+        return None
 
 
 class _TopicReadState:
@@ -20,17 +48,39 @@ class _TopicReadState:
 
     **Key Responsibilities:**
     1.  **Batch Management**: Reads chunks (`FlightStreamChunk`) from the Flight stream.
-    2.  **Row Iteration**: Converts columnar batches into a row-wise iterator.
-    3.  **Peeking**: Maintains a "peek buffer" (`peeked_row`, `peeked_timestamp`) to allow
+    2.  **Row Iteration**: Converts each batch to Python rows in a single pyarrow
+        (C++) call, then walks them by index; the timestamps are read from a
+        zero-copy NumPy view of the timestamp column.
+    3.  **Peeking**: Maintains a "peek buffer" (`peeked_index`, `peeked_timestamp`) to allow
         the `SequenceDataStreamer` to inspect the next available timestamp without
         consuming the data, enabling time-ordered merging of multiple streams.
     """
 
+    # The merge loop reads these attributes for every row: slots make the
+    # accesses cheaper and drop the per-instance `__dict__`
+    __slots__ = (
+        "topic_name",
+        "reader",
+        "ontology_tag",
+        "message_builder",
+        "ontology_type",
+        "field_names",
+        "column_names",
+        "timestamp_index",
+        "_rows",
+        "_ts_array",
+        "_row_idx",
+        "_n_rows",
+        "_drained",
+        "peeked_index",
+        "peeked_timestamp",
+    )
+
     def __init__(
         self,
         topic_name: str,
         ontology_tag: str,
-        reader: Optional[fl.FlightStreamReader],
+        reader: Optional[Union[fl.FlightStreamReader, _PrefetchReader]],
     ):
         """
         Initializes the read state.
@@ -38,7 +88,8 @@ class _TopicReadState:
         Args:
             topic_name (str): The name of the topic.
             ontology_tag (str): The identifier for the ontology data type.
-            reader (Optional[fl.FlightStreamReader]): The active stream reader.
+            reader (Optional[Union[fl.FlightStreamReader, _PrefetchReader]]): The active
+                stream reader (possibly reading ahead).
 
         Raises:
             ValueError: If `reader` is None or if the schema lacks a 'timestamp' column.
@@ -47,9 +98,13 @@ class _TopicReadState:
             raise ValueError("Cannot initialize _TopicState: 'reader' is None.")
 
         self.topic_name: str = topic_name
-        self.reader: Optional[fl.FlightStreamReader] = reader
+        self.reader: Optional[Union[fl.FlightStreamReader, _PrefetchReader]] = reader
         self.ontology_tag: str = ontology_tag
 
+        # Constructor of the messages of `ontology_tag`, resolved by the
+        # streamer when the topic is opened (see `_message_builder`)
+        self.message_builder: Optional[Callable[[Dict[str, Any]], Message]] = None
+
         # Writer-specific fields (unused in reader context but kept for structure alignment)
         self.ontology_type: Optional[Type[Serializable]] = None
         self.field_names: Optional[List[str]] = None
@@ -58,70 +113,95 @@ class _TopicReadState:
         self.column_names: List[str] = []
         self.timestamp_index: int = -1
 
-        self.column_names = reader.schema.names
-        try:
-            self.timestamp_index = self.column_names.index("timestamp_ns")
-        except ValueError as e:
+        layout = _schema_layout(reader.schema)
+        if layout is None:
             raise ValueError(
                 f"Topic '{topic_name}' schema is missing the required 'timestamp_ns' column."
-            ) from e
+            )
+        self.column_names, self.timestamp_index = layout
 
         # --- Buffering & Iteration State ---
-        self.current_batch: Optional[fl.FlightStreamChunk] = None
+        # Current batch rows (as `{column_name: value}` dicts), its timestamp column
+        # (NumPy view over the Arrow buffer), the index of the next row to peek
+        # and the number of rows. The Flight chunk itself is not kept: once its
+        # rows are converted, only the timestamp column pins Arrow memory
+        self._rows: Optional[List[Dict[str, Any]]] = None
+        self._ts_array: Optional[np.ndarray] = None
+        self._row_idx: int = 0
+        self._n_rows: int = 0
 
-        # Iterator yields tuples of python objects: (value_col1, value_col2, ...)
-        self.row_iterator: Optional[Iterator] = None
+        # Set once the end of the stream is reached: no more `read_chunk` calls
+        self._drained: bool = False
 
-        # Peek Buffer: Stores the next row to be consumed
-        self.peeked_row: Optional[tuple] = None
+        # Peek Buffer: index (in the current batch) of the next row to be consumed
+        self.peeked_index: Optional[int] = None
 
         # Sentinel value: 'inf' indicates stream is empty or not yet started
         self.peeked_timestamp: float = float("inf")
 
+    def _reset_batch(self):
+        """Drops the references to the current batch data."""
+        self._rows = None
+        self._ts_array = None
+        self._row_idx = 0
+        self._n_rows = 0
+
     def _advance_to_next_batch(self) -> bool:
         """
-        Loads the next `RecordBatch` from the stream and resets the row iterator.
+        Loads the next `RecordBatch` from the stream and resets the row index.
+
+        Chunks with no rows (or no data, e.g. metadata-only messages) are
+        skipped: only the end of the stream marks it as drained.
 
         Returns:
             bool: True if a new batch was loaded; False if the stream is exhausted.
         """
-        if self.reader is None:
+        if self.reader is None or self._drained:
             return False
 
         try:
-            # Fetch next chunk from Flight
-            self.current_batch = self.reader.read_chunk()
-            current_batch = self.current_batch
+            # Fetch the next non-empty chunk from Flight
+            batch_data = self.reader.read_chunk().data
+            while batch_data is None or batch_data.num_rows == 0:
+                batch_data = self.reader.read_chunk().data
 
-            if current_batch.data is None or current_batch.data.num_rows == 0:
-                self.row_iterator = None
-                return False
-
-            # Efficiently transpose columnar data to row iterator
-            # columns = [col_array_1, col_array_2, ...]
-            columns = [
-                current_batch.data.column(i)
-                for i in range(current_batch.data.num_columns)
-            ]
-            self.row_iterator = iter(zip(*columns))
+            ts_column = batch_data.column(self.timestamp_index)
+            try:
+                # int64 view over the Arrow buffer, no copy
+                ts_array = ts_column.to_numpy(zero_copy_only=True)
+            except pa.ArrowInvalid:
+                # e.g. the column has nulls: a copy is required
+                ts_array = ts_column.to_numpy(zero_copy_only=False)
+
+            # Columnar -> row conversion, done once per batch by pyarrow
+            self._rows = batch_data.to_pylist()
+            self._ts_array = ts_array
+            self._row_idx = 0
+            self._n_rows = batch_data.num_rows
             return True
 
         except StopIteration:
             # Normal end of stream
-            self.row_iterator = None
+            self._reset_batch()
+            self._drained = True
             return False
         except Exception:
             # Unexpected error
-            self.row_iterator = None
+            self._reset_batch()
             raise
 
     def peek_next_row(self) -> bool:
         """
-        Populates `self.peeked_row` with the next available data point.
+        Populates the peek buffer (`peeked_index`, `peeked_timestamp`) with the
+        next available data point.
 
         This method handles the transition between batches automatically. If the
-        current batch iterator is exhausted, it calls `_advance_to_next_batch()`
-        recursively until data is found or the stream ends.
+        current batch is exhausted, it calls `_advance_to_next_batch()` until
+        data is found or the stream ends.
+
+        Once the stream is drained, this is a plain flag check: exhausted topics
+        are peeked at every step of the k-way merge, and must not hit the reader
+        (and its end-of-stream `StopIteration`) each time.
 
         Returns:
             bool: True if a row is available; False if the stream is fully exhausted.
@@ -129,42 +209,47 @@ class _TopicReadState:
         if self.reader is None:
             return False
 
-        while True:
-            # Ensure we have an active batch iterator
-            if self.row_iterator is None:
-                if not self._advance_to_next_batch():
-                    # End of Stream reached
-                    self.peeked_row = None
-                    self.peeked_timestamp = float("inf")
-                    return False
+        try:
+            # Load a new batch when the current one is exhausted (or missing)
+            if self._row_idx >= self._n_rows and not self._advance_to_next_batch():
+                # End of Stream reached
+                self._set_exhausted()
+                return False
 
-            try:
-                assert self.row_iterator is not None
-
-                # Get next row from current batch
-                row_values = next(self.row_iterator)
-
-                # Extract timestamp for sorting logic
-                timestamp_ns = row_values[self.timestamp_index].as_py()
-
-                # Update state
-                self.peeked_row = row_values
-                self.peeked_timestamp = timestamp_ns
-                return True
-
-            except StopIteration:
-                # Current batch finished; loop back to try loading the next batch
-                if self._advance_to_next_batch():
-                    continue
-                else:
-                    # Stream finished after last batch
-                    self.peeked_row = None
-                    self.peeked_timestamp = float("inf")
-                    return False
-            except Exception:
-                self.peeked_row = None
-                self.peeked_timestamp = float("inf")
-                raise
+            assert self._ts_array is not None
+
+            # Only the timestamp is extracted here, for the sorting logic
+            ts = self._ts_array[self._row_idx]
+            self.peeked_index = self._row_idx
+            self.peeked_timestamp = int(ts)
+            self._row_idx += 1
+            return True
+
+        except Exception:
+            self._set_exhausted()
+            raise
+
+    def _set_exhausted(self):
+        """Empties the peek buffer (end of stream or error)."""
+        self.peeked_index = None
+        self.peeked_timestamp = float("inf")
+
+    def pop_peeked_row(self) -> Optional[Dict[str, Any]]:
+        """
+        Returns the peeked row (as Python objects), then advances the peek buffer.
+
+        Returns:
+            Optional[Dict[str, Any]]: The row as a `{column_name: value}` dictionary,
+                                      or None if no row is peeked.
+        """
+        if self.peeked_index is None or self._rows is None:
+            return None
+
+        row_dict = self._rows[self.peeked_index]
+
+        # Advance the buffer immediately *after* extracting the data
+        self.peek_next_row()
+        return row_dict
 
     def close(self, with_error: bool = False):
         """
@@ -174,6 +259,6 @@ class _TopicReadState:
             try:
                 self.reader.cancel()
             except Exception as e:
-                log.warning(f"Error canceling FlightStreamReader: {e}")
+                log.warning("Error canceling FlightStreamReader: %s", e)
             finally:
                 self.reader = None
@@ -6,21 +6,21 @@ logic for a single topic. It implements an asynchronous pipeline with backpressu
 to optimize throughput while preventing memory exhaustion.
 """
 
-from collections import defaultdict
 from enum import Enum
 from mosaicolabs.models.message import Message
+import numpy as np
 import pyarrow.flight as fl
 import pyarrow as pa
-import pyarrow.ipc as pa_ipc
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, Union
 import logging as log
 
-from concurrent.futures import ThreadPoolExecutor, Future, wait
-from threading import BoundedSemaphore, Lock
+from concurrent.futures import ThreadPoolExecutor
+from threading import BoundedSemaphore
 
 from mosaicolabs.models import Serializable
+from mosaicolabs.helpers.helpers import encode_to_dict
 from mosaicolabs.enum import SerializationFormat
-from ...comm.connection import PYARROW_OUT_OF_RANGE_BYTES
+from ...comm.connection import PYARROW_OUT_OF_RANGE_BYTES, _estimated_ipc_size
 
 
 class _UploadMode(Enum):
@@ -38,13 +38,46 @@ _SERIALIZATION_FORMAT_TO_UPLOAD_MODE = {
 }
 
 
-def _encode_messages(objs: list[Message]):
-    """Helper to pivot a list of Message objects into a columnar dictionary."""
-    result = defaultdict(list)
-    for obj in objs:
-        for k, v in obj.encode().items():
-            result[k].append(v)
-    return dict(result)
+# Largest values buffer addressable by the int32 offsets of `pa.binary()`
+_MAX_BINARY_BUFFER_BYTES = np.iinfo(np.int32).max
+
+
+def _binary_array(values: List[Any], dtype: pa.DataType) -> Optional[pa.Array]:
+    """
+    Builds a binary Arrow array from its offsets and values buffers.
+
+    The payloads are joined into a single contiguous buffer (one copy, with no
+    builder reallocation) which Arrow wraps without copying, together with the
+    offsets computed by NumPy.
+
+    Args:
+        values (List[Any]): The column values.
+        dtype (pa.DataType): The column type (`pa.binary()` or `pa.large_binary()`).
+
+    Returns:
+        Optional[pa.Array]: The array, or None if the values are not all bytes-like
+            (e.g. nulls) or overflow `dtype`: callers then use `pa.array`.
+    """
+    if not all(isinstance(v, (bytes, bytearray, memoryview)) for v in values):
+        return None
+
+    lengths = np.fromiter(
+        (memoryview(v).nbytes for v in values), dtype=np.int64, count=len(values)
+    )
+    offsets = np.zeros(len(values) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+
+    if pa.types.is_binary(dtype):
+        if offsets[-1] > _MAX_BINARY_BUFFER_BYTES:
+            return None
+        offsets = offsets.astype(np.int32)
+
+    # The only copy of the payloads: for large `bytes` items, CPython performs
+    # it with the GIL released, so the producer thread is not stalled meanwhile
+    data = b"".join(values)
+    return pa.Array.from_buffers(
+        dtype, len(values), [None, pa.py_buffer(offsets), pa.py_buffer(data)]
+    )
 
 
 class _TopicWriteState:
@@ -52,13 +85,20 @@ class _TopicWriteState:
     Manages the write buffer and async dispatch for a single topic.
 
     **Architecture:**
-    1.  **Buffering**: Accumulates `Message` objects in `_current_data_batch`.
+    1.  **Buffering**: Accumulates the `Message` fields column-wise, in `_col_buffers`
+        (the single-row batches built to measure records are kept as they are).
         -   Uses **Bytes Mode** for heavy data (Images) to respect Flight chunk limits.
         -   Uses **Count Mode** for light data (IMU, Odometry) for efficiency.
     2.  **Async Dispatch**: Offloads serialization and network I/O to a `ThreadPoolExecutor`.
+        Threads (rather than processes) are used on purpose: the Flight writer
+        lives in this process, the binary columns are built by Arrow without
+        holding the GIL, and moving the messages to another process would
+        cost a pickle round-trip larger than the encoding itself.
     3.  **Backpressure**: Uses a `BoundedSemaphore` to limit the number of pending
         async tasks. If the network is slower than the data producer, `push_record()`
         will eventually block, naturally throttling the application.
+        The per-topic limit can be combined with a semaphore shared by all the
+        topics of a sequence, which bounds the overall pipeline depth.
     """
 
     def __init__(
@@ -69,6 +109,7 @@ class _TopicWriteState:
         executor: Optional[ThreadPoolExecutor] = None,
         max_batch_size_bytes: Optional[int] = None,
         max_batch_size_records: Optional[int] = None,
+        backpressure_sem: Optional[BoundedSemaphore] = None,
     ):
         """
         Initializes the write state.
@@ -80,6 +121,8 @@ class _TopicWriteState:
             executor (Optional[ThreadPoolExecutor]): Executor for async operations.
             max_batch_size_bytes (Optional[int]): flush threshold for byte mode.
             max_batch_size_records (Optional[int]): flush threshold for count mode.
+            backpressure_sem (Optional[BoundedSemaphore]): Semaphore shared with the
+                other topics of the sequence, bounding their total pending batches.
         """
         if writer is None:
             raise ValueError("Cannot initialize _TopicState: 'writer' is None.")
@@ -93,32 +136,83 @@ class _TopicWriteState:
                 f"'max_batch_size_bytes' must be strictly less than 90% of max allowable limit {PYARROW_OUT_OF_RANGE_BYTES}."
             )
 
-        self.topic_name: str = topic_name
-        self.writer: Optional[fl.FlightStreamWriter] = writer
-        self.ontology_tag: str = ontology_tag
-        self.executor: Optional[ThreadPoolExecutor] = executor
-        self.max_batch_size_bytes = max_batch_size_bytes
-        self.max_batch_size_records = max_batch_size_records
+        if max_batch_size_bytes is None or max_batch_size_records is None:
+            raise RuntimeError(
+                "'max_batch_size_bytes' AND 'max_batch_size_records' must be provided."
+            )
 
         # Resolve Ontology Class for serialization schema
-        self.ontology_type = Serializable.get_class_type(ontology_tag)
-        if self.ontology_type is None:
+        ontology_type = Serializable.get_class_type(ontology_tag)
+        if ontology_type is None:
             raise RuntimeError(
                 f"Ontology class for tag '{ontology_tag}' not registered in Message."
             )
 
-        if self.max_batch_size_bytes is None or self.max_batch_size_records is None:
-            raise RuntimeError(
-                "'max_batch_size_bytes' AND 'max_batch_size_records' must be provided."
-            )
+        # Validated once here: the push path does not re-check these attributes
+        # (only `writer` becomes None, on close, and is checked per push)
+        self.topic_name: str = topic_name
+        self.writer: Optional[fl.FlightStreamWriter] = writer
+        self.ontology_tag: str = ontology_tag
+        self.executor: Optional[ThreadPoolExecutor] = executor
+        self.max_batch_size_bytes: int = max_batch_size_bytes
+        self.max_batch_size_records: int = max_batch_size_records
+        self.ontology_type: Type[Serializable] = ontology_type
+
+        # Stream schema and its per-column names/types, resolved once
+        self._schema: pa.Schema = Message.get_schema(self.ontology_type)
+        self._field_names: List[str] = self._schema.names
+        self._field_types: List[pa.DataType] = self._schema.types
+
+        # Columns of nested types (structs, lists), whose values may be models
+        # to be encoded into plain Python structures before the Arrow conversion
+        self._nested_columns = frozenset(
+            name
+            for name, dtype in zip(self._field_names, self._field_types)
+            if pa.types.is_nested(dtype)
+        )
 
         # --- Buffering State ---
-        self._current_data_batch: List[Message] = []
+        # Records are buffered column-wise (one list per field, filled on push),
+        # so that flushing needs no row -> column pivot
+        self._envelope_keys: List[str] = [
+            name for name in Message.model_fields if name != "data"
+        ]
+        self._payload_keys: List[str] = list(self.ontology_type.model_fields)
+        self._col_buffers: Dict[str, List[Any]] = self._new_col_buffers()
+        self._cols_len: int = 0
+        # Sealed parts of the current batch, in push order: column buffers, or
+        # the single-row RecordBatches already built to measure a record
+        self._segments: List[Union[Dict[str, List[Any]], pa.RecordBatch]] = []
+        self._batch_len: int = 0
         self._current_batch_size_bytes: int = 0
 
+        # Binary payload fields of the ontology (e.g. image data): when present,
+        # they are the only part of a record whose size varies significantly
+        self._binary_fields: List[str] = [
+            field.name
+            for field in self.ontology_type.__msco_pyarrow_struct__
+            if pa.types.is_binary(field.type) or pa.types.is_large_binary(field.type)
+        ]
+
+        # Buffering strategy of the topic: an ontology has a single serialization
+        # format, so it is resolved once rather than on every push
+        if (
+            _SERIALIZATION_FORMAT_TO_UPLOAD_MODE.get(
+                self.ontology_type.__serialization_format__
+            )
+            == _UploadMode.Bytes
+        ):
+            self._push_impl = self._push_by_bytes_size
+        else:
+            self._push_impl = self._push_by_count
+
+        # Bytes a record adds to its batch beyond its variable size (see
+        # `_get_variable_size`): calibrated on the first record
+        self._per_row_overhead: Optional[int] = None
+
         # --- Async & Backpressure State ---
-        self._pending_writes: List[Future] = []
-        self._pending_writes_lock = Lock()
+        # First error raised by an async write task, reported on drain
+        self._first_error: Optional[BaseException] = None
         self._written_records = 0
         self._pushed_records = 0
 
@@ -128,47 +222,183 @@ class _TopicWriteState:
         # Use BoundedSemaphore to manage shared I/O writing channel.
         # Waiting (blocking) mechanism when length of pending batches is more than limit
         self._pending_sem = BoundedSemaphore(self.max_pending_batches)
+        # Shared (sequence-wide) limit, taken after the per-topic one: a topic
+        # cannot hold more than `max_pending_batches` of the shared slots
+        self._shared_sem: Optional[BoundedSemaphore] = backpressure_sem
+
+    def _new_col_buffers(self) -> Dict[str, List[Any]]:
+        """Returns empty column buffers, one per envelope and payload field."""
+        return {name: [] for name in (*self._envelope_keys, *self._payload_keys)}
+
+    def _buffer_record(self, msg: Message):
+        """Appends the (raw) field values of a message to the column buffers."""
+        buffers = self._col_buffers
+        for name in self._envelope_keys:
+            buffers[name].append(getattr(msg, name))
+        data = msg.data
+        for name in self._payload_keys:
+            buffers[name].append(getattr(data, name))
+        self._cols_len += 1
+        self._batch_len += 1
+
+    def _buffer_row_batch(self, batch: pa.RecordBatch):
+        """
+        Appends an already built (single-row) RecordBatch to the current batch.
+
+        The records buffered column-wise so far are sealed first, to keep the
+        push order; the batch is then reused as is at flush time.
+        """
+        if self._cols_len:
+            self._segments.append(self._col_buffers)
+            self._col_buffers = self._new_col_buffers()
+            self._cols_len = 0
+        self._segments.append(batch)
+        self._batch_len += 1
 
     def _get_record_batch(self, msgs: List[Message]) -> pa.RecordBatch:
         """
-        [CPU Bound] Converts Python objects to Arrow RecordBatch.
+        [CPU Bound] Converts a list of messages to an Arrow RecordBatch.
+        """
+        return self._build_record_batch(Message.encode_batch(msgs))
+
+    def _get_buffered_record_batch(
+        self, buffers: Dict[str, List[Any]]
+    ) -> pa.RecordBatch:
+        """
+        [CPU Bound] Converts column buffers (see `_buffer_record`) to an Arrow RecordBatch.
         Runs in worker thread during async mode.
         """
-        if self.writer is None:
-            raise ValueError("Writer is None")
-        assert self.ontology_type is not None
+        columns = {
+            name: (
+                [encode_to_dict(value) for value in values]
+                if name in self._nested_columns
+                else values
+            )
+            for name, values in buffers.items()
+        }
+        return self._build_record_batch(columns)
 
-        return pa.RecordBatch.from_pydict(
-            _encode_messages(msgs),
-            schema=Message.get_schema(self.ontology_type),
-        )
+    def _get_segments_record_batch(
+        self, segments: List[Union[Dict[str, List[Any]], pa.RecordBatch]]
+    ) -> pa.RecordBatch:
+        """
+        [CPU Bound] Assembles the RecordBatch of a flush from its segments.
+        Runs in worker thread during async mode.
+
+        Args:
+            segments (List[Union[Dict[str, List[Any]], pa.RecordBatch]]): Column
+                buffers (see `_buffer_record`) and prebuilt batches, in push order.
+
+        Returns:
+            pa.RecordBatch: The batch, with the stream schema.
+        """
+        batches = [
+            (
+                segment
+                if isinstance(segment, pa.RecordBatch)
+                else self._get_buffered_record_batch(segment)
+            )
+            for segment in segments
+        ]
+        if len(batches) == 1:
+            return batches[0]
+        return pa.concat_batches(batches)
+
+    def _build_record_batch(self, columns: Dict[str, List[Any]]) -> pa.RecordBatch:
+        """
+        Builds the RecordBatch of the stream from encoded columns.
+
+        Args:
+            columns (Dict[str, List[Any]]): The `{column_name: values}` dictionary.
+
+        Returns:
+            pa.RecordBatch: The batch, with the stream schema.
+        """
+        # Typed per-column conversion: no schema reconciliation on each flush
+        arrays = []
+        for name, dtype in zip(self._field_names, self._field_types):
+            array = None
+            if pa.types.is_binary(dtype) or pa.types.is_large_binary(dtype):
+                # e.g. image payloads: skip the per-value builder appends
+                array = _binary_array(columns[name], dtype)
+            if array is None:
+                array = pa.array(columns[name], type=dtype)
+            arrays.append(array)
+        return pa.RecordBatch.from_arrays(arrays, schema=self._schema)
 
     def _get_serialized_size(self, batch: pa.RecordBatch) -> int:
         """
         Calculates exact serialized size of a RecordBatch in Arrow IPC format.
-        
+
         Uses PyArrow's native C++ implementation for optimal performance.
         This method is significantly faster than full serialization and provides
         accurate size for Flight transmission limits.
-        
+
         Note: Returns batch size only (excludes schema message overhead).
         """
-        return pa_ipc.get_record_batch_size(batch)
+        return _estimated_ipc_size(batch)
+
+    def _get_record_size(self, msg: Message) -> int:
+        """
+        Returns the (estimated) serialized size of a single record.
+
+        The first record is measured on an actual single-row RecordBatch, which
+        calibrates `_per_row_overhead`; the following ones are estimated from
+        the Python objects (`_get_variable_size`), without building any Arrow
+        data. Records that cannot be estimated are always measured.
+        """
+        return self._measure_record(msg)[0]
+
+    def _measure_record(self, msg: Message) -> Tuple[int, Optional[pa.RecordBatch]]:
+        """
+        Same as `_get_record_size`, also returning the single-row RecordBatch
+        built for the measure, if any, so that it is not built again on flush.
+
+        Returns:
+            Tuple[int, Optional[pa.RecordBatch]]: The record size, and its batch
+                (None if the size was estimated).
+        """
+        variable = self._get_variable_size(msg)
+        if variable is not None and self._per_row_overhead is not None:
+            return variable + self._per_row_overhead, None
+
+        batch = self._get_record_batch([msg])
+        size = self._get_serialized_size(batch)
+        if variable is not None:
+            self._per_row_overhead = max(size - variable, 0)
+        return size, batch
+
+    def _get_variable_size(self, msg: Message) -> Optional[int]:
+        """
+        Returns the part of a record size which is not constant across records.
+
+        For ontologies with binary payload fields this is just their length: the
+        other fields are deemed constant (their variations, e.g. of short strings,
+        are negligible against the per-row overhead, which also counts the batch
+        metadata). Otherwise the whole record is estimated
+        (`Message.estimated_ipc_size`).
+        """
+        if not self._binary_fields:
+            return msg.estimated_ipc_size()
+
+        data = msg.data
+        size = 0
+        for name in self._binary_fields:
+            value = getattr(data, name)
+            if value is not None:
+                size += len(value)
+        return size
 
     def _push_by_bytes_size(self, msg: Message):
         """
         Buffer logic for Byte-Mode topics (e.g., Images).
 
-        1. Serializes the *single* new record to check its size.
+        1. Estimates the size of the *single* new record.
         2. If adding it exceeds `max_batch_size_bytes`, flushes current buffer.
         3. Adds record to new buffer.
         """
-        assert self.writer is not None
-        assert self.max_batch_size_bytes is not None
-
-        # Measure size of the new message
-        single_record_batch = self._get_record_batch([msg])
-        single_record_size = self._get_serialized_size(single_record_batch)
+        # Measure size of the new message (keeping its batch, if one was built)
+        single_record_size, single_record_batch = self._measure_record(msg)
 
         # TODO: Try finding solutions for the case in which the single record
         # is beyond pyarrow transmission limits! Log for now.
@@ -185,112 +415,128 @@ class _TopicWriteState:
 
         if projected_size > self.max_batch_size_bytes:
             # Flush existing data
-            if self._current_data_batch:
+            if self._batch_len:
                 self._write_current_batch()
 
             # Handle edge case: Single record > Preferred batch size
             # It will be added as a batch of 1.
-
-            self._current_data_batch = [msg]
             self._current_batch_size_bytes = single_record_size
         else:
-            self._current_data_batch.append(msg)
             self._current_batch_size_bytes += single_record_size
 
+        if single_record_batch is not None:
+            self._buffer_row_batch(single_record_batch)
+        else:
+            self._buffer_record(msg)
+
     def _push_by_count(self, msg: Message):
         """
         Buffer logic for Count-Mode topics.
 
         Simply counts records and flushes when `max_batch_size_records` is reached.
         """
-        assert self.writer is not None
-        assert self.max_batch_size_records is not None
-
-        self._current_data_batch.append(msg)
+        self._buffer_record(msg)
 
-        if len(self._current_data_batch) >= self.max_batch_size_records:
+        if self._batch_len >= self.max_batch_size_records:
             self._write_current_batch()
 
     def push_record(self, msg: Message):
         """
         Adds a record to the buffer.
 
-        Automatically delegates to `_push_by_bytes_size` or `_push_by_count`
-        based on the ontology type defined in the message.
+        Delegates to `_push_by_bytes_size` or `_push_by_count`, based on the
+        serialization format of the topic ontology (resolved at init).
         """
         if self.writer is None:
             raise ValueError("write() called on uninitialized state.")
 
-        mode = _SERIALIZATION_FORMAT_TO_UPLOAD_MODE.get(
-            msg.data.__serialization_format__
-        )
+        self._push_impl(msg)
+        self._pushed_records += 1
 
-        if mode == _UploadMode.Bytes:
-            self._push_by_bytes_size(msg)
-        else:
-            self._push_by_count(msg)
+    def push_records(self, msgs: Iterable[Message]):
+        """
+        Adds several records to the buffer, in order.
 
-        self._pushed_records += 1
+        Same as calling `push_record` for each message (the batches are flushed
+        at the same thresholds), with the state check and the strategy lookup
+        done once for the whole burst.
+        """
+        if self.writer is None:
+            raise ValueError("write() called on uninitialized state.")
+
+        push_impl = self._push_impl
+        n_pushed = 0
+        try:
+            for msg in msgs:
+                push_impl(msg)
+                n_pushed += 1
+        finally:
+            self._pushed_records += n_pushed
 
-    def _submit_write_task(self, msgs_to_write: List[Message]):
+    def _submit_write_task(
+        self,
+        writer: fl.FlightStreamWriter,
+        segments: List[Union[Dict[str, List[Any]], pa.RecordBatch]],
+        n_records: int,
+    ):
         """
         Dispatches the write operation to the executor.
 
         **Backpressure Logic:**
         Calls `self._pending_sem.acquire()`. If 3 tasks are already pending,
         this call BLOCKS, pausing the main thread until a worker finishes.
+        The same applies to the shared semaphore, if any, when the whole
+        sequence reached its limit of pending batches.
+
+        The `writer` is checked by the caller, and held by the task: closing the
+        state waits for the pending tasks before releasing it.
         """
-        if self.writer is None:
-            log.error(
-                f"Cannot write batch for topic '{self.topic_name}'. Writer is None."
-            )
-            return
 
         # Worker Function
-        def full_write_task(records, topic_name, sem: Optional[BoundedSemaphore]):
+        def full_write_task(records, topic_name, is_async: bool):
             try:
                 # Serialization (CPU)
-                batch = self._get_record_batch(records)
-                # Transmission (IO)
-                assert self.writer is not None
-                self.writer.write(batch)
+                batch = self._get_segments_record_batch(records)
+                # Transmission (IO): one IPC message per flush. Batches are not
+                # coalesced into fewer, larger writes: all the ontologies upload
+                # in Bytes mode, so a flushed batch already fills up to
+                # `max_batch_size_bytes`, close to the Flight message limit
+                # (`write_table` would not help either: it writes one message
+                # per table chunk)
+                writer.write(batch)
             except Exception as e:
                 log.error(f"Async write failed for topic '{topic_name}': {e}")
+                if self._first_error is None:
+                    self._first_error = e
             finally:
-                # Release Semaphore (Unblock main thread, if blocked)
-                if sem:
-                    sem.release()
+                if is_async:
+                    # Release Semaphores (Unblock main thread, if blocked)
+                    if self._shared_sem is not None:
+                        self._shared_sem.release()
+                    self._pending_sem.release()
 
         if self.executor is not None:
             # Backpressure Gate
             # Attempt to acquire a slot. If the queue is full (max_pending_batches reached),
             # this call blocks the main thread, effectively throttling the data producer.
             self._pending_sem.acquire()
+            if self._shared_sem is not None:
+                self._shared_sem.acquire()
 
-            future = self.executor.submit(
-                full_write_task, msgs_to_write, self.topic_name, self._pending_sem
-            )
-
-            # Resource Management
-            # Define a callback to automatically remove the future from the tracking list
-            # once execution completes, preventing infinite list growth.
-            def cleanup_callback(fut):
-                with self._pending_writes_lock:
-                    try:
-                        self._pending_writes.remove(fut)
-                    except ValueError:
-                        pass  # Future already removed
-
-            future.add_done_callback(cleanup_callback)
-
-            with self._pending_writes_lock:
-                self._pending_writes.append(future)
+            try:
+                self.executor.submit(full_write_task, segments, self.topic_name, True)
+            except Exception:
+                # Not scheduled (e.g. executor shut down): give the slots back
+                if self._shared_sem is not None:
+                    self._shared_sem.release()
+                self._pending_sem.release()
+                raise
 
         else:
             # Sync Path: Run immediately on main thread
-            full_write_task(msgs_to_write, self.topic_name, None)
+            full_write_task(segments, self.topic_name, False)
 
-        self._written_records += len(msgs_to_write)
+        self._written_records += n_records
 
     def _write_current_batch(self):
         """
@@ -299,14 +545,19 @@ class _TopicWriteState:
         if self.writer is None:
             raise ValueError("Writer is None")
 
-        if self._current_data_batch:
-            records = self._current_data_batch
+        if self._batch_len:
+            segments, n_records = self._segments, self._batch_len
+            if self._cols_len:
+                segments.append(self._col_buffers)
 
             # Reset immediately
-            self._current_data_batch = []
+            self._col_buffers = self._new_col_buffers()
+            self._cols_len = 0
+            self._segments = []
+            self._batch_len = 0
             self._current_batch_size_bytes = 0
 
-            self._submit_write_task(records)
+            self._submit_write_task(self.writer, segments, n_records)
 
     def _wait_for_pending_writes(self):
         """
@@ -317,16 +568,17 @@ class _TopicWriteState:
                 f"Waiting for pending writes termination, for topic {self.topic_name}..."
             )
 
-            with self._pending_writes_lock:
-                futures = list(self._pending_writes)
-
-            if futures:
-                wait(futures)
+            # The backpressure semaphore doubles as the drain signal: each pending
+            # task holds one of its slots, so they are all done once every slot
+            # is taken (no task is submitted meanwhile: this is the producer side)
+            for _ in range(self.max_pending_batches):
+                self._pending_sem.acquire()
+            for _ in range(self.max_pending_batches):
+                self._pending_sem.release()
 
             # Check for silent failures
-            for f in futures:
-                if f.exception():
-                    log.error(f"Async write error: {f.exception()}")
+            if self._first_error is not None:
+                log.error(f"Async write error: {self._first_error}")
 
     def close(self, with_error: bool = False):
         """
@@ -156,12 +156,22 @@ class SequenceHandler:
         """Returns the full Sequence model."""
         return self._sequence
 
-    def get_data_streamer(self, force_new_instance=False) -> SequenceDataStreamer:
+    def get_data_streamer(
+        self,
+        force_new_instance=False,
+        prefetch_depth: int = 0,
+        max_batch_rows: Optional[int] = None,
+    ) -> SequenceDataStreamer:
         """
         Get a `SequenceDataStreamer` to read the entire sequence (merged stream).
 
         Args:
             force_new_instance (bool): If True, forces creation of a new reader.
+            prefetch_depth (int): The number of batches read ahead, per topic, by a
+                background thread, for a new reader (default = 0, no read-ahead).
+            max_batch_rows (Optional[int]): The max number of rows per batch requested
+                to the server, per topic, for a new reader (default = None,
+                server-chosen).
 
         Returns:
             SequenceDataStreamer: The unified reader.
@@ -172,7 +182,10 @@ class SequenceHandler:
 
         if self._data_streamer_instance is None:
             self._data_streamer_instance = SequenceDataStreamer.connect(
-                self._sequence.name, self._fl_client
+                self._sequence.name,
+                self._fl_client,
+                prefetch_depth=prefetch_depth,
+                max_batch_rows=max_batch_rows,
             )
         return self._data_streamer_instance
 
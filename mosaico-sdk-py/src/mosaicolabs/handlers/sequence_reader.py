@@ -5,14 +5,19 @@ This module provides the `SequenceDataStreamer`, which reads an entire sequence
 by merging multiple topic streams into a single, time-ordered iterator.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+import heapq
 from mosaicolabs.models.message import Message
 import pyarrow.flight as fl
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Tuple
 import logging as log
 
 from .internal.topic_read_state import _TopicReadState
 from .topic_reader import TopicDataStreamer
 
+# Upper bound on the topic streams (DoGet) opened concurrently by `connect`
+_MAX_CONCURRENT_DO_GET = 16
+
 
 class SequenceDataStreamer:
     """
@@ -25,6 +30,9 @@ class SequenceDataStreamer:
     2. Selects the topic with the lowest timestamp.
     3. Yields that record and advances that specific topic's stream.
 
+    The peeked timestamps of the active topics are kept in a min-heap, so that
+    steps 1-2 cost O(log T) per record (for T topics) instead of a full scan.
+
     This ensures that data is yielded in correct chronological order, even if
     the topics were recorded at different rates.
     """
@@ -34,6 +42,15 @@ class SequenceDataStreamer:
     _topic_readers: Dict[str, TopicDataStreamer] = {}
     _winning_rdstate: Optional[_TopicReadState] = None
 
+    _rdstates: List[_TopicReadState]
+    """The read states of the topics (indexed by the heap entries)."""
+
+    _heap: List[Tuple[int, int]]
+    """Min-heap of `(next timestamp, read state index)` of the active topics."""
+
+    _primed: bool = False
+    """Whether the first row of every topic has been peeked."""
+
     def __init__(
         self,
         sequence_name: str,
@@ -49,17 +66,35 @@ class SequenceDataStreamer:
         self._fl_client = client
         self._topic_readers = topic_readers
 
+        self._rdstates = [treader._rdstate for treader in topic_readers.values()]
+        self._heap = []
+        self._primed = False
+
     @classmethod
-    def connect(cls, sequence_name: str, client: fl.FlightClient):
+    def connect(
+        cls,
+        sequence_name: str,
+        client: fl.FlightClient,
+        prefetch_depth: int = 0,
+        max_batch_rows: Optional[int] = None,
+    ):
         """
         Factory method to initialize the Sequence reader.
 
         Queries the server for all endpoints associated with the sequence and
         opens a `TopicDataStreamer` for each one.
 
+        The streams are opened concurrently (each `do_get` waits for the schema
+        message of its topic), over the same multiplexed client: the startup
+        latency is bound by the slowest topic, not by the sum of all of them.
+
         Args:
             sequence_name (str): The sequence to read.
             client (fl.FlightClient): Connected client.
+            prefetch_depth (int): The number of batches read ahead, per topic, by a
+                background thread (default = 0, no read-ahead).
+            max_batch_rows (Optional[int]): The max number of rows per batch requested
+                to the server, per topic (default = None, the server picks it).
 
         Returns:
             SequenceDataStreamer: The initialized merger.
@@ -67,12 +102,40 @@ class SequenceDataStreamer:
         descriptor = fl.FlightDescriptor.for_path(sequence_name)
         flight_info = client.get_flight_info(descriptor)
 
+        endpoints = flight_info.endpoints
         topic_readers: Dict[str, TopicDataStreamer] = {}
 
-        # Create a reader for each endpoint (topic)
-        for ep in flight_info.endpoints:
-            treader = TopicDataStreamer.connect(client=client, ticket=ep.ticket)
-            topic_readers[treader.name()] = treader
+        if endpoints:
+            # Create a reader for each endpoint (topic)
+            with ThreadPoolExecutor(
+                max_workers=min(len(endpoints), _MAX_CONCURRENT_DO_GET)
+            ) as connector:
+                futures = [
+                    connector.submit(
+                        TopicDataStreamer.connect,
+                        client=client,
+                        ticket=ep.ticket,
+                        prefetch_depth=prefetch_depth,
+                        max_batch_rows=max_batch_rows,
+                    )
+                    for ep in endpoints
+                ]
+
+            # Keep the endpoints order (it breaks the timestamp ties of the merge)
+            first_error: Optional[BaseException] = None
+            for fut in futures:
+                err = fut.exception()
+                if err is not None:
+                    first_error = first_error or err
+                    continue
+                treader = fut.result()
+                topic_readers[treader.name()] = treader
+
+            if first_error is not None:
+                # Do not leak the streams already opened
+                for treader in topic_readers.values():
+                    treader.close()
+                raise first_error
 
         if not topic_readers:
             raise RuntimeError(
@@ -88,11 +151,27 @@ class SequenceDataStreamer:
         Initializes the K-Way merge by pre-loading (peeking) the first row
         of every topic.
         """
-        for treader in self._topic_readers.values():
-            if treader._rdstate.peeked_row is None:
-                treader._rdstate.peek_next_row()
+        self._prime()
         return self
 
+    def _prime(self):
+        """
+        Peeks the first row of every topic and builds the heap, once.
+
+        Afterwards, the heap is updated by `__next__` (a consumed row is replaced
+        by the next one of its stream; exhausted streams leave the heap).
+        """
+        if self._primed:
+            return
+        for idx, rdstate in enumerate(self._rdstates):
+            if rdstate.peeked_index is None:
+                rdstate.peek_next_row()
+            if rdstate.peeked_index is not None:
+                # The index breaks timestamp ties (first topic first)
+                self._heap.append((rdstate.peeked_timestamp, idx))
+        heapq.heapify(self._heap)
+        self._primed = True
+
     def next(self) -> Optional[tuple[str, Message]]:
         """
         Returns the next time-ordered record or None if finished.
@@ -111,20 +190,12 @@ class SequenceDataStreamer:
             The minimum timestamp (float) found across all active topics, or None
             if all streams are exhausted.
         """
-        min_tstamp: float = float("inf")
-
-        for treader in self._topic_readers.values():
-            if treader._rdstate.peeked_row is None:
-                treader._rdstate.peek_next_row()
+        self._prime()
 
-            # Compare current topic's next timestamp against global min
-            if treader._rdstate.peeked_timestamp < min_tstamp:
-                min_tstamp = treader._rdstate.peeked_timestamp
-
-        if min_tstamp == float("inf"):
+        if not self._heap:
             return None
 
-        return min_tstamp
+        return self._heap[0][0]
 
     def __next__(self) -> tuple[str, Message]:
         """
@@ -136,38 +207,33 @@ class SequenceDataStreamer:
         Raises:
             StopIteration: If all underlying topic streams are exhausted.
         """
-        min_tstamp: float = float("inf")
-        topic_min_tstamp: Optional[str] = None
         self._winning_rdstate = None
-
-        # Identify the "Winner" (Topic with lowest timestamp)
-        for topic_name, treader in self._topic_readers.items():
-            if treader._rdstate.peeked_row is None:
-                treader._rdstate.peek_next_row()
-
-            if treader._rdstate.peeked_timestamp < min_tstamp:
-                min_tstamp = treader._rdstate.peeked_timestamp
-                topic_min_tstamp = topic_name
+        self._prime()
 
         # Check termination condition
-        if topic_min_tstamp is None or min_tstamp == float("inf"):
+        if not self._heap:
             raise StopIteration
 
-        # Retrieve data from Winner
-        self._winning_rdstate = self._topic_readers[topic_min_tstamp]._rdstate
-        assert self._winning_rdstate.peeked_row is not None
+        # Identify the "Winner" (Topic with lowest timestamp; first one on ties)
+        _, winner = self._heap[0]
+        self._winning_rdstate = self._rdstates[winner]
 
-        row_values = self._winning_rdstate.peeked_row
-        row_dict = {
-            name: value.as_py()
-            for name, value in zip(self._winning_rdstate.column_names, row_values)
-        }
+        # Convert the Winner's row and advance its stream
+        row_dict = self._winning_rdstate.pop_peeked_row()
+        assert (
+            row_dict is not None and self._winning_rdstate.message_builder is not None
+        )
 
-        # Advance the Winner's stream
-        self._winning_rdstate.peek_next_row()
+        # Re-insert the Winner with its next timestamp, or drop it if exhausted
+        if self._winning_rdstate.peeked_index is not None:
+            heapq.heapreplace(
+                self._heap, (self._winning_rdstate.peeked_timestamp, winner)
+            )
+        else:
+            heapq.heappop(self._heap)
 
-        return self._winning_rdstate.topic_name, Message.create(
-            self._winning_rdstate.ontology_tag, **row_dict
+        return self._winning_rdstate.topic_name, self._winning_rdstate.message_builder(
+            row_dict
         )
 
     def close(self):
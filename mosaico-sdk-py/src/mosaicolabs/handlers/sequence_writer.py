@@ -6,8 +6,10 @@ It manages the lifecycle of the sequence on the server (Create -> Write -> Final
 and distributes client resources (Connections, Executors) to individual Topics.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 import logging as log
-from typing import Any, Dict, Type, Optional
+from threading import BoundedSemaphore
+from typing import Any, Dict, List, Tuple, Type, Optional
 import pyarrow.flight as fl
 
 from mosaicolabs.models import Serializable
@@ -15,11 +17,17 @@ from .topic_writer import TopicWriter
 from .helpers import _make_exception, _validate_sequence_name
 from ..helpers import pack_topic_resource_name
 from ..comm.do_action import _do_action, _DoActionResponseKey
-from ..comm.connection import _ConnectionPool
+from ..comm.connection import _ConnectionPool, _is_transport_error
 from ..comm.executor_pool import _ExecutorPool
 from ..enum import FlightAction, OnErrorPolicy, SequenceStatus
 from .config import WriterConfig
 
+# Upper bound on the topics created concurrently by `topic_create_many`
+_MAX_CONCURRENT_TOPIC_CREATE = 16
+
+# Upper bound on the topics finalized concurrently by `_close_topics`
+_MAX_CONCURRENT_TOPIC_CLOSE = 16
+
 
 class SequenceWriter:
     """
@@ -33,6 +41,21 @@ class SequenceWriter:
         parallelism between topics (e.g., high-bandwidth video vs low-bandwidth telemetry).
     """
 
+    __slots__ = (
+        "_name",
+        "_metadata",
+        "_topic_writers",
+        "_control_client",
+        "_connection_pool",
+        "_executor_pool",
+        "_config",
+        "_backpressure_sem",
+        "_sequence_status",
+        "_key",
+        "_entered",
+        "__weakref__",
+    )
+
     # -------------------- Class attributes --------------------
     _name: str
     _metadata: Dict[str, Any]
@@ -49,9 +72,12 @@ class SequenceWriter:
     _config: WriterConfig
     """Configuration object containing error policies and batch size limits."""
 
-    _sequence_status: SequenceStatus = SequenceStatus.Null
-    _key: Optional[str] = None
-    _entered: bool = False
+    _backpressure_sem: BoundedSemaphore
+    """Bounds the batches pending across all the topics (async mode only)."""
+
+    _sequence_status: SequenceStatus
+    _key: Optional[str]
+    _entered: bool
 
     # -------------------- Constructor --------------------
     def __init__(
@@ -74,6 +100,12 @@ class SequenceWriter:
         self._control_client = client
         self._connection_pool = connection_pool
         self._executor_pool = executor_pool
+        self._sequence_status = SequenceStatus.Null
+        self._key = None
+        self._entered = False
+
+        # Bounds the batches pending across all the topics (async mode only)
+        self._backpressure_sem = BoundedSemaphore(config.max_pending_batches)
 
     # --- Context Manager ---
     def __enter__(self) -> "SequenceWriter":
@@ -122,13 +154,18 @@ class SequenceWriter:
 
         if not error_in_block:
             try:
-                # Normal Exit: Finalize everything
+                # Normal Exit: Finalize everything. The topics are finalized
+                # concurrently, but the sequence only once they are all done:
+                # the server locks the sequence data on SEQUENCE_FINALIZE, so
+                # this action cannot be pipelined with the topic streams closing
                 self._close_topics(with_error=False)
                 self.close()
 
             except Exception as e:
                 # An exception occurred during cleanup or finalization
-                log.error(f"Exception during __exit__ for sequence '{self._name}': {e}")
+                log.error(
+                    "Exception during __exit__ for sequence '%s': %s", self._name, e
+                )
                 # notify error and go on
                 out_exc = e
                 error_in_block = True
@@ -136,13 +173,17 @@ class SequenceWriter:
         if error_in_block:  # either in with block or after close operations
             # Exception occurred: Clean up and handle policy
             log.error(
-                f"Exception in SequenceWriter '{self._name}' block. Inner err: {out_exc}"
+                "Exception in SequenceWriter '%s' block. Inner err: %s",
+                self._name,
+                out_exc,
             )
             try:
                 self._close_topics(with_error=True)
             except Exception as e:
                 log.error(
-                    f"Exception during __exit__ with error in block (finalizing topics) for sequence '{self._name}': {e}"
+                    "Exception during __exit__ with error in block (finalizing topics) for sequence '%s': %s",
+                    self._name,
+                    e,
                 )
                 out_exc = e
 
@@ -202,10 +243,10 @@ class SequenceWriter:
         self._check_entered()
 
         if topic_name in self._topic_writers:
-            log.error(f"Topic '{topic_name}' already exists in this sequence.")
+            log.error("Topic '%s' already exists in this sequence.", topic_name)
             return None
 
-        log.debug(f"Requesting new topic '{topic_name}' for sequence '{self._name}'")
+        log.debug("Requesting new topic '%s' for sequence '%s'", topic_name, self._name)
 
         try:
             # Register topic on server
@@ -233,15 +274,16 @@ class SequenceWriter:
             return None
 
         if act_resp is None:
-            log.error(f"Action '{ACTION.value}' returned no response.")
+            log.error("Action '%s' returned no response.", ACTION.value)
             return None
 
         # --- Resource Assignment Strategy ---
         if self._connection_pool:
-            # Round-Robin assignment from the pool (Async mode)
+            # Round-Robin assignment from the pool (connection fan-out)
             data_client = self._connection_pool.get_next()
         else:
-            # Reuse control client (Sync mode)
+            # Reuse control client: the Flight (gRPC) channel multiplexes the
+            # streams of all the topics over its HTTP/2 connection
             data_client = self._control_client
 
         # Assign executor if pool is available
@@ -257,10 +299,14 @@ class SequenceWriter:
                 metadata=metadata,
                 ontology_type=ontology_type,
                 config=self._config,
+                backpressure_sem=self._backpressure_sem,
             )
             self._topic_writers[topic_name] = writer
 
         except Exception as e:
+            if self._connection_pool and _is_transport_error(e):
+                # The data channel is likely dead: let the pool re-open it
+                self._connection_pool.report_failure(data_client)
             log.error(
                 str(
                     _make_exception(
@@ -289,6 +335,52 @@ class SequenceWriter:
 
         return writer
 
+    def topic_create_many(
+        self,
+        topics: List[Tuple[str, dict[str, Any], Type[Serializable]]],
+    ) -> List[Optional[TopicWriter]]:
+        """
+        Creates several topics within the sequence, concurrently.
+
+        Each topic is created as by `topic_create`, but the round-trips of the
+        topics (their `TOPIC_CREATE` action and the opening of their stream)
+        overlap: the overall latency is close to the one of a single topic.
+
+        Args:
+            topics (List[Tuple[str, dict[str, Any], Type[Serializable]]]): The
+                `(topic_name, metadata, ontology_type)` of the topics to create.
+
+        Returns:
+            List[Optional[TopicWriter]]: The writers, in the order of `topics`
+                (None for the topics which could not be created).
+        """
+        self._check_entered()
+        if not topics:
+            return []
+
+        # A name is created once: its repetitions fail as an existing topic would
+        first_index: Dict[str, int] = {}
+        for idx, (topic_name, _, _) in enumerate(topics):
+            first_index.setdefault(topic_name, idx)
+
+        writers: List[Optional[TopicWriter]] = [None] * len(topics)
+        with ThreadPoolExecutor(
+            max_workers=min(len(first_index), _MAX_CONCURRENT_TOPIC_CREATE)
+        ) as creator:
+            futures = {
+                idx: creator.submit(self.topic_create, *topics[idx])
+                for idx in first_index.values()
+            }
+
+        for idx, (topic_name, _, _) in enumerate(topics):
+            if first_index[topic_name] != idx:
+                log.error("Topic '%s' already exists in this sequence.", topic_name)
+                continue
+            # `topic_create` reports its errors by returning None
+            writers[idx] = futures[idx].result()
+
+        return writers
+
     def sequence_status(self) -> SequenceStatus:
         """Returns the current status of the sequence."""
         return self._sequence_status
@@ -368,7 +460,7 @@ class SequenceWriter:
 
     def list_topics(self) -> list[str]:
         """Returns list of active topic names."""
-        return [k for k in self._topic_writers.keys()]
+        return list(self._topic_writers)
 
     def get_topic(self, topic_name: str) -> Optional[TopicWriter]:
         """Retrieves a TopicWriter instance, if it exists."""
@@ -376,18 +468,36 @@ class SequenceWriter:
 
     def _close_topics(self, with_error: bool) -> None:
         """
-        Iterates over all TopicWriters and finalizes them.
+        Finalizes all the TopicWriters, concurrently.
+
+        Each finalization drains the pending writes of its topic and closes its
+        stream (blocking round-trips): running them together bounds the teardown
+        latency by the slowest topic, not by the sum of all of them.
+        They do not run on the executor pool: a finalization waits for write
+        tasks which may be queued on the very lane it would occupy.
         """
         log.info(
-            f"Freeing TopicWriters {'WITH ERROR' if with_error else ''} for sequence '{self._name}'."
+            "Freeing TopicWriters %sfor sequence '%s'.",
+            "WITH ERROR " if with_error else "",
+            self._name,
         )
+        twriters = list(self._topic_writers.items())
         errors = []
-        for topic_name, twriter in self._topic_writers.items():
-            try:
-                twriter.finalize(with_error=with_error)
-            except Exception as e:
-                log.error(f"Failed to finalize topic '{topic_name}': {e}")
-                errors.append(e)
+        if twriters:
+            with ThreadPoolExecutor(
+                max_workers=min(len(twriters), _MAX_CONCURRENT_TOPIC_CLOSE)
+            ) as closer:
+                futures = [
+                    closer.submit(twriter.finalize, with_error=with_error)
+                    for _, twriter in twriters
+                ]
+
+            # In topics order: the first error is the one of the first topic
+            for (topic_name, _), fut in zip(twriters, futures):
+                e = fut.exception()
+                if e is not None:
+                    log.error("Failed to finalize topic '%s': %s", topic_name, e)
+                    errors.append(e)
 
         # Delete all TopicWriter instances, nothing can be done from here on
         self._topic_writers = {}
@@ -34,13 +34,30 @@ class TopicHandler:
     User intending getting an instance of this class, must use 'MosaicoClient.topic_handler()' factory.
     """
 
+    __slots__ = (
+        "_topic",
+        "_fl_client",
+        "_fl_ticket",
+        "_topic_metadata",
+        "_data_streamer_instance",
+        "__weakref__",
+    )
+
     # -------------------- Class attributes --------------------
     _topic: Topic
     _fl_client: fl.FlightClient
     _fl_ticket: fl.Ticket
+    _topic_metadata: Optional[TopicMetadata]
+    """The decoded topic metadata, reused by the data streamers (not decoded again)."""
     _data_streamer_instance: Optional[TopicDataStreamer]
 
-    def __init__(self, client: fl.FlightClient, topic_model: Topic, ticket: fl.Ticket):
+    def __init__(
+        self,
+        client: fl.FlightClient,
+        topic_model: Topic,
+        ticket: fl.Ticket,
+        topic_metadata: Optional[TopicMetadata] = None,
+    ):
         """
         Internal constructor.
         Users can retrieve an instance by using 'MosaicoClient.topic_handler()` instead.
@@ -49,6 +66,7 @@ class TopicHandler:
         self._fl_client = client
         self._topic = topic_model
         self._fl_ticket = ticket
+        self._topic_metadata = topic_metadata
         self._data_streamer_instance = None
 
     @classmethod
@@ -127,7 +145,7 @@ class TopicHandler:
             sys_info=act_resp,
         )
 
-        return cls(client, topic_model, ticket)
+        return cls(client, topic_model, ticket, topic_metadata)
 
     # --- Context Manager ---
     def __enter__(self) -> "TopicHandler":
@@ -164,13 +182,20 @@ class TopicHandler:
         return self._topic.name
 
     def get_data_streamer(
-        self, force_new_instance=False
+        self,
+        force_new_instance=False,
+        prefetch_depth: int = 0,
+        max_batch_rows: Optional[int] = None,
     ) -> Optional[TopicDataStreamer]:
         """
         Creates or retrieves a `TopicDataStreamer` to read data.
 
         Args:
             force_new_instance (bool): If True, creates a fresh reader even if one exists.
+            prefetch_depth (int): The number of batches read ahead by a background
+                thread, for a new reader (default = 0, no read-ahead).
+            max_batch_rows (Optional[int]): The max number of rows per batch requested
+                to the server, for a new reader (default = None, server-chosen).
 
         Returns:
             Optional[TopicDataStreamer]: The reader object.
@@ -187,7 +212,11 @@ class TopicHandler:
 
         if self._data_streamer_instance is None:
             self._data_streamer_instance = TopicDataStreamer.connect(
-                self._fl_client, self._fl_ticket
+                self._fl_client,
+                self._fl_ticket,
+                metadata=self._topic_metadata,
+                prefetch_depth=prefetch_depth,
+                max_batch_rows=max_batch_rows,
             )
         return self._data_streamer_instance
 
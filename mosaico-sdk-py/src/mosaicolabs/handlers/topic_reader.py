@@ -5,15 +5,20 @@ This module provides the `TopicDataStreamer`, an iterator that reads ontology re
 from a single topic via the Flight `DoGet` protocol.
 """
 
-from mosaicolabs.models.message import Message
+from mosaicolabs.models.message import Message, _message_builder
 import pyarrow.flight as fl
 import logging as log
-from typing import Optional
+from typing import Optional, Union
 
 from ..comm.metadata import TopicMetadata, _decode_metadata
 from .helpers import _parse_ep_ticket
+from .internal.prefetch_reader import _PrefetchReader
 from .internal.topic_read_state import _TopicReadState
 
+# `DoGet` request header carrying the max number of rows per batch (the server
+# computes the batch size from the topic statistics if absent)
+_MAX_BATCH_ROWS_HEADER = b"mosaico-max-batch-rows"
+
 
 class TopicDataStreamer:
     """
@@ -24,6 +29,8 @@ class TopicDataStreamer:
     to allow peek-ahead capabilities (used by sequence-level merging).
     """
 
+    __slots__ = ("_fl_client", "_rdstate", "__weakref__")
+
     _fl_client: fl.FlightClient
     _rdstate: _TopicReadState
 
@@ -37,17 +44,39 @@ class TopicDataStreamer:
         self._rdstate = state
 
     @classmethod
-    def connect(cls, client: fl.FlightClient, ticket: fl.Ticket) -> "TopicDataStreamer":
+    def connect(
+        cls,
+        client: fl.FlightClient,
+        ticket: fl.Ticket,
+        metadata: Optional[TopicMetadata] = None,
+        prefetch_depth: int = 0,
+        max_batch_rows: Optional[int] = None,
+    ) -> "TopicDataStreamer":
         """
         Factory method to initialize a streamer.
 
         Args:
             client (fl.FlightClient): Connected Flight client.
             ticket (fl.Ticket): The opaque ticket (from `get_flight_info`) representing the data stream.
+            metadata (Optional[TopicMetadata]): The topic metadata, if already decoded
+                (e.g. by a `TopicHandler`). If None, it is decoded from the stream schema.
+            prefetch_depth (int): The number of batches read ahead by a background
+                thread, overlapping the network receive with the processing of the
+                rows (default = 0, no read-ahead: batches are read on demand).
+            max_batch_rows (Optional[int]): The max number of rows per batch requested
+                to the server: larger batches amortize the per-batch overhead, at the
+                cost of memory and first-row latency (default = None, the server
+                picks the batch size).
 
         Returns:
             TopicDataStreamer: An initialized reader.
+
+        Raises:
+            ValueError: If `max_batch_rows` is less than 1.
         """
+        if max_batch_rows is not None and max_batch_rows < 1:
+            raise ValueError("'max_batch_rows' must be at least 1")
+
         ep_ticket_data = _parse_ep_ticket(ticket)
         if ep_ticket_data is None:
             raise Exception(
@@ -56,17 +85,49 @@ class TopicDataStreamer:
         topic_name = ep_ticket_data[1]
 
         # Initialize the Flight stream (DoGet)
-        reader = client.do_get(ticket)
+        if max_batch_rows is None:
+            reader = client.do_get(ticket)
+        else:
+            reader = client.do_get(
+                ticket,
+                fl.FlightCallOptions(
+                    headers=[(_MAX_BATCH_ROWS_HEADER, str(max_batch_rows).encode())]
+                ),
+            )
 
-        # Decode metadata to determine how to deserialize the data
-        topic_mdata = TopicMetadata.from_dict(_decode_metadata(reader.schema.metadata))
-        ontology_tag = topic_mdata.properties.ontology_tag
+        # The stream (and its prefetch thread, if any) must not outlive a failure
+        # to set up the reading state: cancel it before re-raising
+        stream: Union[fl.FlightStreamReader, _PrefetchReader] = reader
+        try:
+            # Decode metadata (unless provided) to determine how to deserialize the data
+            if metadata is None:
+                metadata = TopicMetadata.from_dict(
+                    _decode_metadata(reader.schema.metadata)
+                )
+            ontology_tag = metadata.properties.ontology_tag
+
+            # Resolve the ontology once (before starting any prefetch): the rows
+            # skip the tag dispatch of `Message.create`
+            message_builder = _message_builder(Message, ontology_tag)
+
+            if prefetch_depth > 0:
+                stream = _PrefetchReader(reader, prefetch_depth)
+
+            rdstate = _TopicReadState(
+                topic_name=topic_name,
+                reader=stream,
+                ontology_tag=ontology_tag,
+            )
+            rdstate.message_builder = message_builder
+        except Exception:
+            try:
+                stream.cancel()
+            except Exception as e:
+                log.warning(
+                    "Error canceling the stream of topic '%s': %s", topic_name, e
+                )
+            raise
 
-        rdstate = _TopicReadState(
-            topic_name=topic_name,
-            reader=reader,
-            ontology_tag=ontology_tag,
-        )
         return TopicDataStreamer(client=client, state=rdstate)
 
     def name(self) -> str:
@@ -91,16 +152,30 @@ class TopicDataStreamer:
         Returns:
             Optional[float]: The next timestamp, or None if stream is empty.
         """
-        if self._rdstate.peeked_row is None:
-            # Load the next row into the buffer
-            if not self._rdstate.peek_next_row():
-                return None
-
-        # Check for end-of-stream sentinel
-        if self._rdstate.peeked_timestamp == float("inf"):
+        rdstate = self._rdstate
+        # Load the next row into the buffer: a peeked row always has a
+        # (finite) timestamp, the 'inf' sentinel is only set along with no row
+        if rdstate.peeked_index is None and not rdstate.peek_next_row():
             return None
 
-        return self._rdstate.peeked_timestamp
+        return rdstate.peeked_timestamp
+
+    def next_timestamp_raw(self) -> float:
+        """
+        Peeks at the timestamp of the next record, with no `None` result.
+
+        Same as `next_timestamp`, but an exhausted stream returns the 'inf'
+        sentinel: merge loops can compare (or heap) the timestamps directly,
+        the exhausted streams sorting last.
+
+        Returns:
+            float: The next timestamp, or 'inf' if the stream is empty.
+        """
+        rdstate = self._rdstate
+        if rdstate.peeked_index is None:
+            # Sets the 'inf' sentinel if the stream is exhausted
+            rdstate.peek_next_row()
+        return rdstate.peeked_timestamp
 
     def __iter__(self) -> "TopicDataStreamer":
         """Returns self as iterator."""
@@ -113,24 +188,17 @@ class TopicDataStreamer:
         Raises:
             StopIteration: When the stream is exhausted.
         """
+        rdstate = self._rdstate
         # Ensure a row is available in the peek buffer
-        if self._rdstate.peeked_row is None:
-            if not self._rdstate.peek_next_row():
-                raise StopIteration
-
-        assert self._rdstate.peeked_row is not None
-        row_values = self._rdstate.peeked_row
-
-        # Convert Arrow values to Python types
-        row_dict = {
-            name: value.as_py()
-            for name, value in zip(self._rdstate.column_names, row_values)
-        }
+        if rdstate.peeked_index is None and not rdstate.peek_next_row():
+            raise StopIteration
 
-        # Advance the buffer immediately *after* extracting the data
-        self._rdstate.peek_next_row()
+        # The row is a dict of Python values already (the whole batch is
+        # converted at once by the read state): just advance the buffer
+        row_dict = rdstate.pop_peeked_row()
+        assert row_dict is not None and rdstate.message_builder is not None
 
-        return Message.create(self._rdstate.ontology_tag, **row_dict)
+        return rdstate.message_builder(row_dict)
 
     def close(self):
         """Closes the underlying Flight stream."""
@@ -7,11 +7,13 @@ serialization, and connection management.
 """
 
 from concurrent.futures import ThreadPoolExecutor
+from threading import BoundedSemaphore
 import json
-from typing import Any, Dict, Type, Optional
+from typing import Any, Dict, Iterable, Type, Optional
 from mosaicolabs.models.header import Header
 from mosaicolabs.models.message import Message
 import pyarrow.flight as fl
+import pyarrow.ipc as pa_ipc
 import logging as log
 
 from mosaicolabs.models import Serializable
@@ -22,6 +24,19 @@ from ..comm.do_action import _do_action
 from ..enum import FlightAction, OnErrorPolicy
 from .config import WriterConfig
 
+# Call options of the `DoPut` streams, built once and shared by all the topics:
+# the IPC options are explicit (multi-threaded buffer encoding), rather than
+# resolved from the process environment for every stream
+_DO_PUT_OPTIONS = fl.FlightCallOptions(
+    write_options=pa_ipc.IpcWriteOptions(use_threads=True)
+)
+
+# Same, with the batch buffers compressed in LZ4 frame format
+# (see `WriterConfig.enable_compression`)
+_COMPRESSED_DO_PUT_OPTIONS = fl.FlightCallOptions(
+    write_options=pa_ipc.IpcWriteOptions(compression="lz4_frame", use_threads=True)
+)
+
 
 class TopicWriter:
     """
@@ -47,6 +62,8 @@ class TopicWriter:
         self._fl_client: fl.FlightClient = client
         self._sequence_name: str = sequence_name
         self._name: str = topic_name
+        # Full resource name of the topic, as known by the server
+        self._resource_name: str = pack_topic_resource_name(sequence_name, topic_name)
         self._wrstate = state
         self._config = config
 
@@ -61,6 +78,7 @@ class TopicWriter:
         metadata: Dict[str, Any],
         ontology_type: Type[Serializable],
         config: WriterConfig,
+        backpressure_sem: Optional[BoundedSemaphore] = None,
     ) -> "TopicWriter":
         """
         Factory method to initialize the TopicWriter.
@@ -80,6 +98,8 @@ class TopicWriter:
             metadata (Dict[str, Any]): Topic-level user metadata.
             ontology_type (Type[Serializable]): The class of data being written.
             config (WriterConfig): Batching and error settings.
+            backpressure_sem (Optional[BoundedSemaphore]): Pending batches limit
+                shared with the other topics of the sequence.
 
         Returns:
             TopicWriter: An active writer instance.
@@ -99,9 +119,14 @@ class TopicWriter:
             )
         )
 
-        # Open Flight Stream (DoPut)
+        # Open Flight Stream (DoPut): the IPC options apply to every batch written
+        options = (
+            _COMPRESSED_DO_PUT_OPTIONS if config.enable_compression else _DO_PUT_OPTIONS
+        )
         try:
-            writer, _ = client.do_put(descriptor, Message.get_schema(ontology_type))
+            writer, _ = client.do_put(
+                descriptor, Message.get_schema(ontology_type), options=options
+            )
         except Exception as e:
             raise _make_exception(
                 f"Failed to open Flight stream for topic '{topic_name}'", e
@@ -117,6 +142,7 @@ class TopicWriter:
             executor=executor,
             max_batch_size_bytes=config.max_batch_size_bytes,
             max_batch_size_records=config.max_batch_size_records,
+            backpressure_sem=backpressure_sem,
         )
 
         return cls(topic_name, sequence_name, client, wrstate, config)
@@ -198,7 +224,7 @@ class TopicWriter:
                 client=self._fl_client,
                 action=FlightAction.TOPIC_NOTIFY_CREATE,
                 payload={
-                    "name": pack_topic_resource_name(self._sequence_name, self._name),
+                    "name": self._resource_name,
                     "notify_type": "error",
                     "msg": str(err),
                 },
@@ -252,6 +278,23 @@ class TopicWriter:
         except Exception as e:
             self._handle_exception_and_raise(e, "Error during TopicWriter.push")
 
+    def push_many(self, messages: Iterable[Message]) -> None:
+        """
+        Adds several records to the write buffer, in order.
+
+        Equivalent to calling `push(message=...)` for each message, with less
+        per-record overhead: useful for producers receiving bursts of data.
+        The buffer is flushed to the server whenever it reaches the limits,
+        exactly as with `push`.
+
+        Args:
+            messages (Iterable[Message]): The complete Message objects to write.
+        """
+        try:
+            self._wrstate.push_records(messages)
+        except Exception as e:
+            self._handle_exception_and_raise(e, "Error during TopicWriter.push_many")
+
     def finalized(self) -> bool:
         """Returns True if the writer stream has been closed."""
         return self._wrstate.writer is None
@@ -7,12 +7,29 @@ Provides utility functions for dict manipulation and other things
 import ast
 from copy import deepcopy
 from dataclasses import is_dataclass
-from pathlib import Path
+from functools import lru_cache
 import re
 from typing import Any, Iterable, Optional
 
 from pydantic import BaseModel
 
+# Patterns of `camel_to_snake`, compiled once (see the function for details)
+_CAMEL_WORD_RE = re.compile(r"(.)([A-Z][a-z]+)")
+_CAMEL_DIGITS_RE = re.compile(r"([A-z]+)([0-9]+)([A-z]+)")
+
+# Decimal int and float literals of `unflatten_dict` values, decoded without
+# `ast.literal_eval` (Python literal rules: no leading zeros for the ints)
+_INT_LITERAL_RE = re.compile(r"-?(?:0|[1-9][0-9]*)")
+_FLOAT_LITERAL_RE = re.compile(
+    r"-?[0-9]+(?:\.[0-9]*(?:[eE][+-]?[0-9]+)?|[eE][+-]?[0-9]+)"
+)
+
+# Literals of the Python constants, as decoded by `ast.literal_eval`
+_CONSTANT_LITERALS = {"None": None, "True": True, "False": False}
+
+# Types returned as they are by `encode_to_dict`, matched on the exact type
+_ENCODE_PASSTHROUGH_TYPES = frozenset({type(None), bool, int, float, str, bytes})
+
 
 def camel_to_snake(name: str) -> str:
     """
@@ -38,13 +55,13 @@ def camel_to_snake(name: str) -> str:
     # uppercase character, but only if the uppercase character is followed
     # by one or more lowercase characters.
     # This primarily handles transitions like 'Message' -> 'Sensor_Factory'
-    s1 = re.sub(r"(.)([A-Z][a-z]+)", r"\1_\2", name)
+    s1 = _CAMEL_WORD_RE.sub(r"\1_\2", name)
 
     # Insert an underscore between a lowercase character/digit and an
     # uppercase character (handles trailing acronyms like 'URL' or 'ID').
     # 'Sensor_Factory' -> 'sensor_factory'
     # 'GPS3DPosition' -> 'GPS3D_Position'
-    s2 = re.sub(r"([A-z]+)([0-9]+)([A-z]+)", r"\1_\2_\3", s1)
+    s2 = _CAMEL_DIGITS_RE.sub(r"\1_\2_\3", s1)
 
     # Convert the entire resulting string to lowercase.
     return s2.lower()
@@ -54,23 +71,35 @@ def flatten_dict(
     d: dict[str, Any], parent_key: str = "", sep: str = "."
 ) -> dict[str, str]:
     """
-    Recursively flattens a nested dictionary into a single-level dictionary.
+    Flattens a nested dictionary into a single-level dictionary.
+
+    The nested dictionaries are walked depth-first with an explicit stack, all
+    the keys being written into a single output dictionary (in the order of a
+    recursive walk).
 
     :param d: The dictionary to flatten.
-    :param parent_key: The base key to prepend to new keys (used in recursion).
+    :param parent_key: The base key to prepend to new keys.
     :param sep: The separator to use between keys.
     :return: A new flattened dictionary.
     """
-    items = {}
-    for k, v in d.items():
-        new_key = parent_key + k
-
-        if isinstance(v, dict):
-            # Recursively call the function for nested dictionaries
-            items.update(flatten_dict(v, new_key + sep, sep=sep))
+    items: dict[str, str] = {}
+    # Pairs of (key prefix, items iterator) of the dictionaries being walked
+    stack = [(parent_key, iter(d.items()))]
+    while stack:
+        prefix, it = stack[-1]
+        for k, v in it:
+            new_key = prefix + k
+
+            if isinstance(v, dict):
+                # Walk the nested dictionary first, then resume this one
+                stack.append((new_key + sep, iter(v.items())))
+                break
+
+            # Add non-dict values to the result (plain strings as they are)
+            items[new_key] = v if type(v) is str else str(v)
         else:
-            # Add non-dict values to the result
-            items[new_key] = str(v)
+            # This dictionary is done
+            stack.pop()
 
     return items
 
@@ -88,6 +117,17 @@ def unflatten_dict(d: dict[str, Any], sep: str = ".") -> dict[str, Any]:
     def decode_value(value: Any) -> Any:
         # Only attempt decoding if it's a string
         if isinstance(value, str):
+            # Fast paths for the scalars, the most common values: same results
+            # as `ast.literal_eval`, without building an AST
+            if value in _CONSTANT_LITERALS:
+                return _CONSTANT_LITERALS[value]
+            if _INT_LITERAL_RE.fullmatch(value):
+                return int(value)
+            if _FLOAT_LITERAL_RE.fullmatch(value):
+                return float(value)
+            if value.isidentifier():
+                # Not a literal (names are rejected by `ast.literal_eval`)
+                return value
             try:
                 # Safely evaluate Python literals
                 return ast.literal_eval(value)
@@ -133,9 +173,11 @@ def encode_to_dict(obj: Any, exclude_none: bool = False) -> Any:
              or the original primitive value if not a supported structure.
     """
 
-    # Handle explicit None values
-    if obj is None:
-        return None
+    # --- Fast path: None and the plain primitives ---
+    # Most of the message fields: a single (exact) type lookup, before the
+    # `isinstance` chain below (subclasses, e.g. enums, still go through it)
+    if type(obj) in _ENCODE_PASSTHROUGH_TYPES:
+        return obj
 
     # --- Handle Pydantic model instances ---
     # Pydantic models provide a built-in method `.model_dump()` which converts the model
@@ -213,10 +255,16 @@ def sanitize_sequence_name(name: str):
     return _name
 
 
+@lru_cache(maxsize=4096)
 def pack_topic_resource_name(sequence_name: str, topic_name: str) -> str:
     """
     Constructs the full resource path for a topic.
 
+    The names are normalized as POSIX paths would be (leading, trailing and
+    repeated '/' and '.' components are dropped) with plain string operations.
+    The result is memoized: the same names are packed again and again (topic
+    creation and error reports, handlers opening).
+
     Args:
         sequence_name (str): The parent sequence name.
         topic_name (str): The topic name.
@@ -224,13 +272,8 @@ def pack_topic_resource_name(sequence_name: str, topic_name: str) -> str:
     Returns:
         str: A combined path string (e.g., "seq_1/topic_name").
     """
-    rbase = Path(sequence_name)
-    if rbase.is_absolute():
-        rbase = rbase.relative_to("/")  # strip leading '/'
-    sub = Path(topic_name)
-    if sub.is_absolute():
-        sub = sub.relative_to("/")  # strip leading '/'
-    return str(rbase / sub)
+    parts = f"{sequence_name}/{topic_name}".split("/")
+    return "/".join(part for part in parts if part and part != ".")
 
 
 def unpack_topic_full_path(topic_path: str) -> Optional[tuple[str, str]]:
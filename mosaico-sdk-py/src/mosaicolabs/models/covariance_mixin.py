@@ -9,6 +9,25 @@ import pyarrow as pa
 
 from .base_model import BaseModel
 
+# The fields injected in the schema of the subclasses: built once, shared by
+# all the covariance-bearing ontologies (pyarrow fields are immutable)
+_COVARIANCE_FIELDS = [
+    pa.field(
+        "covariance",
+        pa.list_(value_type=pa.float64()),
+        nullable=True,
+        metadata={"description": "The covariance matrix (flattened) of the data."},
+    ),
+    pa.field(
+        "covariance_type",
+        pa.int16(),
+        nullable=True,
+        metadata={
+            "description": "Enum integer representing the covariance parameterization."
+        },
+    ),
+]
+
 
 class CovarianceMixin(BaseModel):
     """
@@ -25,26 +44,6 @@ class CovarianceMixin(BaseModel):
         """
         super().__init_subclass__(**kwargs)
 
-        # Define the fields to inject
-        _FIELDS = [
-            pa.field(
-                "covariance",
-                pa.list_(value_type=pa.float64()),
-                nullable=True,
-                metadata={
-                    "description": "The covariance matrix (flattened) of the data."
-                },
-            ),
-            pa.field(
-                "covariance_type",
-                pa.int16(),
-                nullable=True,
-                metadata={
-                    "description": "Enum integer representing the covariance parameterization."
-                },
-            ),
-        ]
-
         # Retrieve existing schema fields
         current_pa_fields = []
         if hasattr(cls, "__msco_pyarrow_struct__") and isinstance(
@@ -60,5 +59,5 @@ class CovarianceMixin(BaseModel):
             )
 
         # Append and Update
-        new_fields = current_pa_fields + _FIELDS
+        new_fields = current_pa_fields + _COVARIANCE_FIELDS
         cls.__msco_pyarrow_struct__ = pa.struct(new_fields)
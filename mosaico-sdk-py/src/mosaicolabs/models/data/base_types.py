@@ -11,8 +11,8 @@ the messaging system, allowing a user to send a simple `int` or `string` as a
 timestamped, traceable message.
 """
 
-from typing import Any
 import pyarrow as pa
+from pydantic import Field
 
 from ..serializable import Serializable
 from ..header_mixin import HeaderMixin
@@ -95,18 +95,8 @@ class Unsigned8(Serializable, HeaderMixin):
             ),
         ]
     )
-    data: int
-
-    def model_post_init(self, context: Any) -> None:
-        """
-        Validates that the input data is non-negative.
-
-        Raises:
-            ValueError: If data < 0.
-        """
-        super().model_post_init(context)
-        if self.data < 0:
-            raise ValueError("Integer must be unsigned")
+    # Non-negative: checked by the pydantic (compiled) validator
+    data: int = Field(ge=0)
 
 
 class Unsigned16(Serializable, HeaderMixin):
@@ -122,12 +112,8 @@ class Unsigned16(Serializable, HeaderMixin):
             ),
         ]
     )
-    data: int
-
-    def model_post_init(self, context: Any) -> None:
-        super().model_post_init(context)
-        if self.data < 0:
-            raise ValueError("Integer must be unsigned")
+    # Non-negative: checked by the pydantic (compiled) validator
+    data: int = Field(ge=0)
 
 
 class Unsigned32(Serializable, HeaderMixin):
@@ -143,12 +129,8 @@ class Unsigned32(Serializable, HeaderMixin):
             ),
         ]
     )
-    data: int
-
-    def model_post_init(self, context: Any) -> None:
-        super().model_post_init(context)
-        if self.data < 0:
-            raise ValueError("Integer must be unsigned")
+    # Non-negative: checked by the pydantic (compiled) validator
+    data: int = Field(ge=0)
 
 
 class Unsigned64(Serializable, HeaderMixin):
@@ -164,12 +146,8 @@ class Unsigned64(Serializable, HeaderMixin):
             ),
         ]
     )
-    data: int
-
-    def model_post_init(self, context: Any) -> None:
-        super().model_post_init(context)
-        if self.data < 0:
-            raise ValueError("Integer must be unsigned")
+    # Non-negative: checked by the pydantic (compiled) validator
+    data: int = Field(ge=0)
 
 
 class Floating16(Serializable, HeaderMixin):
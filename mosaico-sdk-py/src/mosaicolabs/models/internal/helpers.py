@@ -1,3 +1,14 @@
+from typing import Any, Optional
+
+import pydantic
+
+# Estimated Arrow IPC footprint of a fixed-width value (widest primitive type)
+_FIXED_VALUE_SIZE = 8
+
+# Offset entry added by Arrow for each variable-length value (binary, string, list)
+_OFFSET_SIZE = 4
+
+
 def _fix_empty_dicts(obj):
     """
     Recursively replaces dictionaries where all values are None
@@ -8,15 +19,72 @@ def _fix_empty_dicts(obj):
         Fields defined as `Vector3d = None` may be incorrectly
         deserialized as `Vector3d(x=None, y=None, z=None)`.
         This function cleans up that structure back to `None`.
+
+        Dictionaries needing no fix are returned as they are (not copied): this
+        runs on every decoded row, where most of them need none. The input must
+        then not be mutated afterwards by the caller.
     """
     if isinstance(obj, dict):
-        # Recursively fix all values in the dictionary
-        fixed = {k: _fix_empty_dicts(v) for k, v in obj.items()}
+        # Recursively fix all values in the dictionary (copied on first change)
+        fixed = None
+        all_none = True
+        for k, v in obj.items():
+            fixed_v = _fix_empty_dicts(v)
+            if fixed_v is not v:
+                if fixed is None:
+                    fixed = dict(obj)
+                fixed[k] = fixed_v
+            if fixed_v is not None:
+                all_none = False
 
         # If all values in the fixed dict are None, return None
-        if all(v is None for v in fixed.values()):
+        if all_none:
             return None
-        # Otherwise, return the fixed dictionary
-        return fixed
+        # Otherwise, return the (fixed) dictionary
+        return obj if fixed is None else fixed
     # If not a dict, return the object unchanged
     return obj
+
+
+def _estimated_value_size(value: Any) -> Optional[int]:
+    """
+    Estimates the bytes a Python value takes once encoded into an Arrow column.
+
+    Fixed-width values count `_FIXED_VALUE_SIZE` bytes; bytes-like values and
+    strings count their length plus an offset entry; sequences, mappings and
+    nested models sum their items. Nulls count nothing (validity bitmaps and
+    batch metadata are left to the caller's per-row overhead).
+
+    Args:
+        value (Any): A field value of an ontology model.
+
+    Returns:
+        Optional[int]: The estimated size, or None if a value cannot be sized.
+    """
+    if value is None:
+        return 0
+    if isinstance(value, (bool, int, float)):
+        return _FIXED_VALUE_SIZE
+    if isinstance(value, (bytes, bytearray)):
+        return len(value) + _OFFSET_SIZE
+    if isinstance(value, str):
+        n = len(value) if value.isascii() else len(value.encode("utf-8"))
+        return n + _OFFSET_SIZE
+    if isinstance(value, (list, tuple)):
+        items = value
+    elif isinstance(value, dict):
+        items = value.values()
+    elif isinstance(value, pydantic.BaseModel):
+        items = value.__dict__.values()
+    else:
+        # Buffers (memoryview, numpy arrays, ...)
+        nbytes = getattr(value, "nbytes", None)
+        return None if nbytes is None else nbytes + _OFFSET_SIZE
+
+    total = _OFFSET_SIZE
+    for item in items:
+        size = _estimated_value_size(item)
+        if size is None:
+            return None
+        total += size
+    return total
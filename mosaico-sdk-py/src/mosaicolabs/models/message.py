@@ -8,14 +8,25 @@ middleware-level metadata (like recording timestamp_ns).
 """
 
 # --- Python Standard Library Imports ---
-from typing import Any, Dict, Optional, Type, TypeVar
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 from pydantic import PrivateAttr
 import pyarrow as pa
 
 from ..helpers.helpers import encode_to_dict
 from .header import Header
 from .serializable import Serializable, _SENSOR_REGISTRY
-from .internal.helpers import _fix_empty_dicts
+from .internal.helpers import _fix_empty_dicts, _estimated_value_size
 from .base_model import BaseModel
 
 
@@ -24,6 +35,73 @@ def _make_schema(*args: pa.StructType) -> pa.Schema:
     return pa.schema([field for struct in args for field in struct])
 
 
+@lru_cache(maxsize=128)
+def _create_field_names(
+    msg_cls: type, data_cls: type
+) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """
+    Returns the envelope and payload field names used by `Message.create` to
+    split its arguments, resolved once per (message, ontology) classes pair
+    rather than for every decoded row.
+    """
+    envelope = frozenset(name for name in msg_cls.model_fields if name != "data")
+    return envelope, frozenset(data_cls.model_fields)
+
+
+@lru_cache(maxsize=128)
+def _message_builder(msg_cls: type, tag: str) -> Callable[[Dict[str, Any]], "Message"]:
+    """
+    Returns the constructor of the messages of an ontology tag.
+
+    The tag lookup and the field names are resolved once, here, and bound to the
+    returned function: `Message.create` uses it, and the data streamers cache it
+    when a topic is opened, so that the decoded rows skip the tag dispatch.
+
+    Args:
+        msg_cls (type): The message class.
+        tag (str): The registered tag of the ontology data (e.g., "imu").
+
+    Returns:
+        Callable[[Dict[str, Any]], Message]: Builds a message from a flat
+            dictionary of the message and data fields.
+
+    Raises:
+        ValueError: If no ontology is registered with `tag`.
+    """
+    if tag not in _SENSOR_REGISTRY:
+        raise ValueError(
+            f"No ontology registered with tag '{tag}'. "
+            f"Available tags: {list(_SENSOR_REGISTRY.keys())}"
+        )
+
+    DataClass = _SENSOR_REGISTRY[tag]
+    message_fields, data_fields = _create_field_names(msg_cls, DataClass)
+
+    def build(kwargs: Dict[str, Any]) -> "Message":
+        # Cleanup Input (Fix Parquet artifacts)
+        fixed_kwargs = _fix_empty_dicts(kwargs) if kwargs else dict({})
+        if not fixed_kwargs:
+            raise Exception(f"Unable to obtain valid fields from kwargs: {kwargs}")
+
+        # Extract Envelope args
+        message_kwargs = {
+            key: val for key, val in fixed_kwargs.items() if key in message_fields
+        }
+        if not message_kwargs:
+            raise Exception("Input kwargs missing required Message fields.")
+
+        # Extract Payload args
+        data_kwargs = {
+            key: val for key, val in fixed_kwargs.items() if key in data_fields
+        }
+
+        # Instantiation
+        data_obj = DataClass(**data_kwargs)
+        return msg_cls(data=data_obj, **message_kwargs)
+
+    return build
+
+
 TSensor = TypeVar("TSensor", bound="Serializable")
 
 
@@ -94,6 +172,22 @@ class Message(BaseModel):
             self.data, "__ontology_tag__"
         )  # avoid the IDE complaining (__ontology_tag__ defined as Optional but surely not None at this point)
 
+    def estimated_ipc_size(self) -> Optional[int]:
+        """
+        Estimates the bytes this message adds to an Arrow IPC record batch.
+
+        Sums the envelope fields and the `Serializable.estimated_ipc_size` of the
+        payload, without encoding the message.
+
+        Returns:
+            Optional[int]: The estimated size, or None if it cannot be estimated.
+        """
+        data_size = self.data.estimated_ipc_size()
+        header_size = _estimated_value_size(self.message_header)
+        if data_size is None or header_size is None:
+            return None
+        return _estimated_value_size(self.timestamp_ns) + header_size + data_size
+
     def encode(self) -> Dict[str, Any]:
         """
         Flattens the object into a dictionary suitable for PyArrow serialization.
@@ -117,6 +211,41 @@ class Message(BaseModel):
 
         return columns_dict
 
+    @classmethod
+    def encode_batch(cls, objs: List["Message"]) -> Dict[str, List[Any]]:
+        """
+        Encodes a list of messages into a columnar dictionary for PyArrow.
+
+        Equivalent to pivoting the `encode()` output of every message, but each
+        column is built by a single list comprehension, with no per-row
+        dictionary. All the messages must carry the same ontology type.
+
+        Args:
+            objs (List[Message]): The messages to encode.
+
+        Returns:
+            Dict[str, List[Any]]: A `{column_name: values}` dictionary.
+        """
+        if not objs:
+            return {}
+        first = objs[0]
+
+        # Encode envelope fields
+        columns = {
+            field: [encode_to_dict(getattr(obj, field)) for obj in objs]
+            for field in first._self_model_keys
+        }
+
+        # Encode and merge payload fields
+        payloads = [obj.data for obj in objs]
+        columns.update(
+            {
+                field: [encode_to_dict(getattr(data, field)) for data in payloads]
+                for field in first._data_model_keys
+            }
+        )
+        return columns
+
     @classmethod
     def create(cls, tag: str, **kwargs) -> "Message":
         """
@@ -132,49 +261,21 @@ class Message(BaseModel):
 
         Returns:
             Message: The populated message object.
-        """
-        # Validate Tag
-        if tag not in _SENSOR_REGISTRY:
-            raise ValueError(
-                f"No ontology registered with tag '{tag}'. "
-                f"Available tags: {list(_SENSOR_REGISTRY.keys())}"
-            )
 
-        DataClass = _SENSOR_REGISTRY[tag]
-
-        # Cleanup Input (Fix Parquet artifacts)
-        fixed_kwargs = _fix_empty_dicts(kwargs) if kwargs else dict({})
-        if not fixed_kwargs:
-            raise Exception(f"Unable to obtain valid fields from kwargs: {kwargs}")
-
-        # Argument Separation
-        message_fields = list(cls.model_fields.keys())
-        data_fields = list(DataClass.model_fields.keys())
-
-        # Extract Envelope args
-        message_kwargs = {
-            key: val
-            for key, val in fixed_kwargs.items()
-            if key in message_fields and key != "data"
-        }
-        if not message_kwargs:
-            raise Exception("Input kwargs missing required Message fields.")
-
-        # Extract Payload args
-        data_kwargs = {
-            key: val for key, val in fixed_kwargs.items() if key in data_fields
-        }
-
-        # Instantiation
-        data_obj = DataClass(**data_kwargs)
-        return cls(data=data_obj, **message_kwargs)
+        Raises:
+            ValueError: If no ontology is registered with `tag`.
+        """
+        return _message_builder(cls, tag)(kwargs)
 
     @classmethod
+    @lru_cache(maxsize=128)
     def get_schema(cls, data_cls: Type["Serializable"]) -> pa.Schema:
         """
         Generates the combined PyArrow Schema for a specific ontology type.
 
         Merges the Message envelope schema with the specific Ontology schema.
+        The result is memoized per ontology class: the stream opening and the
+        write state of each topic share the same (immutable) schema object.
 
         Args:
             data_cls: The ontology class type.
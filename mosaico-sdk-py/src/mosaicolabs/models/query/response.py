@@ -1,5 +1,6 @@
 from dataclasses import dataclass, field
-from typing import Iterator, List
+from operator import itemgetter
+from typing import Any, Dict, Iterable, Iterator, List
 
 from mosaicolabs.helpers import unpack_topic_full_path
 from mosaicolabs.helpers.helpers import pack_topic_resource_name
@@ -8,11 +9,34 @@ from .builders import QuerySequence, QueryTopic
 from .expressions import _QuerySequenceExpression, _QueryTopicExpression
 
 
-@dataclass
+# Extracts the `QueryResponseItem` fields, in declaration order, from a server row
+_ITEM_FIELDS_GETTER = itemgetter("sequence", "topics")
+
+
+@dataclass(slots=True)
 class QueryResponseItem:
     sequence: str
     topics: List[str]
 
+    @classmethod
+    def from_rows(cls, rows: Iterable[Dict[str, Any]]) -> List["QueryResponseItem"]:
+        """
+        Builds the items of a query response from the raw server rows.
+
+        Arguments are extracted with a pre-bound `itemgetter` and passed
+        positionally, which is cheaper than `cls(**row)` on large responses.
+
+        Args:
+            rows (Iterable[Dict[str, Any]]): The rows of the 'items' response field.
+
+        Returns:
+            List[QueryResponseItem]: The response items, in the same order.
+
+        Raises:
+            KeyError: If a row lacks the 'sequence' or 'topics' key.
+        """
+        return [cls(*_ITEM_FIELDS_GETTER(row)) for row in rows]
+
     def __post_init__(self):
         """
         Returned topics are the full resource names, e.g. 'sequence_name/the/topic/name'.
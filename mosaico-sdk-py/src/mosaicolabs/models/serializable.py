@@ -23,8 +23,7 @@ from .base_model import BaseModel
 from .query.generation.api import _QueryableModel
 from .query.expressions import _QueryCatalogExpression
 from .internal.pyarrow_mapper import PyarrowFieldMapper
-from .internal.helpers import _fix_empty_dicts
-
+from .internal.helpers import _fix_empty_dicts, _estimated_value_size
 
 # --- Private Registry ---
 # Global dictionary mapping string tags (e.g., "imu") to class types.
@@ -218,3 +217,17 @@ class Serializable(BaseModel, _QueryableModel):
                 f"class {cls.__name__} has no '__ontology_tag__' attribute. Initialization failed."
             )
         return cls.__ontology_tag__
+
+    def estimated_ipc_size(self) -> Optional[int]:
+        """
+        Estimates the bytes this payload adds to an Arrow IPC record batch.
+
+        The estimate is computed from the Python field values, without building
+        any Arrow data. Ontologies with a known layout may override it with a
+        cheaper (or more accurate) computation.
+
+        Returns:
+            Optional[int]: The estimated size, or None if it cannot be estimated
+                           (callers then measure an actual record batch).
+        """
+        return _estimated_value_size(self.__dict__)
@@ -0,0 +1,98 @@
+"""
+Unit tests for the health tracking of `_ConnectionPool`.
+
+Validates that the slots reported as failed are skipped by `get_next`, re-opened
+after the backoff, and that the replaced clients stay open until the pool closes.
+"""
+
+import pytest
+
+from mosaicolabs.comm import connection
+from mosaicolabs.comm.connection import _ConnectionPool
+
+
+class _FakeClient:
+    """Stands in for a `fl.FlightClient`, recording its closure."""
+
+    def __init__(self, n: int):
+        self.n = n
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def opened(monkeypatch):
+    """Patches `_get_connection`; returns the list of the clients opened."""
+    clients = []
+
+    def _fake_get_connection(host, port, timeout):
+        client = _FakeClient(len(clients))
+        clients.append(client)
+        return client
+
+    monkeypatch.setattr(connection, "_get_connection", _fake_get_connection)
+    return clients
+
+
+def _pool(size: int) -> _ConnectionPool:
+    return _ConnectionPool(host="localhost", port=6726, pool_size=size, timeout=1)
+
+
+def test_failed_slot_is_skipped(opened):
+    pool = _pool(2)
+    failed = pool.get_next()
+    pool.report_failure(failed)
+
+    # Within the backoff, only the healthy slot is handed out
+    assert all(pool.get_next() is not failed for _ in range(4))
+    assert len(opened) == 2
+
+
+def test_foreign_client_is_ignored(opened):
+    pool = _pool(2)
+    pool.report_failure(_FakeClient(-1))
+
+    assert all(slot.healthy for slot in pool._clients)
+
+
+def test_all_slots_failed_raises(opened):
+    pool = _pool(2)
+    for client in list(opened):
+        pool.report_failure(client)
+
+    with pytest.raises(ConnectionError):
+        pool.get_next()
+
+
+def test_failed_slot_is_reopened_after_backoff(opened, monkeypatch):
+    monkeypatch.setattr(connection, "_UNHEALTHY_CONNECTION_BACKOFF_S", 0.0)
+    pool = _pool(1)
+    failed = pool.get_next()
+    pool.report_failure(failed)
+
+    reopened = pool.get_next()
+
+    assert reopened is opened[-1] and reopened is not failed
+    assert pool._clients[0].healthy
+    # Writers may still have streams on the replaced client
+    assert not failed.closed
+
+    pool.close()
+    assert failed.closed and reopened.closed
+
+
+def test_failed_reopen_keeps_the_slot_unhealthy(opened, monkeypatch):
+    monkeypatch.setattr(connection, "_UNHEALTHY_CONNECTION_BACKOFF_S", 0.0)
+    pool = _pool(1)
+    pool.report_failure(pool.get_next())
+
+    def _unreachable(host, port, timeout):
+        raise ConnectionError("unreachable")
+
+    monkeypatch.setattr(connection, "_get_connection", _unreachable)
+
+    with pytest.raises(ConnectionError):
+        pool.get_next()
+    assert not pool._clients[0].healthy
@@ -0,0 +1,61 @@
+"""
+Tests for the JSON codec shim and the action payload encoding.
+
+Validates that the request bodies do not depend on the installed JSON backend
+for user-supplied values, and that `dumps` accepts what the standard library
+encodes.
+"""
+
+import json
+import math
+
+import numpy as np
+import pytest
+
+from mosaicolabs.comm import _json
+from mosaicolabs.comm.do_action import _serialize_payload
+
+
+def test_dumps_accepts_non_str_keys():
+    assert json.loads(_json.dumps({1: 0.5, 2.5: "x"})) == {"1": 0.5, "2.5": "x"}
+
+
+def test_orjson_dumps_accepts_numpy_scalars():
+    # Only the orjson backend encodes numpy scalars
+    pytest.importorskip("orjson")
+    body = _json.dumps({"value": np.float64(0.5), "flag": np.bool_(True)})
+
+    assert json.loads(body) == {"value": 0.5, "flag": True}
+
+
+def test_dumps_falls_back_to_stdlib_on_unsupported_values():
+    # Beyond 64 bits: rejected by orjson, encoded by the standard library
+    assert json.loads(_json.dumps({"n": 2**70})) == {"n": 2**70}
+
+
+def test_dumps_stdlib_keeps_non_finite_floats():
+    body = _json.dumps_stdlib({"nan": float("nan"), "inf": float("inf")})
+
+    decoded = json.loads(body)
+    assert math.isnan(decoded["nan"]) and decoded["inf"] == float("inf")
+
+
+def test_user_metadata_payload_is_encoded_by_stdlib():
+    payload = {
+        "name": "seq",
+        "user_metadata": {"gain": float("nan"), 3: "three", "nested": {"a": [1]}},
+    }
+
+    assert _serialize_payload("sequence_create", payload) == json.dumps(payload).encode(
+        "utf-8"
+    )
+
+
+def test_string_payloads_round_trip():
+    single = _serialize_payload("sequence_finalize", {"name": 'a "quoted" név'})
+    many = _serialize_payload("topic_notify", {"name": "t", "msg": "boom"})
+
+    assert json.loads(single) == {"name": 'a "quoted" név'}
+    assert json.loads(many) == {"msg": "boom", "name": "t"}
+    # Cached: the same body object is returned for the same payload
+    assert _serialize_payload("topic_notify", {"msg": "boom", "name": "t"}) is many
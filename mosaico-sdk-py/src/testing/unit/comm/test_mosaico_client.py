@@ -0,0 +1,210 @@
+"""
+Unit tests for the handlers caches of `MosaicoClient`.
+
+Validates the LRU bound of the caches: the least recently used handler is
+evicted and closed when the bound is exceeded; and that concurrent requests of
+a missing handler connect it once.
+"""
+
+import threading
+import time
+
+import pytest
+
+from mosaicolabs.comm import mosaico_client
+from mosaicolabs.comm.mosaico_client import MosaicoClient
+
+
+class _FakeControlClient:
+    """Stands in for the control `fl.FlightClient`."""
+
+    def close(self):
+        pass
+
+
+class _FakeHandler:
+    """Stands in for a `SequenceHandler`, recording its closure."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class _FailingCloseHandler(_FakeHandler):
+    def close(self):
+        raise RuntimeError("close failed")
+
+
+@pytest.fixture
+def connects(monkeypatch):
+    """Patches `SequenceHandler.connect`; returns the names connected, in order."""
+    names = []
+
+    def _connect(sequence_name, client):
+        names.append(sequence_name)
+        if sequence_name.startswith("missing"):
+            return None
+        if sequence_name.startswith("unclosable"):
+            return _FailingCloseHandler(sequence_name)
+        return _FakeHandler(sequence_name)
+
+    monkeypatch.setattr(mosaico_client.SequenceHandler, "connect", _connect)
+    return names
+
+
+@pytest.fixture
+def client():
+    client = MosaicoClient._build(
+        _FakeControlClient(), None, None, max_cached_handlers=2
+    )
+    yield client
+    client.close()
+
+
+def test_cached_handler_is_reused(client, connects):
+    first = client.sequence_handler("seq_a")
+
+    assert client.sequence_handler("seq_a") is first
+    assert connects == ["seq_a"]
+
+
+def test_least_recently_used_handler_is_evicted_and_closed(client, connects):
+    seq_a = client.sequence_handler("seq_a")
+    seq_b = client.sequence_handler("seq_b")
+    # A hit makes `seq_a` the most recently used
+    client.sequence_handler("seq_a")
+
+    client.sequence_handler("seq_c")
+
+    assert list(client._sequence_handlers_cache) == ["seq_a", "seq_c"]
+    assert seq_b.closed and not seq_a.closed
+    # An evicted handler is connected again on the next request
+    assert client.sequence_handler("seq_b") is not seq_b
+    assert connects == ["seq_a", "seq_b", "seq_c", "seq_b"]
+
+
+def test_eviction_close_error_is_not_raised(client, connects):
+    client.sequence_handler("unclosable")
+    client.sequence_handler("seq_a")
+
+    assert client.sequence_handler("seq_b") is not None
+    assert "unclosable" not in client._sequence_handlers_cache
+
+
+def test_failed_connect_is_not_cached(client, connects):
+    assert client.sequence_handler("missing") is None
+    assert client.sequence_handler("missing") is None
+
+    assert len(client._sequence_handlers_cache) == 0
+    assert connects == ["missing", "missing"]
+
+
+def test_cache_bound_must_be_positive():
+    with pytest.raises(ValueError):
+        MosaicoClient._build(_FakeControlClient(), None, None, max_cached_handlers=0)
+
+
+class _CountingEvent(threading.Event):
+    """`threading.Event` counting the callers blocked in `wait`."""
+
+    waiters = 0
+    _lock = threading.Lock()
+
+    def wait(self, timeout=None):
+        with _CountingEvent._lock:
+            _CountingEvent.waiters += 1
+        return super().wait(timeout)
+
+
+def _request_concurrently(client, monkeypatch, result, nthreads=4):
+    """
+    Requests the same handler from `nthreads` threads while its connect blocks,
+    until all the other threads wait for it; `connect` then returns `result`.
+
+    Returns the number of connect calls and the handlers returned to each thread.
+    """
+    calls = []
+    entered, release = threading.Event(), threading.Event()
+
+    def _connect(sequence_name, client):
+        calls.append(sequence_name)
+        entered.set()
+        release.wait()
+        return result
+
+    monkeypatch.setattr(mosaico_client.SequenceHandler, "connect", _connect)
+    monkeypatch.setattr(mosaico_client, "Event", _CountingEvent)
+    monkeypatch.setattr(_CountingEvent, "waiters", 0)
+
+    handlers = [None] * nthreads
+
+    def _request(i):
+        handlers[i] = client.sequence_handler("seq")
+
+    threads = [threading.Thread(target=_request, args=(i,)) for i in range(nthreads)]
+    for t in threads:
+        t.start()
+    assert entered.wait(timeout=5.0)
+    deadline = time.monotonic() + 5.0
+    while _CountingEvent.waiters < nthreads - 1 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    release.set()
+    for t in threads:
+        t.join(timeout=5.0)
+
+    return len(calls), handlers
+
+
+def test_concurrent_requests_connect_once(client, monkeypatch):
+    handler = _FakeHandler("seq")
+
+    ncalls, handlers = _request_concurrently(client, monkeypatch, handler)
+
+    assert ncalls == 1
+    assert all(h is handler for h in handlers)
+    assert client._pending_handlers == {}
+
+
+def test_concurrent_requests_share_an_evicted_handler(client, monkeypatch):
+    def _cache_and_evict(self, cache, key, handler):
+        # As if concurrent insertions evicted the handler right away
+        cache[key] = handler
+        del cache[key]
+
+    monkeypatch.setattr(MosaicoClient, "_cache_handler", _cache_and_evict)
+    handler = _FakeHandler("seq")
+
+    ncalls, handlers = _request_concurrently(client, monkeypatch, handler)
+
+    assert ncalls == 1
+    assert all(h is handler for h in handlers)
+
+
+def test_concurrent_requests_share_a_failed_connect(client, monkeypatch):
+    ncalls, handlers = _request_concurrently(client, monkeypatch, None)
+
+    assert ncalls == 1
+    assert handlers == [None] * len(handlers)
+    assert client._pending_handlers == {}
+
+    # A later request tries again
+    monkeypatch.setattr(
+        mosaico_client.SequenceHandler,
+        "connect",
+        lambda sequence_name, client: _FakeHandler(sequence_name),
+    )
+    assert client.sequence_handler("seq") is not None
+
+
+def test_raising_connect_releases_the_waiters(client, monkeypatch):
+    def _connect(sequence_name, client):
+        raise ConnectionError("unreachable")
+
+    monkeypatch.setattr(mosaico_client.SequenceHandler, "connect", _connect)
+
+    with pytest.raises(ConnectionError):
+        client.sequence_handler("seq")
+    assert client._pending_handlers == {}
@@ -0,0 +1,69 @@
+"""
+In-memory fakes of the Flight stream objects, shared by the handlers tests.
+"""
+
+import threading
+from typing import Any, Iterable, List, Optional
+
+import pyarrow as pa
+
+
+class FakeChunk:
+    """Stands in for a `fl.FlightStreamChunk` (only its `data` batch is read)."""
+
+    def __init__(self, data: Optional[pa.RecordBatch]):
+        self.data = data
+
+
+class FakeFlightReader:
+    """
+    Minimal stand-in for `fl.FlightStreamReader`, serving in-memory chunks.
+
+    After the chunks, `read_chunk` raises `error` if given, `StopIteration`
+    otherwise. The reads and the cancellation are recorded.
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[Any],
+        schema: Any = None,
+        error: Optional[Exception] = None,
+    ):
+        self._chunks: List[Any] = list(chunks)
+        self._error = error
+        self.schema = schema
+        self.read_calls = 0
+        self.cancelled = threading.Event()
+
+    @classmethod
+    def of_batches(
+        cls, batches: Iterable[Optional[pa.RecordBatch]]
+    ) -> "FakeFlightReader":
+        """A reader of the given batches (None for a chunk without data)."""
+        chunks = [FakeChunk(batch) for batch in batches]
+        schema = next(c.data.schema for c in chunks if c.data is not None)
+        return cls(chunks, schema=schema)
+
+    def read_chunk(self) -> Any:
+        self.read_calls += 1
+        if self._chunks:
+            return self._chunks.pop(0)
+        if self._error is not None:
+            raise self._error
+        raise StopIteration
+
+    def cancel(self):
+        self.cancelled.set()
+
+
+def make_batch(
+    timestamps: List[int], column: Optional[str] = None, scale: float = 1.0
+) -> pa.RecordBatch:
+    """
+    A batch of `timestamp_ns` (int64) and, if `column` is given, a float64
+    column holding `scale * timestamp` for each row.
+    """
+    data = {"timestamp_ns": pa.array(timestamps, type=pa.int64())}
+    if column is not None:
+        data[column] = pa.array([ts * scale for ts in timestamps], type=pa.float64())
+    return pa.RecordBatch.from_pydict(data)
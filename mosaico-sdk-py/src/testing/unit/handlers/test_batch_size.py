@@ -8,7 +8,16 @@ accurate size estimation within Flight transmission safety margins.
 import pyarrow as pa
 import pyarrow.ipc as pa_ipc
 
-from mosaicolabs.comm.connection import PYARROW_OUT_OF_RANGE_BYTES
+from mosaicolabs.comm.connection import (
+    DEFAULT_MAX_BATCH_BYTES,
+    DEFAULT_MAX_BATCH_SIZE_RECORDS,
+    PYARROW_OUT_OF_RANGE_BYTES,
+    _estimated_ipc_size,
+    _serialized_ipc_size,
+)
+from mosaicolabs.handlers.internal.topic_write_state import _TopicWriteState
+from mosaicolabs.models.message import Message
+from mosaicolabs.models.sensors.image import Image, ImageFormat
 
 
 def test_batch_size_respects_flight_limits():
@@ -39,3 +48,185 @@ def test_batch_size_respects_flight_limits():
     assert overhead < safety_margin, (
         f"Schema overhead ({overhead} bytes) exceeds safety margin ({safety_margin} bytes)"
     )
+
+
+def test_estimated_ipc_size_bounds_actual_stream_size():
+    """
+    Verify that `_estimated_ipc_size` never over-estimates the batch message,
+    and that the stream-overhead variant upper-bounds the whole IPC stream.
+    """
+    batch = pa.RecordBatch.from_pydict(
+        {
+            "timestamp_ns": pa.array(range(1000), type=pa.int64()),
+            "data": [b"x" * 128] * 1000,
+        }
+    )
+
+    sink = pa.BufferOutputStream()
+    writer = pa.ipc.new_stream(sink, batch.schema)
+    writer.write_batch(batch)
+    writer.close()
+    actual = sink.getvalue().size
+
+    assert _estimated_ipc_size(batch) <= actual
+    assert _estimated_ipc_size(batch, include_stream_overhead=True) >= actual
+
+
+def test_record_batch_size_covers_stream_without_schema_header():
+    """
+    Verify that `get_record_batch_size` accounts for the whole stream except
+    the schema message (and the end-of-stream marker).
+    """
+    batch = pa.RecordBatch.from_pydict(
+        {
+            "timestamp_ns": pa.array(range(100), type=pa.int64()),
+            "data": [b"x" * 4096] * 100,
+        }
+    )
+
+    # Schema message + end-of-stream marker, without any batch
+    header_sink = pa.BufferOutputStream()
+    pa.ipc.new_stream(header_sink, batch.schema).close()
+    header = header_sink.getvalue().size
+
+    sink = pa.BufferOutputStream()
+    writer = pa.ipc.new_stream(sink, batch.schema)
+    writer.write_batch(batch)
+    writer.close()
+    actual = sink.getvalue().size
+
+    assert pa_ipc.get_record_batch_size(batch) >= actual - header
+
+
+def test_estimated_record_sizes_bound_actual_batch_size():
+    """
+    Verify that the per-record sizes used in Bytes mode (measured for the first
+    record, estimated from the Python objects afterwards) add up to at least
+    the actual size of the batch of those records.
+    """
+    wstate = _TopicWriteState(
+        topic_name="/camera",
+        ontology_tag=Image.ontology_tag(),
+        writer=object(),  # never written to: only used as a non-None placeholder
+        max_batch_size_bytes=DEFAULT_MAX_BATCH_BYTES,
+        max_batch_size_records=DEFAULT_MAX_BATCH_SIZE_RECORDS,
+    )
+    msgs = [
+        Message(
+            timestamp_ns=i,
+            data=Image(
+                data=b"x" * (1000 + 100 * i),
+                format=ImageFormat.RAW,
+                width=10,
+                height=10,
+                stride=10,
+                encoding="mono8",
+            ),
+        )
+        for i in range(20)
+    ]
+
+    estimated = sum(wstate._get_record_size(msg) for msg in msgs)
+    actual = pa_ipc.get_record_batch_size(wstate._get_record_batch(msgs))
+
+    assert wstate._per_row_overhead is not None
+    assert estimated >= actual
+
+
+def test_serialized_ipc_size_matches_stream_size():
+    """
+    Verify that the counting sink measures exactly the bytes of the stream.
+    """
+    batch = pa.RecordBatch.from_pydict({"data": [b"x" * 1000, b"y" * 10]})
+
+    sink = pa.BufferOutputStream()
+    writer = pa.ipc.new_stream(sink, batch.schema)
+    writer.write_batch(batch)
+    writer.close()
+
+    assert _serialized_ipc_size(batch) == sink.getvalue().size
+
+
+class _RecordingWriter:
+    """Minimal stand-in for `fl.FlightStreamWriter`, keeping the written batches."""
+
+    def __init__(self):
+        self.batches = []
+
+    def write(self, batch):
+        self.batches.append(batch)
+
+    def done_writing(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def _image_write_state(writer, max_batch_size_bytes=DEFAULT_MAX_BATCH_BYTES):
+    return _TopicWriteState(
+        topic_name="/camera",
+        ontology_tag=Image.ontology_tag(),
+        writer=writer,
+        max_batch_size_bytes=max_batch_size_bytes,
+        max_batch_size_records=DEFAULT_MAX_BATCH_SIZE_RECORDS,
+    )
+
+
+def _image_messages(n, size=100):
+    return [
+        Message(
+            timestamp_ns=i,
+            data=Image(
+                data=bytes([i]) * size,
+                format=ImageFormat.RAW,
+                width=10,
+                height=10,
+                stride=10,
+                encoding="mono8",
+            ),
+        )
+        for i in range(n)
+    ]
+
+
+def test_measured_record_batch_is_reused_on_flush():
+    """
+    Verify that the single-row batch built to measure the first record is
+    merged, in push order, with the column-buffered records of the flush.
+    """
+    writer = _RecordingWriter()
+    wstate = _image_write_state(writer)
+    msgs = _image_messages(5)
+
+    for msg in msgs:
+        wstate.push_record(msg)
+    expected = wstate._get_record_batch(msgs)
+    wstate.close()
+
+    assert len(writer.batches) == 1
+    assert writer.batches[0].equals(expected)
+
+
+def test_push_records_flushes_as_single_pushes():
+    """
+    Verify that pushing a burst of records writes the same batches, at the
+    same thresholds, as pushing them one by one.
+    """
+    msgs = _image_messages(20, size=1000)
+
+    single_writer, burst_writer = _RecordingWriter(), _RecordingWriter()
+    single = _image_write_state(single_writer, max_batch_size_bytes=5000)
+    burst = _image_write_state(burst_writer, max_batch_size_bytes=5000)
+
+    for msg in msgs:
+        single.push_record(msg)
+    single.close()
+    burst.push_records(iter(msgs))
+    burst.close()
+
+    assert len(burst_writer.batches) > 1
+    assert len(burst_writer.batches) == len(single_writer.batches)
+    for got, expected in zip(burst_writer.batches, single_writer.batches):
+        assert got.equals(expected)
+    assert burst._pushed_records == len(msgs)
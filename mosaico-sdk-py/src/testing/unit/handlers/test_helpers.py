@@ -0,0 +1,45 @@
+"""
+Unit tests for the handlers helpers.
+
+Validates that `_validate_sequence_name` accepts single-component names,
+tolerating leading and trailing separators and '.' components, and rejects
+inner separators.
+"""
+
+import pytest
+
+from mosaicolabs.handlers.helpers import _validate_sequence_name
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "seq",
+        "/seq",
+        "seq/",
+        "/seq/",
+        "seq//",
+        "///seq",
+        # Rejected by the former `pathlib` check (POSIX keeps a '//' root)
+        "//seq",
+        "seq.v2",
+        " a b ",
+        "",
+        "/",
+        ".",
+        "./seq",
+        "seq/.",
+        "seq/./",
+        "/./seq/./",
+    ],
+)
+def test_single_component_names_are_accepted(name):
+    _validate_sequence_name(name)
+
+
+@pytest.mark.parametrize(
+    "name", ["a/b", "/a/b", "a//b", "a/b/", "/a/b/c/", "a/./b", "../a", "a/..", ".a/b"]
+)
+def test_inner_separators_are_rejected(name):
+    with pytest.raises(ValueError, match="Invalid characters"):
+        _validate_sequence_name(name)
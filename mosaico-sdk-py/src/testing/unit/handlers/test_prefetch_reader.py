@@ -0,0 +1,78 @@
+"""
+Tests for the read-ahead of `_PrefetchReader`.
+
+Validates that the chunks, the end of the stream and the read errors reach the
+consumer in stream order, and that a cancellation stops the prefetch thread.
+"""
+
+import gc
+import weakref
+
+import pytest
+
+from mosaicolabs.handlers.internal.prefetch_reader import _PrefetchReader
+
+from .flight_fakes import FakeFlightReader
+
+
+class _EndlessReader(FakeFlightReader):
+    """Never reaches the end of the stream, until cancelled."""
+
+    def read_chunk(self):
+        if self.cancelled.is_set():
+            raise RuntimeError("cancelled")
+        return "chunk"
+
+
+def test_chunks_then_end_of_stream_in_order():
+    reader = _PrefetchReader(
+        FakeFlightReader(["a", "b", "c"], schema="schema"), depth=2
+    )
+
+    assert reader.schema == "schema"
+    assert [reader.read_chunk() for _ in range(3)] == ["a", "b", "c"]
+    with pytest.raises(StopIteration):
+        reader.read_chunk()
+    # Stays at the end of the stream
+    with pytest.raises(StopIteration):
+        reader.read_chunk()
+
+
+def test_read_error_is_raised_after_the_chunks_read_before():
+    error = ValueError("broken stream")
+    reader = _PrefetchReader(FakeFlightReader(["a"], error=error), depth=1)
+
+    assert reader.read_chunk() == "a"
+    with pytest.raises(ValueError, match="broken stream"):
+        reader.read_chunk()
+
+
+def test_cancel_stops_the_prefetch_thread():
+    wrapped = _EndlessReader([])
+    reader = _PrefetchReader(wrapped, depth=1)
+    assert reader.read_chunk() == "chunk"
+
+    # The thread is blocked on the full queue here
+    reader.cancel()
+
+    assert wrapped.cancelled.is_set()
+    assert not reader._thread.is_alive()
+    with pytest.raises(StopIteration):
+        reader.read_chunk()
+
+
+def test_dropped_reader_stops_the_prefetch_thread():
+    wrapped = _EndlessReader([])
+    reader = _PrefetchReader(wrapped, depth=1)
+    assert reader.read_chunk() == "chunk"
+    thread = reader._thread
+
+    # Dropped without `cancel()`: the thread must not keep the reader alive
+    ref = weakref.ref(reader)
+    del reader
+    gc.collect()
+    thread.join(timeout=1.0)
+
+    assert ref() is None
+    assert wrapped.cancelled.is_set()
+    assert not thread.is_alive()
@@ -0,0 +1,78 @@
+"""
+Tests for the k-way merge of `SequenceDataStreamer`.
+
+Validates that the records of the topics are yielded in timestamp order (the
+first topic first on ties), across batch boundaries and exhausted topics.
+"""
+
+from mosaicolabs.handlers.internal.topic_read_state import _TopicReadState
+from mosaicolabs.handlers.sequence_reader import SequenceDataStreamer
+from mosaicolabs.handlers.topic_reader import TopicDataStreamer
+
+from .flight_fakes import FakeFlightReader, make_batch
+
+
+def _streamer(topics):
+    """Merges the topics, given as `{name: [batch timestamps, ...]}`."""
+    readers = {}
+    for name, batches in topics.items():
+        rdstate = _TopicReadState(
+            name, "tag", FakeFlightReader.of_batches(map(make_batch, batches))
+        )
+        rdstate.message_builder = lambda row: row["timestamp_ns"]
+        readers[name] = TopicDataStreamer(None, rdstate)
+    return SequenceDataStreamer("sequence", None, readers)
+
+
+def test_records_are_merged_in_timestamp_order():
+    streamer = _streamer(
+        {
+            "/a": [[1, 4], [6, 9]],
+            "/b": [[2], [3, 7, 8]],
+            "/c": [[5], [10]],
+        }
+    )
+
+    assert list(streamer) == [
+        ("/a", 1),
+        ("/b", 2),
+        ("/b", 3),
+        ("/a", 4),
+        ("/c", 5),
+        ("/a", 6),
+        ("/b", 7),
+        ("/b", 8),
+        ("/a", 9),
+        ("/c", 10),
+    ]
+
+
+def test_ties_are_broken_by_topic_order():
+    streamer = _streamer({"/b": [[1, 2]], "/a": [[1], [2]]})
+
+    assert list(streamer) == [("/b", 1), ("/a", 1), ("/b", 2), ("/a", 2)]
+
+
+def test_empty_topics_are_skipped():
+    streamer = _streamer({"/empty": [[]], "/a": [[1, 2]]})
+
+    assert list(streamer) == [("/a", 1), ("/a", 2)]
+
+
+def test_all_topics_empty():
+    streamer = _streamer({"/a": [[]], "/b": [[]]})
+
+    assert streamer.next_timestamp() is None
+    assert streamer.next() is None
+
+
+def test_next_timestamp_does_not_consume():
+    streamer = _streamer({"/a": [[3]], "/b": [[2]]})
+
+    assert streamer.next_timestamp() == 2
+    assert streamer.next_timestamp() == 2
+    assert streamer.next() == ("/b", 2)
+    assert streamer.next_timestamp() == 3
+    assert streamer.next() == ("/a", 3)
+    assert streamer.next_timestamp() is None
+    assert streamer.next() is None
@@ -0,0 +1,160 @@
+"""
+Tests for the concurrent topic operations of `SequenceWriter`.
+
+Validates that `topic_create_many` creates the topics concurrently (up to its
+bound), returning the writers in input order, with None for the failed and
+repeated topics; and that `_close_topics` finalizes all the topics concurrently,
+raising the error of the first failed topic.
+"""
+
+import threading
+import time
+
+import pytest
+
+from mosaicolabs.enum import OnErrorPolicy
+from mosaicolabs.handlers import sequence_writer
+from mosaicolabs.handlers.config import WriterConfig
+from mosaicolabs.handlers.sequence_writer import SequenceWriter
+
+
+def _writer() -> SequenceWriter:
+    writer = SequenceWriter(
+        sequence_name="sequence",
+        client=None,
+        connection_pool=None,
+        executor_pool=None,
+        metadata={},
+        config=WriterConfig(on_error=OnErrorPolicy.Delete),
+    )
+    # Skip the SEQUENCE_CREATE of `__enter__`
+    writer._entered = True
+    return writer
+
+
+def _topics(*names):
+    return [(name, {}, object) for name in names]
+
+
+def test_topics_are_created_concurrently_in_input_order(monkeypatch):
+    names = ["/a", "/b", "/failed", "/c"]
+    # Every creation waits for all the others: they must run concurrently
+    barrier = threading.Barrier(len(names), timeout=5.0)
+
+    def _topic_create(self, topic_name, metadata, ontology_type):
+        barrier.wait()
+        return None if topic_name == "/failed" else f"writer{topic_name}"
+
+    monkeypatch.setattr(SequenceWriter, "topic_create", _topic_create)
+
+    assert _writer().topic_create_many(_topics(*names)) == [
+        "writer/a",
+        "writer/b",
+        None,
+        "writer/c",
+    ]
+
+
+def test_repeated_topics_are_created_once(monkeypatch):
+    created = []
+
+    def _topic_create(self, topic_name, metadata, ontology_type):
+        created.append(topic_name)
+        return f"writer{topic_name}"
+
+    monkeypatch.setattr(SequenceWriter, "topic_create", _topic_create)
+
+    writers = _writer().topic_create_many(_topics("/a", "/b", "/a"))
+
+    assert writers == ["writer/a", "writer/b", None]
+    assert sorted(created) == ["/a", "/b"]
+
+
+def test_concurrent_creations_are_bounded(monkeypatch):
+    monkeypatch.setattr(sequence_writer, "_MAX_CONCURRENT_TOPIC_CREATE", 2)
+    lock = threading.Lock()
+    active, peak = 0, 0
+
+    def _topic_create(self, topic_name, metadata, ontology_type):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.01)
+        with lock:
+            active -= 1
+        return topic_name
+
+    monkeypatch.setattr(SequenceWriter, "topic_create", _topic_create)
+
+    names = [f"/t{i}" for i in range(8)]
+    assert _writer().topic_create_many(_topics(*names)) == names
+    assert peak <= 2
+
+
+def test_no_topics():
+    assert _writer().topic_create_many([]) == []
+
+
+def test_creation_requires_the_with_block():
+    writer = _writer()
+    writer._entered = False
+
+    with pytest.raises(RuntimeError):
+        writer.topic_create_many(_topics("/a"))
+
+
+class _FakeTopicWriter:
+    """Stands in for a `TopicWriter`, recording its finalization."""
+
+    def __init__(self, barrier=None, error=None):
+        self._barrier = barrier
+        self._error = error
+        self.finalized_with_error = None
+
+    def finalize(self, with_error: bool):
+        if self._barrier is not None:
+            self._barrier.wait()
+        self.finalized_with_error = with_error
+        if self._error is not None:
+            raise self._error
+
+
+def test_topics_are_finalized_concurrently():
+    barrier = threading.Barrier(3, timeout=5.0)
+    twriters = {f"/t{i}": _FakeTopicWriter(barrier) for i in range(3)}
+    writer = _writer()
+    writer._topic_writers = dict(twriters)
+
+    writer._close_topics(with_error=True)
+
+    assert all(tw.finalized_with_error is True for tw in twriters.values())
+    assert writer._topic_writers == {}
+
+
+def test_first_topic_error_is_raised_after_all_finalizations():
+    twriters = {
+        "/ok": _FakeTopicWriter(),
+        "/first": _FakeTopicWriter(error=ValueError("first failure")),
+        "/second": _FakeTopicWriter(error=ValueError("second failure")),
+        "/last": _FakeTopicWriter(),
+    }
+    writer = _writer()
+    writer._topic_writers = dict(twriters)
+
+    with pytest.raises(Exception, match=r"2 topic\(s\)") as exc_info:
+        writer._close_topics(with_error=False)
+
+    assert "first failure" in str(exc_info.value)
+    assert "second failure" not in str(exc_info.value)
+    # A failure does not prevent the other topics from being finalized
+    assert all(tw.finalized_with_error is False for tw in twriters.values())
+    assert writer._topic_writers == {}
+
+
+def test_no_topics_to_finalize():
+    writer = _writer()
+
+    writer._close_topics(with_error=False)
+
+    assert writer._topic_writers == {}
@@ -0,0 +1,63 @@
+"""
+Tests for the row iteration of `_TopicReadState`.
+
+Validates that the rows are handed out as plain Python values (converted once
+per batch, with no per-scalar `as_py()`), in stream order across batches.
+"""
+
+from mosaicolabs.handlers.internal.topic_read_state import _TopicReadState
+
+from .flight_fakes import FakeFlightReader, make_batch
+
+
+def test_rows_are_python_dicts_in_stream_order():
+    reader = FakeFlightReader.of_batches(
+        [make_batch([1, 2], "value"), make_batch([5], "value")]
+    )
+    rdstate = _TopicReadState("/topic", "tag", reader)
+
+    assert rdstate.peek_next_row()
+    rows = []
+    while rdstate.peeked_index is not None:
+        rows.append(rdstate.pop_peeked_row())
+
+    assert rows == [
+        {"timestamp_ns": 1, "value": 1.0},
+        {"timestamp_ns": 2, "value": 2.0},
+        {"timestamp_ns": 5, "value": 5.0},
+    ]
+    assert all(type(row["value"]) is float for row in rows)
+    assert rdstate.peeked_timestamp == float("inf")
+
+
+def test_drained_stream_does_not_hit_the_reader():
+    reader = FakeFlightReader.of_batches([make_batch([1], "value")])
+    rdstate = _TopicReadState("/topic", "tag", reader)
+
+    assert rdstate.peek_next_row()
+    rdstate.pop_peeked_row()
+    calls = reader.read_calls
+
+    assert not rdstate.peek_next_row()
+    assert not rdstate.peek_next_row()
+    assert reader.read_calls == calls
+
+
+def test_empty_chunks_do_not_end_the_stream():
+    reader = FakeFlightReader.of_batches(
+        [
+            make_batch([1], "value"),
+            make_batch([], "value"),
+            None,
+            make_batch([7, 8], "value"),
+        ]
+    )
+    rdstate = _TopicReadState("/topic", "tag", reader)
+
+    assert rdstate.peek_next_row()
+    timestamps = []
+    while rdstate.peeked_index is not None:
+        timestamps.append(rdstate.pop_peeked_row()["timestamp_ns"])
+
+    assert timestamps == [1, 7, 8]
+    assert not rdstate.peek_next_row()
@@ -0,0 +1,93 @@
+"""
+Tests for the opening of a `TopicDataStreamer`.
+
+Validates that the stream yields the messages of the topic ontology, that the
+batch size hint reaches the `DoGet` call, and that a failed opening does not
+leak the stream nor its prefetch thread.
+"""
+
+import threading
+from types import SimpleNamespace
+
+import pyarrow.flight as fl
+import pytest
+
+from mosaicolabs.handlers.topic_reader import TopicDataStreamer
+from mosaicolabs.models.data import Floating64
+
+from .flight_fakes import FakeFlightReader, make_batch
+
+
+class _FakeClient:
+    def __init__(self, reader):
+        self.reader = reader
+        self.options = None
+
+    def do_get(self, ticket, options=None):
+        self.options = options
+        return self.reader
+
+
+def _metadata(ontology_tag):
+    return SimpleNamespace(properties=SimpleNamespace(ontology_tag=ontology_tag))
+
+
+_TICKET = fl.Ticket(b"sequence/topic")
+
+
+def _prefetch_threads():
+    return [t for t in threading.enumerate() if t.name == "mosaico-prefetch"]
+
+
+@pytest.mark.parametrize("prefetch_depth", [0, 2])
+def test_streams_the_topic_messages(prefetch_depth):
+    client = _FakeClient(
+        FakeFlightReader.of_batches(
+            [make_batch([1, 2], "data", 0.5), make_batch([3], "data", 0.5)]
+        )
+    )
+    streamer = TopicDataStreamer.connect(
+        client,
+        _TICKET,
+        metadata=_metadata(Floating64.ontology_tag()),
+        prefetch_depth=prefetch_depth,
+    )
+
+    msgs = list(streamer)
+    streamer.close()
+
+    assert [msg.timestamp_ns for msg in msgs] == [1, 2, 3]
+    assert [msg.get_data(Floating64).data for msg in msgs] == [0.5, 1.0, 1.5]
+    assert client.options is None
+
+
+def test_max_batch_rows_is_sent_as_header():
+    client = _FakeClient(FakeFlightReader.of_batches([make_batch([1], "data", 0.5)]))
+    TopicDataStreamer.connect(
+        client,
+        _TICKET,
+        metadata=_metadata(Floating64.ontology_tag()),
+        max_batch_rows=512,
+    ).close()
+
+    assert (b"mosaico-max-batch-rows", b"512") in client.options.headers
+
+    with pytest.raises(ValueError):
+        TopicDataStreamer.connect(client, _TICKET, max_batch_rows=0)
+
+
+@pytest.mark.parametrize("prefetch_depth", [0, 2])
+def test_failed_opening_cancels_the_stream(prefetch_depth):
+    reader = FakeFlightReader.of_batches([make_batch([1], "data", 0.5)])
+    threads_before = len(_prefetch_threads())
+
+    with pytest.raises(ValueError, match="No ontology registered"):
+        TopicDataStreamer.connect(
+            _FakeClient(reader),
+            _TICKET,
+            metadata=_metadata("not_a_registered_tag"),
+            prefetch_depth=prefetch_depth,
+        )
+
+    assert reader.cancelled.is_set()
+    assert len(_prefetch_threads()) == threads_before
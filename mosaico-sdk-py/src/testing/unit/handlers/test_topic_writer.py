@@ -0,0 +1,50 @@
+"""
+Tests for the `DoPut` call options of `TopicWriter`.
+
+Validates that the batches written with the compressed options round-trip
+through an (in-process) Flight server.
+"""
+
+import pyarrow as pa
+import pyarrow.flight as fl
+
+from mosaicolabs.handlers.topic_writer import (
+    _COMPRESSED_DO_PUT_OPTIONS,
+    _DO_PUT_OPTIONS,
+)
+
+
+class _RecordingServer(fl.FlightServerBase):
+    """Keeps the tables uploaded by `DoPut`."""
+
+    def __init__(self):
+        super().__init__("grpc://127.0.0.1:0")
+        self.tables = []
+
+    def do_put(self, context, descriptor, reader, writer):
+        self.tables.append(reader.read_all())
+
+
+def test_compressed_batches_round_trip():
+    batch = pa.RecordBatch.from_pydict(
+        {
+            "timestamp_ns": pa.array(range(1000), type=pa.int64()),
+            "data": [b"\x00" * 256] * 1000,
+        }
+    )
+
+    with _RecordingServer() as server:
+        client = fl.connect(f"grpc://127.0.0.1:{server.port}")
+        for options in (_DO_PUT_OPTIONS, _COMPRESSED_DO_PUT_OPTIONS):
+            writer, _ = client.do_put(
+                fl.FlightDescriptor.for_command(b"topic"),
+                batch.schema,
+                options=options,
+            )
+            writer.write_batch(batch)
+            writer.close()
+        client.close()
+
+    assert len(server.tables) == 2
+    for table in server.tables:
+        assert table.equals(pa.Table.from_batches([batch]))
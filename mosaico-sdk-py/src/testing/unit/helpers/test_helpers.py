@@ -0,0 +1,102 @@
+"""
+Unit tests for the generic helpers.
+
+Validates that `unflatten_dict` decodes the values as `ast.literal_eval` does,
+falling back to the original string for the non-literals; and that
+`pack_topic_resource_name` normalizes the names as POSIX paths would be.
+"""
+
+import ast
+
+import pytest
+
+from mosaicolabs.helpers.helpers import (
+    flatten_dict,
+    pack_topic_resource_name,
+    unflatten_dict,
+)
+
+
+def _literal_eval_or_str(value):
+    """The decoding `unflatten_dict` must match."""
+    try:
+        return ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return value
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        # Constants, ints and floats (the fast paths)
+        "None",
+        "True",
+        "False",
+        "0",
+        "-0",
+        "42",
+        "-17",
+        "1.5",
+        "-2.",
+        "1e5",
+        "2.5E-3",
+        # Not decoded by the fast paths
+        "007",
+        "1_000",
+        ".5",
+        "+3",
+        "nan",
+        "inf",
+        "sensor_a",
+        "none",
+        # Containers, strings and non-literals
+        "[1, 2]",
+        "{'a': None}",
+        "(1,)",
+        "'quoted'",
+        "hello world",
+        "",
+        "-",
+        "1.2.3",
+    ],
+)
+def test_values_are_decoded_as_literal_eval(value):
+    decoded = unflatten_dict({"key": value})["key"]
+    expected = _literal_eval_or_str(value)
+
+    assert decoded == expected
+    assert type(decoded) is type(expected)
+
+
+def test_non_string_values_are_kept():
+    marker = object()
+
+    assert unflatten_dict({"a": 1, "b": marker}) == {"a": 1, "b": marker}
+
+
+def test_nested_keys_round_trip():
+    nested = {"a": {"b": 1, "c": {"d": None}}, "e": [1.5, "x"], "f": "text"}
+
+    assert unflatten_dict(flatten_dict(nested)) == nested
+
+
+def test_empty_dict():
+    assert unflatten_dict({}) == {}
+
+
+@pytest.mark.parametrize(
+    "sequence_name, topic_name, expected",
+    [
+        ("seq", "topic", "seq/topic"),
+        ("/seq", "/topic", "seq/topic"),
+        ("seq/", "topic/", "seq/topic"),
+        ("seq", "/a/b/c", "seq/a/b/c"),
+        ("seq", "a//b", "seq/a/b"),
+        ("seq", "./a/./b", "seq/a/b"),
+        # '..' is kept, as by `pathlib`
+        ("seq", "a/../b", "seq/a/../b"),
+        ("seq", "camera.front", "seq/camera.front"),
+    ],
+)
+def test_topic_resource_name_is_normalized(sequence_name, topic_name, expected):
+    assert pack_topic_resource_name(sequence_name, topic_name) == expected
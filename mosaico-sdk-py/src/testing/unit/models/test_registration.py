@@ -1,3 +1,7 @@
+import subprocess
+import sys
+from pathlib import Path
+
 import pydantic
 import pytest
 
@@ -46,3 +50,20 @@ def test_message_generation():
     ):
         # This must fail: Unregistered type cannot be sent to mosaico
         Message(timestamp_ns=0, data=UnregisteredSensor(field=0))  # type: ignore (disable pylance complaining)
+
+
+def test_client_import_registers_builtin_ontologies():
+    # Fresh interpreter: this test session has imported the models already
+    code = (
+        "from mosaicolabs import MosaicoClient\n"
+        "from mosaicolabs.models.serializable import Serializable\n"
+        "assert Serializable.is_registered('imu')\n"
+        "assert Serializable.is_registered('unsigned8')\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).parents[3],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
@@ -14,6 +14,7 @@ pub async fn do_get(
     repo: repo::Repository,
     ts_engine: query::TimeseriesGwRef,
     ticket: Ticket,
+    max_batch_rows: Option<usize>,
 ) -> Result<FlightDataEncoder, ServerError> {
     let ticket = String::from_utf8(ticket.ticket.to_vec())
         .map_err(|e| ServerError::BadTicket(e.to_string()))?;
@@ -29,8 +30,12 @@ pub async fn do_get(
 
     trace!("{:?}", metadata);
 
-    // Compute optimal batch size from database statistics
-    let batch_size = compute_optimal_batch_size(&tfacade).await?;
+    // Use the batch size requested by the client, if any, otherwise compute the
+    // optimal one from database statistics
+    let batch_size = match max_batch_rows {
+        Some(rows) => Some(rows),
+        None => compute_optimal_batch_size(&tfacade).await?,
+    };
 
     let query_result = ts_engine
         .read(
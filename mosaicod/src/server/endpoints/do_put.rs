@@ -195,3 +195,52 @@ async fn on_chunk_created(
 
     Ok(())
 }
+
+#[cfg(test)]
+mod tests {
+    use std::sync::Arc;
+
+    use arrow::array::Int64Array;
+    use arrow::datatypes::{DataType, Field, Schema};
+    use arrow::ipc::CompressionType;
+    use arrow::ipc::writer::IpcWriteOptions;
+    use arrow::record_batch::RecordBatch;
+    use arrow_flight::encode::FlightDataEncoderBuilder;
+    use futures::TryStreamExt;
+
+    use super::*;
+
+    /// Batches uploaded with LZ4 frame compressed bodies (the SDK
+    /// `enable_compression` option) must be decoded: this requires the
+    /// `ipc_compression` feature of arrow
+    #[tokio::test]
+    async fn decodes_lz4_compressed_batches() {
+        let schema = Arc::new(Schema::new(vec![Field::new(
+            "timestamp_ns",
+            DataType::Int64,
+            false,
+        )]));
+        let batch = RecordBatch::try_new(
+            schema,
+            vec![Arc::new(Int64Array::from_iter_values(0..1024))],
+        )
+        .unwrap();
+
+        let options = IpcWriteOptions::default()
+            .try_with_compression(Some(CompressionType::LZ4_FRAME))
+            .expect("LZ4 IPC compression not available");
+        let encoded = FlightDataEncoderBuilder::new()
+            .with_options(options)
+            .build(futures::stream::iter([Ok(batch.clone())]));
+
+        let mut decoder = FlightDataDecoder::new(encoded);
+        let mut decoded = Vec::new();
+        while let Some(data) = decoder.try_next().await.unwrap() {
+            if let DecodedPayload::RecordBatch(b) = data.payload {
+                decoded.push(b);
+            }
+        }
+
+        assert_eq!(decoded, vec![batch]);
+    }
+}
@@ -20,6 +20,27 @@ use tonic::{Request, Response, Status, Streaming};
 /// To trigger the server shutdown use [`notify_waiters()`] function.
 pub type ShutdownNotifier = Arc<Notify>;
 
+/// Optional `DoGet` request header carrying the max number of rows per batch
+/// requested by the client
+const MAX_BATCH_ROWS_HEADER: &str = "mosaico-max-batch-rows";
+
+/// Upper bound of the batch size a client can request with
+/// [`MAX_BATCH_ROWS_HEADER`], bounding the memory of each batch
+const MAX_CLIENT_BATCH_ROWS: usize = 1 << 20;
+
+/// Reads the max number of rows per batch requested by a client, if any.
+///
+/// Malformed (or zero) values are ignored, letting the server pick the batch
+/// size; larger values than [`MAX_CLIENT_BATCH_ROWS`] are clamped.
+fn requested_max_batch_rows(metadata: &tonic::metadata::MetadataMap) -> Option<usize> {
+    metadata
+        .get(MAX_BATCH_ROWS_HEADER)
+        .and_then(|v| v.to_str().ok())
+        .and_then(|v| v.parse::<usize>().ok())
+        .filter(|n| *n > 0)
+        .map(|n| n.min(MAX_CLIENT_BATCH_ROWS))
+}
+
 pub struct Config {
     pub host: String,
     pub port: u16,
@@ -142,6 +163,8 @@ impl FlightService for MosaicoFlightService {
         &self,
         request: Request<Ticket>,
     ) -> Result<Response<Self::DoGetStream>, Status> {
+        let max_batch_rows = requested_max_batch_rows(request.metadata());
+
         let ticket = request.into_inner();
 
         let data_stream = endpoints::do_get(
@@ -149,6 +172,7 @@ impl FlightService for MosaicoFlightService {
             self.repo.clone(),
             self.ts_engine.clone(),
             ticket,
+            max_batch_rows,
         )
         .await
         .inspect_err(log_server_error)?;
@@ -239,6 +263,45 @@ mod tests {
 
     use super::*;
 
+    fn metadata_with_max_batch_rows(value: &str) -> tonic::metadata::MetadataMap {
+        let mut metadata = tonic::metadata::MetadataMap::new();
+        metadata.insert(MAX_BATCH_ROWS_HEADER, value.parse().unwrap());
+        metadata
+    }
+
+    #[test]
+    fn max_batch_rows_header() {
+        assert_eq!(
+            requested_max_batch_rows(&tonic::metadata::MetadataMap::new()),
+            None
+        );
+        assert_eq!(
+            requested_max_batch_rows(&metadata_with_max_batch_rows("4096")),
+            Some(4096)
+        );
+
+        // Ignored values
+        for value in ["0", "-1", "abc", "1.5", ""] {
+            assert_eq!(
+                requested_max_batch_rows(&metadata_with_max_batch_rows(value)),
+                None,
+                "value: {value:?}"
+            );
+        }
+
+        // Clamped values
+        assert_eq!(
+            requested_max_batch_rows(&metadata_with_max_batch_rows(&usize::MAX.to_string())),
+            Some(MAX_CLIENT_BATCH_ROWS)
+        );
+        assert_eq!(
+            requested_max_batch_rows(&metadata_with_max_batch_rows(
+                &(MAX_CLIENT_BATCH_ROWS + 1).to_string()
+            )),
+            Some(MAX_CLIENT_BATCH_ROWS)
+        );
+    }
+
     #[test]
     fn error_logging() {
         fn my_function() -> Result<(), ServerError> {